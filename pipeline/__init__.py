@@ -7,6 +7,7 @@ from .batch import (
     calculate_cost,
     download_results,
     format_batch_request,
+    format_batch_request_bytes,
     get_batch_status,
     init_state,
     load_state,
@@ -25,6 +26,7 @@ __all__ = [
     "download_results",
     "extract_fields",
     "format_batch_request",
+    "format_batch_request_bytes",
     "get_batch_status",
     "has_valid_body",
     "init_state",
@@ -15,33 +15,206 @@ Usage:
 
 import logging
 import time
-from collections.abc import Iterator
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from utils.constants import (
+    ARCTIC_SHIFT_ACCEPT_ENCODING,
     ARCTIC_SHIFT_BASE_URL,
     ARCTIC_SHIFT_COMMENTS_ENDPOINT,
+    ARCTIC_SHIFT_MAX_RETRIES,
     ARCTIC_SHIFT_PAGE_SIZE,
+    ARCTIC_SHIFT_POOL_CONNECTIONS,
+    ARCTIC_SHIFT_POOL_MAXSIZE,
     ARCTIC_SHIFT_POSTS_ENDPOINT,
     ARCTIC_SHIFT_RATE_LIMIT_BUFFER,
     ARCTIC_SHIFT_REQUEST_DELAY,
+    ARCTIC_SHIFT_RETRY_BACKOFF,
+    ARCTIC_SHIFT_RETRY_JITTER,
+    ARCTIC_SHIFT_RETRY_MAX_BACKOFF,
+    ARCTIC_SHIFT_RETRY_STATUSES,
+    ARCTIC_SHIFT_USER_AGENT,
 )
 
 logger = logging.getLogger(__name__)
 
 
+def build_session() -> requests.Session:
+    """
+    Create a pooled keep-alive session for Arctic Shift requests.
+
+    Connections are reused across pages, so each request skips the DNS, TCP
+    and TLS setup. Transient 429/5xx responses and connection errors are
+    retried at the transport level with capped exponential backoff plus
+    jitter, honouring Retry-After; once retries run out the last response is
+    returned so raise_for_status still surfaces a requests.HTTPError.
+
+    Returns:
+        Configured requests.Session.
+    """
+    retry = Retry(
+        total=ARCTIC_SHIFT_MAX_RETRIES,
+        backoff_factor=ARCTIC_SHIFT_RETRY_BACKOFF,
+        backoff_jitter=ARCTIC_SHIFT_RETRY_JITTER,
+        backoff_max=ARCTIC_SHIFT_RETRY_MAX_BACKOFF,
+        status_forcelist=ARCTIC_SHIFT_RETRY_STATUSES,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=ARCTIC_SHIFT_POOL_CONNECTIONS,
+        pool_maxsize=ARCTIC_SHIFT_POOL_MAXSIZE,
+        max_retries=retry,
+    )
+
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update(
+        {
+            "Accept-Encoding": ARCTIC_SHIFT_ACCEPT_ENCODING,
+            "User-Agent": ARCTIC_SHIFT_USER_AGENT,
+        }
+    )
+    return session
+
+
+@dataclass(frozen=True)
+class PageHeaders:
+    """
+    The response headers pagination needs, parsed once per page.
+
+    Attributes:
+        rate_limit_remaining: X-RateLimit-Remaining, or None if absent.
+        rate_limit_reset: X-RateLimit-Reset as a Unix timestamp, or None if
+            absent or empty.
+        content_encoding: Content-Encoding, or None if uncompressed.
+    """
+
+    rate_limit_remaining: int | None = None
+    rate_limit_reset: int | None = None
+    content_encoding: str | None = None
+
+
+def parse_page_headers(headers: Mapping[str, str]) -> PageHeaders:
+    """
+    Extract rate limit and encoding fields from raw response headers.
+
+    Arctic Shift returns:
+        X-RateLimit-Remaining: requests left in window
+        X-RateLimit-Reset: Unix timestamp when limit resets
+
+    Args:
+        headers: Response headers (case-insensitive mapping from the HTTP
+            library, or a plain dict).
+
+    Returns:
+        Parsed PageHeaders.
+    """
+    remaining = headers.get("X-RateLimit-Remaining")
+    reset = headers.get("X-RateLimit-Reset")
+    return PageHeaders(
+        rate_limit_remaining=int(remaining) if remaining is not None else None,
+        rate_limit_reset=int(reset) if reset else None,
+        content_encoding=headers.get("Content-Encoding"),
+    )
+
+
+def log_content_encoding(subreddit: str, headers: PageHeaders) -> None:
+    """
+    Log which compression the API applied to a subreddit's responses.
+
+    Called once per paginated stream so it is easy to confirm from the logs
+    that pages are arriving compressed.
+
+    Args:
+        subreddit: Subreddit being paginated.
+        headers: Parsed headers of the first page.
+    """
+    encoding = headers.content_encoding or "identity"
+    logger.info(f"{subreddit}: response Content-Encoding={encoding}")
+
+
+def paced_delay_seconds(headers: PageHeaders, streams: int = 1) -> float | None:
+    """
+    Spread the remaining request quota evenly over the rate limit window.
+
+    With plenty of quota left the delay approaches zero, so pages are fetched
+    back to back; as quota drains the delay grows. Concurrent paginators
+    sharing one quota each wait ``streams`` times longer so their combined
+    rate still fits the window.
+
+    Args:
+        headers: Parsed page headers.
+        streams: Number of paginators currently sharing the quota.
+
+    Returns:
+        Seconds to wait before the next request, or None if the response
+        carried no rate limit window (caller falls back to its fixed delay).
+    """
+    remaining = headers.rate_limit_remaining
+    reset_ts = headers.rate_limit_reset
+
+    if remaining is None or reset_ts is None:
+        return None
+
+    window = max(0, reset_ts - time.time())
+    return window * streams / max(1, remaining)
+
+
+def rate_limit_sleep_seconds(headers: PageHeaders, buffer: int) -> int:
+    """
+    Compute how long to back off based on Arctic Shift rate limit headers.
+
+    Shared by the sync and async clients so both throttle identically.
+
+    Args:
+        headers: Parsed page headers.
+        buffer: Back off when remaining requests fall below this.
+
+    Returns:
+        Seconds to sleep, or 0 if the rate limit is healthy or unreported.
+    """
+    remaining = headers.rate_limit_remaining
+
+    if remaining is None:
+        # No rate limit headers - API might not always include them
+        return 0
+
+    if remaining >= buffer:
+        return 0
+
+    reset_ts = headers.rate_limit_reset
+    if reset_ts is not None:
+        sleep_seconds = max(0, reset_ts - int(time.time())) + 1
+    else:
+        # No reset time provided, use conservative sleep
+        sleep_seconds = 60
+
+    logger.warning(
+        f"Rate limit low ({remaining} remaining). "
+        f"Sleeping {sleep_seconds}s until reset."
+    )
+    return sleep_seconds
+
+
 class ArcticShiftClient:
     """
     Client for Arctic Shift Reddit archive API.
 
-    Handles pagination, rate limiting, and connection pooling automatically.
+    Handles pagination, rate limiting, retries, and connection pooling
+    automatically.
     Can be used as a context manager for automatic resource cleanup.
 
     Args:
         base_url: API base URL. Defaults to Arctic Shift public endpoint.
-        delay: Seconds to wait between requests. Defaults to 0.5s.
+        delay: Seconds to wait between requests when the API omits rate limit
+            headers. Defaults to 0.5s. Otherwise requests are paced across
+            the remaining quota (see paced_delay_seconds).
         page_size: Max items per request. Defaults to 100.
         rate_limit_buffer: Sleep when remaining requests fall below this. Defaults to 10.
 
@@ -63,7 +236,7 @@ class ArcticShiftClient:
         self.delay = delay
         self.page_size = page_size
         self.rate_limit_buffer = rate_limit_buffer
-        self.session = requests.Session()
+        self.session = build_session()
 
     def __enter__(self) -> "ArcticShiftClient":
         """Enter context manager."""
@@ -176,18 +349,26 @@ class ArcticShiftClient:
                 # No more items in range
                 break
 
+            if current_after == after:
+                log_content_encoding(subreddit, headers)
+
             yield from items
 
             # Update cursor to last item's timestamp + 1 to avoid refetching
             last_timestamp = items[-1].get("created_utc", current_after)
             current_after = last_timestamp + 1
 
-            # Respect rate limits
-            self._check_rate_limit(headers)
+            # Respect rate limits; after a pause the window has reset
+            if self._check_rate_limit(headers):
+                continue
 
-            # Be nice to the API
-            if self.delay > 0:
-                time.sleep(self.delay)
+            # Pace requests over the remaining quota, or be nice to the API
+            # with the fixed delay when no quota headers were returned
+            delay = paced_delay_seconds(headers)
+            if delay is None:
+                delay = self.delay
+            if delay > 0:
+                time.sleep(delay)
 
     def _fetch_page(
         self,
@@ -195,7 +376,7 @@ class ArcticShiftClient:
         subreddit: str,
         after: int,
         before: int,
-    ) -> tuple[list[dict], dict[str, str]]:
+    ) -> tuple[list[dict], PageHeaders]:
         """
         Fetch a single page from the API.
 
@@ -206,7 +387,7 @@ class ArcticShiftClient:
             before: End timestamp.
 
         Returns:
-            Tuple of (list of item dicts, response headers).
+            Tuple of (list of item dicts, parsed page headers).
 
         Raises:
             requests.HTTPError: If API returns an error status.
@@ -227,9 +408,9 @@ class ArcticShiftClient:
         data = response.json()
         items = data.get("data", [])
 
-        return items, dict(response.headers)
+        return items, parse_page_headers(response.headers)
 
-    def _check_rate_limit(self, headers: dict[str, str]) -> None:
+    def _check_rate_limit(self, headers: PageHeaders) -> bool:
         """
         Check rate limit headers and sleep if necessary.
 
@@ -240,30 +421,15 @@ class ArcticShiftClient:
         Sleeps proactively if remaining drops below buffer threshold.
 
         Args:
-            headers: Response headers dict.
+            headers: Parsed page headers.
+
+        Returns:
+            True if the client slept until the rate limit window reset.
         """
-        remaining_str = headers.get("X-RateLimit-Remaining")
-
-        if remaining_str is None:
-            # No rate limit headers - API might not always include them
-            return
-
-        remaining = int(remaining_str)
-
-        if remaining < self.rate_limit_buffer:
-            reset_time_str = headers.get("X-RateLimit-Reset")
-            if reset_time_str:
-                reset_ts = int(reset_time_str)
-                sleep_seconds = max(0, reset_ts - int(time.time())) + 1
-            else:
-                # No reset time provided, use conservative sleep
-                sleep_seconds = 60
-
-            logger.warning(
-                f"Rate limit low ({remaining} remaining). "
-                f"Sleeping {sleep_seconds}s until reset."
-            )
+        sleep_seconds = rate_limit_sleep_seconds(headers, self.rate_limit_buffer)
+        if sleep_seconds:
             time.sleep(sleep_seconds)
+        return bool(sleep_seconds)
 
     def close(self) -> None:
         """Close the underlying HTTP session."""
@@ -0,0 +1,463 @@
+"""
+Async Arctic Shift API client for concurrent Reddit downloads.
+
+Mirrors ArcticShiftClient on top of aiohttp so several subreddits can be
+paginated concurrently from one event loop. Downloads are network-bound, so
+overlapping the per-request latency across subreddits cuts wall-clock time
+roughly in proportion to the concurrency.
+
+Usage:
+    from pipeline.arctic_shift_async import ArcticShiftAsyncClient
+
+    async with ArcticShiftAsyncClient() as client:
+        async for comment in client.fetch_comments("nba", after=start_ts, before=end_ts):
+            process(comment)
+"""
+
+import asyncio
+import json
+import logging
+import random
+from collections.abc import AsyncIterator
+from types import TracebackType
+from typing import Any, Self
+
+import aiohttp
+import orjson
+
+from pipeline.arctic_shift import (
+    PageHeaders,
+    log_content_encoding,
+    paced_delay_seconds,
+    parse_page_headers,
+    rate_limit_sleep_seconds,
+)
+from utils.constants import (
+    ARCTIC_SHIFT_ACCEPT_ENCODING,
+    ARCTIC_SHIFT_AIMD_DECREASE,
+    ARCTIC_SHIFT_AIMD_INCREASE,
+    ARCTIC_SHIFT_BASE_URL,
+    ARCTIC_SHIFT_COMMENTS_ENDPOINT,
+    ARCTIC_SHIFT_CONNECTION_LIMIT,
+    ARCTIC_SHIFT_KEEPALIVE_TIMEOUT,
+    ARCTIC_SHIFT_MAX_RETRIES,
+    ARCTIC_SHIFT_PAGE_SIZE,
+    ARCTIC_SHIFT_POSTS_ENDPOINT,
+    ARCTIC_SHIFT_RATE_LIMIT_BUFFER,
+    ARCTIC_SHIFT_REQUEST_DELAY,
+    ARCTIC_SHIFT_RETRY_BACKOFF,
+    ARCTIC_SHIFT_RETRY_JITTER,
+    ARCTIC_SHIFT_RETRY_MAX_BACKOFF,
+    ARCTIC_SHIFT_RETRY_STATUSES,
+    ARCTIC_SHIFT_USER_AGENT,
+)
+
+logger = logging.getLogger(__name__)
+
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=60)
+
+
+def retry_delay_seconds(attempt: int, retry_after: str | None = None) -> float:
+    """
+    Compute the wait before retrying a failed request.
+
+    Honours a numeric Retry-After header when the server sends one; otherwise
+    uses exponential backoff with random jitter so concurrent paginators
+    don't retry in lockstep. Mirrors the urllib3 Retry used by the sync client.
+
+    Args:
+        attempt: Zero-based index of the attempt that just failed.
+        retry_after: Value of the response's Retry-After header, if any.
+
+    Returns:
+        Seconds to sleep, capped at ARCTIC_SHIFT_RETRY_MAX_BACKOFF.
+    """
+    if retry_after is not None:
+        try:
+            return min(ARCTIC_SHIFT_RETRY_MAX_BACKOFF, max(0.0, float(retry_after)))
+        except ValueError:
+            # HTTP-date form - fall back to computed backoff
+            pass
+
+    delay = ARCTIC_SHIFT_RETRY_BACKOFF * 2**attempt
+    delay += random.uniform(0, ARCTIC_SHIFT_RETRY_JITTER)
+    return min(ARCTIC_SHIFT_RETRY_MAX_BACKOFF, delay)
+
+
+class AIMDLimiter:
+    """
+    Adaptive cap on concurrent requests (additive increase, multiplicative decrease).
+
+    Acts like an asyncio.Semaphore whose size moves with server pressure:
+    each successful response grows the limit by ``increase`` per window of
+    ``limit`` requests, and each throttled (429/5xx) response multiplies it
+    by ``decrease``. The limit stays within [min_limit, max_limit].
+
+    Args:
+        max_limit: Upper bound (and starting value) for concurrent requests.
+        increase: Additive increase per window of successful requests.
+        decrease: Multiplicative factor applied on a throttled response.
+        min_limit: Lower bound for concurrent requests.
+    """
+
+    def __init__(
+        self,
+        max_limit: int,
+        increase: float = ARCTIC_SHIFT_AIMD_INCREASE,
+        decrease: float = ARCTIC_SHIFT_AIMD_DECREASE,
+        min_limit: int = 1,
+    ) -> None:
+        """Initialize the limiter at its maximum concurrency."""
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.increase = increase
+        self.decrease = decrease
+        self.limit = float(max_limit)
+        self.in_flight = 0
+        self._condition = asyncio.Condition()
+
+    async def __aenter__(self) -> Self:
+        """Wait for a free slot under the current limit."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Release the slot and wake waiters (the limit may have grown)."""
+        async with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    def record_success(self) -> None:
+        """Additive increase after a successful response."""
+        self.limit = min(self.max_limit, self.limit + self.increase / self.limit)
+
+    def record_throttle(self) -> None:
+        """Multiplicative decrease after a 429/5xx response."""
+        self.limit = max(self.min_limit, self.limit * self.decrease)
+
+
+class ArcticShiftAsyncClient:
+    """
+    Async client for Arctic Shift Reddit archive API.
+
+    Same pagination and rate limiting behaviour as ArcticShiftClient, but
+    requests share a pooled aiohttp session. Transient 429/5xx responses and
+    connection errors are retried with backoff. In-flight requests across all
+    paginators are capped by an AIMDLimiter that backs off on 429/5xx, and
+    each paginator's pacing delay accounts for the others sharing the quota.
+    Must be used as an async context manager (or closed with
+    ``await client.close()``).
+
+    Args:
+        base_url: API base URL. Defaults to Arctic Shift public endpoint.
+        delay: Seconds to wait between requests when the API omits rate limit
+            headers. Defaults to 0.5s.
+        page_size: Max items per request. Defaults to 100.
+        rate_limit_buffer: Sleep when remaining requests fall below this. Defaults to 10.
+        connection_limit: Max open connections in the pool, and the AIMD
+            limiter's ceiling. Defaults to 8.
+
+    Example:
+        async with ArcticShiftAsyncClient() as client:
+            async for comment in client.fetch_comments("nba", after=1000, before=2000):
+                print(comment["body"])
+    """
+
+    def __init__(
+        self,
+        base_url: str = ARCTIC_SHIFT_BASE_URL,
+        delay: float = ARCTIC_SHIFT_REQUEST_DELAY,
+        page_size: int = ARCTIC_SHIFT_PAGE_SIZE,
+        rate_limit_buffer: int = ARCTIC_SHIFT_RATE_LIMIT_BUFFER,
+        connection_limit: int = ARCTIC_SHIFT_CONNECTION_LIMIT,
+    ) -> None:
+        """Initialize the client with configuration."""
+        self.base_url = base_url
+        self.delay = delay
+        self.page_size = page_size
+        self.rate_limit_buffer = rate_limit_buffer
+        self.connection_limit = connection_limit
+        self.limiter = AIMDLimiter(max_limit=connection_limit)
+        self.active_streams = 0
+        self.session: aiohttp.ClientSession | None = None
+
+    async def __aenter__(self) -> Self:
+        """Enter async context manager and open the session."""
+        self._get_session()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit async context manager and close session."""
+        await self.close()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the pooled session, creating it on first use."""
+        if self.session is None:
+            # aiohttp sessions must be created inside a running event loop
+            connector = aiohttp.TCPConnector(
+                limit=self.connection_limit,
+                keepalive_timeout=ARCTIC_SHIFT_KEEPALIVE_TIMEOUT,
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                headers={
+                    "Accept-Encoding": ARCTIC_SHIFT_ACCEPT_ENCODING,
+                    "User-Agent": ARCTIC_SHIFT_USER_AGENT,
+                },
+            )
+        return self.session
+
+    async def fetch_comments(
+        self,
+        subreddit: str,
+        after: int,
+        before: int,
+    ) -> AsyncIterator[dict]:
+        """
+        Fetch all comments for a subreddit in a time range.
+
+        Args:
+            subreddit: Subreddit name (without r/ prefix).
+            after: Unix timestamp - fetch comments AFTER this time.
+            before: Unix timestamp - fetch comments BEFORE this time.
+
+        Yields:
+            Comment dicts from the API.
+
+        Raises:
+            aiohttp.ClientResponseError: If API returns an error status.
+            aiohttp.ClientConnectionError: If connection fails.
+        """
+        async for item in self._fetch_paginated(
+            endpoint=ARCTIC_SHIFT_COMMENTS_ENDPOINT,
+            subreddit=subreddit,
+            after=after,
+            before=before,
+        ):
+            yield item
+
+    async def fetch_posts(
+        self,
+        subreddit: str,
+        after: int,
+        before: int,
+    ) -> AsyncIterator[dict]:
+        """
+        Fetch all posts for a subreddit in a time range.
+
+        Args:
+            subreddit: Subreddit name (without r/ prefix).
+            after: Unix timestamp - fetch posts AFTER this time.
+            before: Unix timestamp - fetch posts BEFORE this time.
+
+        Yields:
+            Post dicts from the API.
+
+        Raises:
+            aiohttp.ClientResponseError: If API returns an error status.
+            aiohttp.ClientConnectionError: If connection fails.
+        """
+        async for item in self._fetch_paginated(
+            endpoint=ARCTIC_SHIFT_POSTS_ENDPOINT,
+            subreddit=subreddit,
+            after=after,
+            before=before,
+        ):
+            yield item
+
+    async def _fetch_paginated(
+        self,
+        endpoint: str,
+        subreddit: str,
+        after: int,
+        before: int,
+    ) -> AsyncIterator[dict]:
+        """
+        Fetch all items from an endpoint with automatic pagination.
+
+        Same cursor logic as ArcticShiftClient._fetch_paginated, but waits
+        with asyncio.sleep so other subreddits keep downloading meanwhile.
+        Pacing is scaled by the number of active paginators sharing the quota.
+
+        Args:
+            endpoint: API endpoint path (e.g., "/api/comments/search").
+            subreddit: Subreddit name.
+            after: Start timestamp (exclusive).
+            before: End timestamp (exclusive).
+
+        Yields:
+            Item dicts from the API.
+        """
+        current_after = after
+        self.active_streams += 1
+
+        try:
+            while current_after < before:
+                items, headers = await self._fetch_page(
+                    endpoint=endpoint,
+                    subreddit=subreddit,
+                    after=current_after,
+                    before=before,
+                )
+
+                if not items:
+                    # No more items in range
+                    break
+
+                if current_after == after:
+                    log_content_encoding(subreddit, headers)
+
+                for item in items:
+                    yield item
+
+                # Update cursor to last item's timestamp + 1 to avoid refetching
+                last_timestamp = items[-1].get("created_utc", current_after)
+                current_after = last_timestamp + 1
+
+                # Respect rate limits; after a pause the window has reset
+                if await self._check_rate_limit(headers):
+                    continue
+
+                # Pace requests over the remaining quota, or be nice to the
+                # API with the fixed delay when no quota headers were returned
+                delay = paced_delay_seconds(headers, streams=self.active_streams)
+                if delay is None:
+                    delay = self.delay
+                if delay > 0:
+                    await asyncio.sleep(delay)
+        finally:
+            self.active_streams -= 1
+
+    async def _fetch_page(
+        self,
+        endpoint: str,
+        subreddit: str,
+        after: int,
+        before: int,
+    ) -> tuple[list[dict], PageHeaders]:
+        """
+        Fetch a single page from the API, retrying transient failures.
+
+        429/5xx responses, connection errors and timeouts are retried up to
+        ARCTIC_SHIFT_MAX_RETRIES times (see retry_delay_seconds). Other error
+        statuses, or a failure on the final attempt, propagate to the caller.
+
+        Args:
+            endpoint: API endpoint path.
+            subreddit: Subreddit name.
+            after: Start timestamp.
+            before: End timestamp.
+
+        Returns:
+            Tuple of (list of item dicts, parsed page headers).
+
+        Raises:
+            aiohttp.ClientResponseError: If API returns an error status.
+            aiohttp.ClientConnectionError: If connection keeps failing.
+        """
+        url = f"{self.base_url}{endpoint}"
+
+        params = {
+            "subreddit": subreddit,
+            "after": after,
+            "before": before,
+            "sort": "asc",
+            "limit": self.page_size,
+        }
+
+        for attempt in range(ARCTIC_SHIFT_MAX_RETRIES):
+            try:
+                return await self._request_page(url, params)
+            except aiohttp.ClientResponseError as e:
+                if e.status not in ARCTIC_SHIFT_RETRY_STATUSES:
+                    raise
+                retry_after = e.headers.get("Retry-After") if e.headers else None
+                delay = retry_delay_seconds(attempt, retry_after)
+                status = e.status
+            except (aiohttp.ClientConnectionError, TimeoutError) as e:
+                delay = retry_delay_seconds(attempt)
+                status = type(e).__name__
+
+            logger.warning(
+                f"retry subreddit={subreddit} attempt={attempt + 1} "
+                f"delay={delay:.1f}s status={status}"
+            )
+            await asyncio.sleep(delay)
+
+        # Final attempt - any failure now propagates
+        return await self._request_page(url, params)
+
+    async def _request_page(
+        self, url: str, params: dict[str, Any]
+    ) -> tuple[list[dict], PageHeaders]:
+        """
+        Issue one page request under the AIMD limiter.
+
+        Args:
+            url: Full endpoint URL.
+            params: Query parameters.
+
+        Returns:
+            Tuple of (list of item dicts, parsed page headers).
+
+        Raises:
+            aiohttp.ClientResponseError: If API returns an error status.
+            json.JSONDecodeError: If the body is not valid JSON.
+        """
+        session = self._get_session()
+        async with self.limiter:
+            async with session.get(
+                url, params=params, timeout=REQUEST_TIMEOUT
+            ) as response:
+                if response.status in ARCTIC_SHIFT_RETRY_STATUSES:
+                    self.limiter.record_throttle()
+                response.raise_for_status()
+                # Body is read as it arrives; orjson decodes it in one C pass
+                try:
+                    data = await response.json(loads=orjson.loads)
+                except orjson.JSONDecodeError as e:
+                    # orjson rejects lone surrogates ("\ud83d") that Reddit
+                    # text can contain; the stdlib accepts them
+                    try:
+                        data = json.loads(await response.text())
+                    except json.JSONDecodeError as fallback_error:
+                        raise fallback_error from e
+                headers = parse_page_headers(response.headers)
+            self.limiter.record_success()
+
+        items = data.get("data", [])
+
+        return items, headers
+
+    async def _check_rate_limit(self, headers: PageHeaders) -> bool:
+        """
+        Check rate limit headers and sleep if necessary.
+
+        Args:
+            headers: Parsed page headers.
+
+        Returns:
+            True if the client slept until the rate limit window reset.
+        """
+        sleep_seconds = rate_limit_sleep_seconds(headers, self.rate_limit_buffer)
+        if sleep_seconds:
+            await asyncio.sleep(sleep_seconds)
+        return bool(sleep_seconds)
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session."""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
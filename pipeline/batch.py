@@ -4,12 +4,15 @@ Pure functions for prompt building, response parsing, and cost calculation.
 API submission functions use the Anthropic Batch API.
 """
 
+import functools
 import json
 import os
 import tempfile
 from pathlib import Path
 
 import anthropic
+import orjson
+import polars as pl
 
 # Model configuration
 MODEL = "claude-haiku-4-5-20251001"
@@ -21,8 +24,37 @@ REQUESTS_PER_BATCH = 100_000
 INPUT_COST_PER_MTOK = 0.50  # $0.50 per million input tokens
 OUTPUT_COST_PER_MTOK = 2.50  # $2.50 per million output tokens
 
+# Canonical response shape handled natively by parse_response_expr: JSON
+# tokens separated by optional JSON whitespace. The player string excludes
+# escapes and control characters so the capture equals what json.loads returns.
+_JSON_WS = r"[ \t\n\r]*"
+RESPONSE_PATTERN = _JSON_WS.join(
+    [
+        "^",
+        r"\{",
+        r'"s"',
+        ":",
+        r'"(?P<s>pos|neg|neu)"',
+        ",",
+        r'"c"',
+        ":",
+        r"(?P<c>-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][-+]?\d+)?)",
+        ",",
+        r'"p"',
+        ":",
+        r'(?:null|"(?P<p>[^"\\\x00-\x1f]*)")',
+        r"\}",
+        "$",
+    ]
+)
+
+# Classification payload returned by parse_response
+SENTIMENT_STRUCT = pl.Struct({"s": pl.Utf8, "c": pl.Float64, "p": pl.Utf8})
+
 # State file
 STATE_FILENAME = "state.json"
+STATE_LOG_SUFFIX = ".log"  # Append-only batch deltas, e.g. state.log
+STATE_SNAPSHOT_EVERY = 32  # Deltas between full state rewrites
 
 
 def build_prompt(comment_body: str) -> str:
@@ -102,6 +134,63 @@ def parse_response(text: str) -> dict:
         return {"s": "error", "c": 0.0, "p": None, "raw": text}
 
 
+def _parse_response_row(text: str) -> dict:
+    """
+    parse_response for a SENTIMENT_STRUCT row.
+
+    The model occasionally returns a non-string "p" (a number, or a list of
+    players); it is stringified so the row fits the struct's String field
+    instead of failing the whole column.
+
+    Args:
+        text: Raw response text from Claude.
+
+    Returns:
+        parse_response's dict with "p" either None or a str.
+    """
+    result = parse_response(text)
+    player = result["p"]
+    if player is not None and not isinstance(player, str):
+        result["p"] = str(player)
+    return result
+
+
+def parse_response_expr(content: pl.Expr) -> pl.Expr:
+    """
+    Vectorized parse_response over a column of raw model responses.
+
+    Responses in the canonical {"s": ..., "c": ..., "p": ...} shape are
+    parsed natively with a regex. Everything else (markdown fences, arrays,
+    escaped strings, reordered keys, malformed text) falls back to
+    parse_response row by row, so results match parse_response, except that
+    a non-string "p" is stringified to fit the struct. Null inputs stay null.
+
+    Args:
+        content: Expression producing raw response strings.
+
+    Returns:
+        Struct expression with fields s (str), c (f64) and p (str).
+    """
+    fast = content.str.extract_groups(RESPONSE_PATTERN)
+    matched = fast.struct.field("s").is_not_null()
+    fallback = (
+        pl.when(~matched)
+        .then(content)
+        .map_elements(_parse_response_row, return_dtype=SENTIMENT_STRUCT)
+    )
+
+    return pl.struct(
+        pl.coalesce(fast.struct.field("s"), fallback.struct.field("s")).alias("s"),
+        pl.coalesce(
+            fast.struct.field("c").cast(pl.Float64), fallback.struct.field("c")
+        ).alias("c"),
+        pl.when(matched)
+        .then(fast.struct.field("p"))
+        .otherwise(fallback.struct.field("p"))
+        .alias("p"),
+    )
+
+
 def calculate_cost(input_tokens: int, output_tokens: int) -> float:
     """
     Calculate the USD cost for a batch API request.
@@ -139,6 +228,53 @@ def format_batch_request(comment: dict) -> dict:
     }
 
 
+@functools.cache
+def _batch_request_template() -> tuple[bytes, bytes, bytes]:
+    """
+    Serialize a placeholder request once and split it around its variables.
+
+    Placeholders are control characters, which orjson always escapes, so
+    each appears exactly once in the output and never in the fixed text.
+
+    Returns:
+        Tuple of (bytes before the custom_id value, bytes between it and the
+        escaped comment body, bytes after the body).
+    """
+    template = orjson.dumps(format_batch_request({"id": "\x00", "body": "\x01"}))
+    head, rest = template.split(b'"\\u0000"')
+    middle, tail = rest.split(b"\\u0001")
+    return head, middle, tail
+
+
+def format_batch_request_bytes(comment: dict) -> bytes:
+    """
+    Serialize a comment's batch request straight to JSON bytes.
+
+    Produces the same bytes as orjson.dumps(format_batch_request(comment)),
+    but only the custom_id and comment body are serialized per call; the
+    model settings and prompt text come from a pre-serialized template.
+
+    Args:
+        comment: Comment dict with 'id' and 'body' fields.
+
+    Returns:
+        Batch request as compact JSON (no trailing newline).
+    """
+    body = comment["body"]
+    if not isinstance(body, str):
+        return orjson.dumps(format_batch_request(comment))
+
+    try:
+        body_json = orjson.dumps(body)
+    except TypeError:
+        # orjson cannot encode lone surrogates ("\ud83d"); json escapes them
+        body_json = json.dumps(body).encode()
+
+    head, middle, tail = _batch_request_template()
+    # The body's JSON string without its quotes sits inside the prompt string
+    return b"".join((head, orjson.dumps(comment["id"]), middle, body_json[1:-1], tail))
+
+
 # -----------------------------------------------------------------------------
 # State management
 # -----------------------------------------------------------------------------
@@ -165,6 +301,7 @@ def load_state(state_path: Path) -> dict:
     Load state from JSON file, or return empty state if file doesn't exist.
 
     Validates state has required keys, adding defaults for missing fields.
+    Any batch deltas in the state log are replayed on top of the snapshot.
 
     Args:
         state_path: Path to state JSON file.
@@ -172,11 +309,11 @@ def load_state(state_path: Path) -> dict:
     Returns:
         State dict loaded from file, or empty state if missing.
     """
-    if not state_path.exists():
-        return init_state()
-
-    with open(state_path) as f:
-        state = json.load(f)
+    if state_path.exists():
+        with open(state_path) as f:
+            state = json.load(f)
+    else:
+        state = init_state()
 
     # Ensure required keys exist (handles corrupted/edited state files)
     defaults = init_state()
@@ -184,6 +321,8 @@ def load_state(state_path: Path) -> dict:
         if key not in state:
             state[key] = default_value
 
+    _replay_state_log(state, _state_log_path(state_path))
+
     return state
 
 
@@ -192,7 +331,8 @@ def save_state(state: dict, state_path: Path) -> None:
     Save state to JSON file atomically.
 
     Uses tempfile + os.replace to avoid partial writes on crash.
-    Cleans up temp file on failure to avoid orphaned files.
+    Cleans up temp file on failure to avoid orphaned files. The state log
+    is removed once the snapshot is in place.
 
     Args:
         state: State dict to save.
@@ -216,6 +356,110 @@ def save_state(state: dict, state_path: Path) -> None:
         Path(temp_path).unlink(missing_ok=True)
         raise
 
+    # Snapshot now covers every logged delta
+    _state_log_path(state_path).unlink(missing_ok=True)
+
+
+def _state_log_path(state_path: Path) -> Path:
+    """Return the append-only delta log stored next to the state file."""
+    return state_path.with_suffix(STATE_LOG_SUFFIX)
+
+
+def _replay_state_log(state: dict, log_path: Path) -> None:
+    """
+    Apply logged batch deltas to state in order.
+
+    Each delta updates the batch with the same batch_id, or is appended as a
+    new batch entry. Replaying the same log twice gives the same state. A
+    truncated final line (crash mid-append) is ignored.
+
+    Args:
+        state: State dict to update in place.
+        log_path: Path to the state log.
+    """
+    if not log_path.exists():
+        return
+
+    by_id = {b["batch_id"]: b for b in state["batches"] if "batch_id" in b}
+    with open(log_path, "rb") as f:
+        for line in f:
+            try:
+                delta = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                continue
+            batch = by_id.get(delta["batch_id"])
+            if batch is None:
+                batch = by_id[delta["batch_id"]] = dict(delta)
+                state["batches"].append(batch)
+            else:
+                batch.update(delta)
+
+
+def append_state_delta(state_path: Path, delta: dict) -> None:
+    """
+    Append a single batch change to the state log.
+
+    Args:
+        state_path: Path to state JSON file (the log sits next to it).
+        delta: Changed batch fields, including batch_id.
+    """
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(_state_log_path(state_path), "ab") as f:
+        f.write(orjson.dumps(delta) + b"\n")
+
+
+class StateJournal:
+    """
+    Record batch state changes as log deltas with periodic full snapshots.
+
+    Each change is appended to the state log instead of rewriting the whole
+    state file. Every snapshot_every changes (and on explicit snapshot())
+    the full state is saved and the log cleared.
+
+    Example:
+        journal = StateJournal(state, state_path)
+        batch["status"] = "ended"
+        journal.record({"batch_id": batch["batch_id"], "status": "ended"})
+        ...
+        journal.snapshot()
+    """
+
+    def __init__(
+        self,
+        state: dict,
+        state_path: Path,
+        snapshot_every: int = STATE_SNAPSHOT_EVERY,
+    ) -> None:
+        """
+        Initialize the journal for an in-memory state.
+
+        Args:
+            state: State dict that recorded deltas have already been applied to.
+            state_path: Path to state JSON file.
+            snapshot_every: Number of deltas between full snapshots.
+        """
+        self.state = state
+        self.state_path = state_path
+        self._snapshot_every = snapshot_every
+        self._dirty_count = 0
+
+    def record(self, delta: dict) -> None:
+        """
+        Log a batch delta, snapshotting once enough have accumulated.
+
+        Args:
+            delta: Changed batch fields, including batch_id.
+        """
+        append_state_delta(self.state_path, delta)
+        self._dirty_count += 1
+        if self._dirty_count >= self._snapshot_every:
+            self.snapshot()
+
+    def snapshot(self) -> None:
+        """Save the full state and clear the log."""
+        save_state(self.state, self.state_path)
+        self._dirty_count = 0
+
 
 # -----------------------------------------------------------------------------
 # Batch API functions
@@ -243,8 +487,9 @@ def submit_batch(request_file: Path) -> dict:
     client = anthropic.Anthropic()
 
     try:
-        with open(request_file) as f:
-            requests = [json.loads(line) for line in f if line.strip()]
+        # Bytes lines go straight to orjson, skipping a per-line str decode
+        with open(request_file, "rb") as f:
+            requests = [orjson.loads(line) for line in f if not line.isspace()]
         batch = client.messages.batches.create(requests=requests)
     except anthropic.APIError as e:
         raise RuntimeError(
@@ -266,6 +511,62 @@ def submit_batch(request_file: Path) -> dict:
     }
 
 
+def _status_from_batch(batch) -> dict:
+    """
+    Convert an Anthropic MessageBatch into a status dict.
+
+    Args:
+        batch: MessageBatch returned by the batches API.
+
+    Returns:
+        Dict with processing_status, request_counts, ended_at, results_url.
+    """
+    return {
+        "processing_status": batch.processing_status,
+        "request_counts": {
+            "processing": batch.request_counts.processing,
+            "succeeded": batch.request_counts.succeeded,
+            "errored": batch.request_counts.errored,
+            "canceled": batch.request_counts.canceled,
+            "expired": batch.request_counts.expired,
+        },
+        "ended_at": batch.ended_at.isoformat() if batch.ended_at else None,
+        "results_url": batch.results_url,
+    }
+
+
+def _result_from_entry(entry) -> dict:
+    """
+    Convert a single batch results entry into a result dict.
+
+    Args:
+        entry: MessageBatchIndividualResponse from the results stream.
+
+    Returns:
+        Result dict as described in download_results.
+    """
+    result = {"custom_id": entry.custom_id, "result_type": entry.result.type}
+
+    if entry.result.type == "succeeded":
+        message = entry.result.message
+        if not message.content:
+            result["result_type"] = "errored"
+            result["error"] = "Empty content array from API"
+        else:
+            result["content"] = message.content[0].text
+            result["input_tokens"] = message.usage.input_tokens
+            result["output_tokens"] = message.usage.output_tokens
+    elif entry.result.type == "errored":
+        error_response = entry.result.error
+        result["error"] = f"{error_response.error.type}: {error_response.error.message}"
+    elif entry.result.type == "canceled":
+        result["error"] = "Request was canceled"
+    elif entry.result.type == "expired":
+        result["error"] = "Request expired before processing"
+
+    return result
+
+
 def get_batch_status(batch_id: str) -> dict:
     """
     Get the current status of a batch.
@@ -286,18 +587,7 @@ def get_batch_status(batch_id: str) -> dict:
     except anthropic.APIError as e:
         raise RuntimeError(f"Anthropic API error retrieving {batch_id}: {e}") from e
 
-    return {
-        "processing_status": batch.processing_status,
-        "request_counts": {
-            "processing": batch.request_counts.processing,
-            "succeeded": batch.request_counts.succeeded,
-            "errored": batch.request_counts.errored,
-            "canceled": batch.request_counts.canceled,
-            "expired": batch.request_counts.expired,
-        },
-        "ended_at": batch.ended_at.isoformat() if batch.ended_at else None,
-        "results_url": batch.results_url,
-    }
+    return _status_from_batch(batch)
 
 
 def download_results(batch_id: str) -> list[dict]:
@@ -327,26 +617,7 @@ def download_results(batch_id: str) -> list[dict]:
     results = []
     try:
         for entry in client.messages.batches.results(batch_id):
-            result = {"custom_id": entry.custom_id, "result_type": entry.result.type}
-
-            if entry.result.type == "succeeded":
-                message = entry.result.message
-                if not message.content:
-                    result["result_type"] = "errored"
-                    result["error"] = "Empty content array from API"
-                else:
-                    result["content"] = message.content[0].text
-                    result["input_tokens"] = message.usage.input_tokens
-                    result["output_tokens"] = message.usage.output_tokens
-            elif entry.result.type == "errored":
-                error_response = entry.result.error
-                result["error"] = f"{error_response.error.type}: {error_response.error.message}"
-            elif entry.result.type == "canceled":
-                result["error"] = "Request was canceled"
-            elif entry.result.type == "expired":
-                result["error"] = "Request expired before processing"
-
-            results.append(result)
+            results.append(_result_from_entry(entry))
 
     except anthropic.APIError as e:
         raise RuntimeError(
@@ -354,3 +625,60 @@ def download_results(batch_id: str) -> list[dict]:
         ) from e
 
     return results
+
+
+# -----------------------------------------------------------------------------
+# Async Batch API functions
+# -----------------------------------------------------------------------------
+
+
+async def get_batch_status_async(
+    batch_id: str, client: anthropic.AsyncAnthropic
+) -> dict:
+    """
+    Get the current status of a batch using the async client.
+
+    Args:
+        batch_id: The Anthropic batch ID (e.g., "msgbatch_...").
+        client: Shared AsyncAnthropic client.
+
+    Returns:
+        Dict with processing_status, request_counts, ended_at, results_url.
+
+    Raises:
+        RuntimeError: If API call fails.
+    """
+    try:
+        batch = await client.messages.batches.retrieve(batch_id)
+    except anthropic.APIError as e:
+        raise RuntimeError(f"Anthropic API error retrieving {batch_id}: {e}") from e
+
+    return _status_from_batch(batch)
+
+
+async def download_results_async(
+    batch_id: str, client: anthropic.AsyncAnthropic
+) -> list[dict]:
+    """
+    Download results for a completed batch using the async client.
+
+    Args:
+        batch_id: The Anthropic batch ID (e.g., "msgbatch_...").
+        client: Shared AsyncAnthropic client.
+
+    Returns:
+        List of result dicts (see download_results).
+
+    Raises:
+        RuntimeError: If API call fails.
+    """
+    results = []
+    try:
+        async for entry in await client.messages.batches.results(batch_id):
+            results.append(_result_from_entry(entry))
+    except anthropic.APIError as e:
+        raise RuntimeError(
+            f"Anthropic API error downloading results for {batch_id}: {e}"
+        ) from e
+
+    return results
@@ -5,6 +5,7 @@ This module provides reusable filter functions and a pipeline class
 for processing Reddit comments through multiple validation stages.
 """
 
+import functools
 import logging
 import re
 from collections.abc import Callable
@@ -74,20 +75,28 @@ class CommentPipeline:
     def __init__(self) -> None:
         """Initialize an empty pipeline with zeroed stats."""
         self._steps: list[tuple[str, StepFn]] = []
-        self._stats: dict[str, int] = {
-            "total": 0,
-            "accepted": 0,
-        }
+        # Plain int counters; rejections are indexed by step position, so
+        # process() never hashes a stats key
+        self._total = 0
+        self._accepted = 0
+        self._rejected: list[int] = []
 
     @property
     def stats(self) -> dict[str, int]:
         """
         Return processing statistics.
 
+        Built on each access from the internal counters, so callers get
+        an independent dict. Steps sharing a name share one count.
+
         Returns:
             Dict with 'total', 'accepted', and 'rejected_<step_name>' keys.
         """
-        return self._stats.copy()
+        stats = {"total": self._total, "accepted": self._accepted}
+        for (step_name, _), count in zip(self._steps, self._rejected):
+            rejection_key = f"rejected_{step_name}"
+            stats[rejection_key] = stats.get(rejection_key, 0) + count
+        return stats
 
     def add_step(self, fn: StepFn, name: str | None = None) -> "CommentPipeline":
         """
@@ -105,10 +114,8 @@ class CommentPipeline:
         """
         step_name = name if name is not None else fn.__name__
         self._steps.append((step_name, fn))
-        # Pre-initialize rejection counter for this step
-        rejection_key = f"rejected_{step_name}"
-        if rejection_key not in self._stats:
-            self._stats[rejection_key] = 0
+        # Rejection counter for this step, at the same index
+        self._rejected.append(0)
         return self
 
     def process(self, comment: dict) -> dict | None:
@@ -121,49 +128,136 @@ class CommentPipeline:
         Returns:
             Processed comment if all steps pass, None if rejected.
         """
-        self._stats["total"] += 1
+        self._total += 1
         current = comment
 
-        for step_name, step_fn in self._steps:
+        for index, (_, step_fn) in enumerate(self._steps):
             result = step_fn(current)
             if result is None:
-                self._stats[f"rejected_{step_name}"] += 1
+                self._rejected[index] += 1
                 return None
             current = result
 
-        self._stats["accepted"] += 1
+        self._accepted += 1
         return current
 
     def reset_stats(self) -> None:
         """Reset all statistics to zero."""
-        for key in self._stats:
-            self._stats[key] = 0
+        self._total = 0
+        self._accepted = 0
+        self._rejected = [0] * len(self._steps)
 
 
 # -----------------------------------------------------------------------------
 # Player mention matching
 # -----------------------------------------------------------------------------
 
-# Module-level lazy initialization (cached)
-_player_patterns: tuple[dict, frozenset, dict] | None = None
+# Word tokens, as delimited by the \b boundaries short aliases need
+WORD_PATTERN = re.compile(r"\w+")
+
+# Alias -> player indices (for substring and single-word short aliases),
+# and compiled boundary patterns for the remaining (multi-word) short aliases
+AliasIndex = dict[str, tuple[int, ...]]
+BoundaryPatterns = tuple[tuple[re.Pattern, int], ...]
+
+
+def _trie_regex(words: list[str]) -> str:
+    """
+    Build a regex matching any of the words, factored as a prefix trie.
+
+    Alternatives at each node start with distinct characters, so the engine
+    follows one branch per character instead of trying every word at every
+    position; optional tails are greedy, so a match is the longest word
+    starting there.
 
+    Args:
+        words: Non-empty literal strings.
 
-def _get_player_patterns() -> tuple[dict, frozenset, dict]:
+    Returns:
+        Regex source (uncompiled).
     """
-    Load config and compile patterns once.
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        branches = [
+            re.escape(char) + build(child) for char, child in node.items() if char
+        ]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+@functools.cache
+def _get_player_patterns() -> tuple[
+    tuple[str, ...], re.Pattern, AliasIndex, AliasIndex, BoundaryPatterns
+]:
+    """
+    Load config and compile matchers once.
+
+    Substring aliases are combined into one trie-shaped regex wrapped in a
+    lookahead, so a single finditer reports the longest alias starting at
+    each position (a stdlib stand-in for an Aho-Corasick automaton). Each
+    alias maps to the players of every alias that is a prefix of it, so
+    shorter aliases hidden by a longer match are still counted.
+
+    Short aliases that are a single word are matched by looking up the
+    text's words in a dict, which is equivalent to a word-boundary regex
+    but costs one tokenization per text instead of one search per alias.
 
     Returns:
-        Tuple of (players dict, short_aliases frozenset, compiled patterns dict).
+        Tuple of (player names in config order, substring pattern,
+        substring alias index, word alias index, boundary pattern pairs).
+        Aliases are pre-lowercased; player indices refer to the names tuple.
     """
-    global _player_patterns
-    if _player_patterns is None:
-        players, short_aliases = load_player_config()
-        boundary_patterns = {
-            alias: re.compile(r"\b" + re.escape(alias) + r"\b", re.IGNORECASE)
-            for alias in short_aliases
-        }
-        _player_patterns = (players, short_aliases, boundary_patterns)
-    return _player_patterns
+    players, short_aliases = load_player_config()
+    names = tuple(players)
+
+    substring_aliases: dict[str, list[int]] = {}
+    word_aliases: dict[str, list[int]] = {}
+    boundary_patterns = []
+    for index, aliases in enumerate(players.values()):
+        for alias in aliases:
+            alias_lower = alias.lower()
+            if alias_lower not in short_aliases:
+                substring_aliases.setdefault(alias_lower, []).append(index)
+            elif WORD_PATTERN.fullmatch(alias_lower):
+                word_aliases.setdefault(alias_lower, []).append(index)
+            else:
+                pattern = re.compile(
+                    r"\b" + re.escape(alias_lower) + r"\b", re.IGNORECASE
+                )
+                boundary_patterns.append((pattern, index))
+
+    substring_pattern = re.compile(
+        f"(?=({_trie_regex(list(substring_aliases))}))" if substring_aliases else "(?!)"
+    )
+    substring_index = {
+        alias: tuple(
+            {
+                index: None
+                for prefix, indices in substring_aliases.items()
+                if alias.startswith(prefix)
+                for index in indices
+            }
+        )
+        for alias in substring_aliases
+    }
+
+    return (
+        names,
+        substring_pattern,
+        substring_index,
+        {alias: tuple(indices) for alias, indices in word_aliases.items()},
+        tuple(boundary_patterns),
+    )
 
 
 def find_player_mentions(text: str) -> list[str]:
@@ -177,30 +271,35 @@ def find_player_mentions(text: str) -> list[str]:
         text: Text to search for player mentions.
 
     Returns:
-        List of player names found (deduplicated).
+        List of player names found (deduplicated, in config order).
     """
     if not text:
         return []
 
-    players, short_aliases, patterns = _get_player_patterns()
+    (
+        names,
+        substring_pattern,
+        substring_index,
+        word_aliases,
+        patterns,
+    ) = _get_player_patterns()
     text_lower = text.lower()
-    found = []
-
-    for player, aliases in players.items():
-        for alias in aliases:
-            alias_lower = alias.lower()
-            if alias_lower in short_aliases:
-                # Use word boundary matching for short aliases
-                if patterns[alias_lower].search(text):
-                    found.append(player)
-                    break
-            else:
-                # Simple substring match for longer aliases
-                if alias_lower in text_lower:
-                    found.append(player)
-                    break
-
-    return found
+    found: set[int] = set()
+
+    # Word boundary matching for short aliases (like 'AD', 'Curry')
+    for word in set(WORD_PATTERN.findall(text_lower)):
+        indices = word_aliases.get(word)
+        if indices is not None:
+            found.update(indices)
+    for pattern, index in patterns:
+        if index not in found and pattern.search(text):
+            found.add(index)
+
+    # Substring match for longer aliases, one regex pass for all of them
+    for match in substring_pattern.finditer(text_lower):
+        found.update(substring_index[match.group(1)])
+
+    return [names[index] for index in sorted(found)]
 
 
 def filter_player_mentions(comment: dict) -> dict | None:
@@ -11,11 +11,12 @@ Usage:
 """
 
 import argparse
-import json
 import logging
 import sys
 from pathlib import Path
 
+import orjson
+
 from pipeline.aggregation import aggregate_sentiment
 from utils.paths import get_dashboard_dir, get_processed_dir
 
@@ -89,9 +90,18 @@ def main() -> None:
     # Ensure output directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Write JSON output
-    with open(output_path, "w") as f:
-        json.dump(result, f, indent=2, default=str)
+    # Write JSON output. Datetimes pass through to default=str so week keys
+    # keep the "YYYY-MM-DD HH:MM:SS" format the dashboard already reads.
+    payload = orjson.dumps(
+        result,
+        default=str,
+        option=orjson.OPT_INDENT_2
+        | orjson.OPT_SERIALIZE_NUMPY
+        | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME,
+    )
+    with open(output_path, "wb") as f:
+        f.write(payload)
 
     logger.info(f"Wrote aggregates to {output_path}")
 
@@ -9,32 +9,35 @@ Usage:
     uv run python scripts/clean_raw_comments.py
 
     # Explicit paths
-    uv run python scripts/clean_raw_comments.py data/raw/r_nba_comments.jsonl data/filtered/r_nba_cleaned.jsonl
+    uv run python scripts/clean_raw_comments.py data/raw/r_nba_comments.jsonl.zst data/filtered/r_nba_cleaned.jsonl
 
     # Preview first 10K lines (for testing)
     uv run python scripts/clean_raw_comments.py --limit 10000
 
-Input: Raw JSONL from Arctic Shift (~60 fields per comment)
+Input: Raw JSONL from Arctic Shift (~60 fields per comment), zstd-compressed
+       (.zst) as written by download_comments, or plain
 Output: Cleaned JSONL with 11 fields, invalid bodies removed
 """
 
 import argparse
+import contextlib
+import io
 import json
 import logging
 import sys
 import time
+from dataclasses import dataclass
 from pathlib import Path
+from typing import TextIO
 
+import orjson
+import zstandard
 from tqdm import tqdm
 
 # Add project root to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from scripts.extract_filter import (
-    ProcessingStats,
-    has_valid_body,
-    extract_fields,
-)
+from pipeline.processors import extract_fields, has_valid_body
 from utils.formatting import format_duration, format_size
 from utils.paths import get_filtered_dir, get_raw_dir
 
@@ -54,58 +57,68 @@ logger = logging.getLogger(__name__)
 # Default filenames (directories come from utils/paths)
 # -----------------------------------------------------------------------------
 
-DEFAULT_INPUT_FILENAME = "r_nba_comments.jsonl"
+DEFAULT_INPUT_FILENAME = "r_nba_comments.jsonl.zst"
 DEFAULT_OUTPUT_FILENAME = "r_nba_cleaned.jsonl"
 
+# Serialized output gathered before each write()
+OUTPUT_FLUSH_BYTES = 1024 * 1024
+
 
 # -----------------------------------------------------------------------------
 # Core processing
 # -----------------------------------------------------------------------------
 
 
-def count_lines(filepath: Path) -> int:
-    """
-    Count lines in a file for progress bar total.
+@dataclass
+class ProcessingStats:
+    """Line counts for one cleaning run."""
 
-    For very large files, this adds startup time but makes the progress
-    bar much more useful. On a 13GB file, expect ~30-60 seconds.
-    """
-    logger.info(f"Counting lines in {filepath.name}...")
-    count = 0
-    with open(filepath, "r") as f:
-        for _ in f:
-            count += 1
-    return count
+    total_processed: int = 0
+    accepted: int = 0
+    rejected_body: int = 0
+    rejected_malformed: int = 0
 
 
-def process_line(line: str, stats: ProcessingStats) -> dict | None:
+def open_raw_lines(filepath: Path) -> TextIO:
     """
-    Process a single JSON line from raw input.
+    Open a raw JSONL file for line iteration, decompressing .zst on the fly.
+
+    download_comments writes one zstd frame per batch, so frames are read
+    across until the end of the file. Closing the returned reader also
+    closes the underlying file.
 
     Args:
-        line: Raw JSON string (one comment)
-        stats: ProcessingStats object to update
+        filepath: Path to a raw JSONL file (.jsonl or .jsonl.zst).
 
     Returns:
-        Extracted comment dict if valid, None if rejected
+        Text file handle yielding decoded lines (use as a context manager).
     """
-    stats.total_processed += 1
+    if filepath.suffix == ".zst":
+        # The raw handle is closed here if the decompressor cannot be set
+        # up; once it is, the stream reader owns it
+        with contextlib.ExitStack() as stack:
+            raw = stack.enter_context(open(filepath, "rb"))
+            reader = zstandard.ZstdDecompressor().stream_reader(
+                raw, read_across_frames=True
+            )
+            stack.pop_all()
+        return io.TextIOWrapper(reader, encoding="utf-8")
+    return open(filepath, "r")
 
-    # Parse JSON
-    try:
-        comment = json.loads(line)
-    except json.JSONDecodeError:
-        stats.rejected_malformed += 1
-        return None
 
-    # Validate body
-    if not has_valid_body(comment):
-        stats.rejected_body += 1
-        return None
+def count_lines(filepath: Path) -> int:
+    """
+    Count lines in a file for progress bar total.
 
-    # Extract fields and accept
-    stats.accepted += 1
-    return extract_fields(comment)
+    For very large files, this adds startup time but makes the progress
+    bar much more useful. On a 13GB file, expect ~30-60 seconds.
+    """
+    logger.info(f"Counting lines in {filepath.name}...")
+    count = 0
+    with open_raw_lines(filepath) as f:
+        for _ in f:
+            count += 1
+    return count
 
 
 def process_file(
@@ -118,7 +131,7 @@ def process_file(
     Stream process a raw JSONL file into cleaned output.
 
     Args:
-        input_path: Path to raw JSONL file
+        input_path: Path to raw JSONL file (.jsonl or .jsonl.zst)
         output_path: Path to write cleaned JSONL
         limit: Optional max lines to process (for testing)
         skip_line_count: Skip counting lines (faster start, no progress %)
@@ -126,7 +139,12 @@ def process_file(
     Returns:
         Tuple of (ProcessingStats, elapsed_seconds)
     """
-    stats = ProcessingStats()
+    # Counted in locals (a plain int add per line, no attribute
+    # load/store on the dataclass) and copied into stats at the end
+    total_processed = 0
+    accepted = 0
+    rejected_body = 0
+    rejected_malformed = 0
 
     # Get total for progress bar (unless skipped or limited)
     if limit:
@@ -143,7 +161,10 @@ def process_file(
 
     start_time = time.time()
 
-    with open(input_path, "r") as f_in, open(output_path, "w") as f_out:
+    # orjson emits UTF-8 bytes, so the output is written in binary mode
+    pending = bytearray()
+
+    with open_raw_lines(input_path) as f_in, open(output_path, "wb") as f_out:
         # tqdm wraps the file iterator for progress tracking
         lines = tqdm(f_in, total=total, desc="Processing", unit=" lines")
 
@@ -157,13 +178,43 @@ def process_file(
             if not line:
                 continue
 
-            # Process and write if valid
-            result = process_line(line, stats)
-            if result:
-                f_out.write(json.dumps(result) + "\n")
+            total_processed += 1
+
+            # Parse JSON
+            try:
+                comment = json.loads(line)
+            except json.JSONDecodeError:
+                rejected_malformed += 1
+                continue
+
+            # Validate body
+            if not has_valid_body(comment):
+                rejected_body += 1
+                continue
+
+            # Extract fields and write
+            accepted += 1
+            fields = extract_fields(comment)
+            try:
+                pending += orjson.dumps(fields, option=orjson.OPT_APPEND_NEWLINE)
+            except TypeError:
+                # json.loads accepts lone surrogates ("\ud83d") that orjson
+                # cannot encode; the stdlib writes them escaped instead
+                pending += json.dumps(fields).encode() + b"\n"
+            if len(pending) >= OUTPUT_FLUSH_BYTES:
+                f_out.write(pending)
+                pending.clear()
+
+        f_out.write(pending)
 
     elapsed = time.time() - start_time
 
+    stats = ProcessingStats(
+        total_processed=total_processed,
+        accepted=accepted,
+        rejected_body=rejected_body,
+        rejected_malformed=rejected_malformed,
+    )
     return stats, elapsed
 
 
@@ -240,8 +291,10 @@ def main() -> None:
         skip_line_count=args.skip_line_count,
     )
 
-    # Get output size
+    # Get output size. A .zst input size is compressed, so comparing it with
+    # the uncompressed output would not show a reduction.
     output_size = args.output.stat().st_size if args.output.exists() else 0
+    compressed_input = args.input.suffix == ".zst"
     size_reduction = (1 - output_size / input_size) * 100 if input_size > 0 else 0
     throughput = stats.total_processed / elapsed if elapsed > 0 else 0
 
@@ -259,9 +312,13 @@ def main() -> None:
         logger.info(f"Acceptance rate:      {acceptance_rate:.2f}%")
 
     logger.info("")
-    logger.info(f"Input size:           {format_size(input_size)}")
+    if compressed_input:
+        logger.info(f"Input size:           {format_size(input_size)} (compressed)")
+    else:
+        logger.info(f"Input size:           {format_size(input_size)}")
     logger.info(f"Output size:          {format_size(output_size)}")
-    logger.info(f"Size reduction:       {size_reduction:.1f}%")
+    if not compressed_input:
+        logger.info(f"Size reduction:       {size_reduction:.1f}%")
     logger.info("")
     logger.info(f"Time elapsed:         {format_duration(elapsed)}")
     logger.info(f"Throughput:           {throughput:,.0f} comments/sec")
@@ -11,7 +11,7 @@ Usage:
     # Poll until all batches complete (default: check every 60s, max 24h)
     uv run python -m scripts.collect_results
 
-    # Custom poll settings
+    # Custom poll settings (backs off from --min-poll-interval to --poll-interval)
     uv run python -m scripts.collect_results --poll-interval 120 --max-wait 3600
 
 Input: data/batches/state.json, data/batches/requests/batch_NNN.jsonl
@@ -22,22 +22,28 @@ Output:
 """
 
 import argparse
-import json
+import asyncio
+import hashlib
 import logging
+import os
 import sys
 import time
+from dataclasses import dataclass, field
 from pathlib import Path
 
+import anthropic
+import orjson
 import polars as pl
 from dotenv import load_dotenv
 
 from pipeline.batch import (
     STATE_FILENAME,
+    StateJournal,
     calculate_cost,
-    download_results,
-    get_batch_status,
+    download_results_async,
+    get_batch_status_async,
     load_state,
-    parse_response,
+    parse_response_expr,
     save_state,
 )
 from utils.paths import get_batches_dir, get_filtered_dir, get_processed_dir
@@ -62,6 +68,16 @@ FILTERED_FILENAME = "r_nba_player_mentions.jsonl"
 OUTPUT_FILENAME = "sentiment.parquet"
 FAILED_FILENAME = "failed_requests.jsonl"
 
+# Poll backoff: first wait, and growth factor while no batch makes progress
+DEFAULT_MIN_POLL_INTERVAL = 5
+POLL_BACKOFF_FACTOR = 1.5
+
+# Batch fields refreshed from the API on each status check
+STATUS_FIELDS = ("status", "request_counts", "ended_at", "results_url")
+
+# Upper bound on concurrent results downloads (keeps within API connection pool)
+MAX_DOWNLOAD_WORKERS = 4
+
 # Output columns for sentiment.parquet
 OUTPUT_COLUMNS = [
     "comment_id",
@@ -79,90 +95,156 @@ OUTPUT_COLUMNS = [
     "output_tokens",
 ]
 
+# Schema of batch_NNN_results.jsonl rows written by download_batch_results
+RESULTS_SCHEMA = {
+    "custom_id": pl.Utf8,
+    "result_type": pl.Utf8,
+    "content": pl.Utf8,
+    "input_tokens": pl.UInt32,
+    "output_tokens": pl.UInt32,
+    "error": pl.Utf8,
+}
+
+# posix_fadvise is Linux/Unix only; read-ahead hints are skipped elsewhere
+HAS_FADVISE = hasattr(os, "posix_fadvise")
+
+# Bump when the parsed results layout changes to invalidate cached parquets
+PARSED_CACHE_VERSION = 2
+
+# Bump when the filtered comments parquet layout changes to invalidate it
+FILTERED_CACHE_VERSION = 1
+
+# Columns read from the filtered comments file; other fields are never parsed
+FILTERED_SCHEMA = {
+    "id": pl.Utf8,
+    "body": pl.Utf8,
+    "author": pl.Utf8,
+    "author_flair_text": pl.Utf8,
+    "author_flair_css_class": pl.Utf8,
+    "created_utc": pl.Int64,
+    "score": pl.Int64,
+    "mentioned_players": pl.List(pl.Utf8),
+}
+
 
 # -----------------------------------------------------------------------------
 # Helper functions
 # -----------------------------------------------------------------------------
 
 
-def get_pending_batches(state: dict) -> list[dict]:
+@dataclass
+class _BatchIndex:
     """
-    Get batches that haven't finished processing yet.
+    Batch ids grouped by collection stage, kept in sync as state changes.
 
-    Args:
-        state: Current state dict.
+    Built once from state so the poll loop reads sets instead of rescanning
+    state["batches"] every cycle.
 
-    Returns:
-        List of batch entries with status != "ended".
+    Attributes:
+        by_id: Batch entry dicts from state, keyed by batch_id.
+        pending: Ids of batches that haven't ended yet.
+        downloadable: Ids of ended batches whose results aren't downloaded.
     """
-    return [b for b in state.get("batches", []) if b.get("status") != "ended"]
 
-
-def get_downloadable_batches(state: dict) -> list[dict]:
+    by_id: dict[str, dict] = field(default_factory=dict)
+    pending: set[str] = field(default_factory=set)
+    downloadable: set[str] = field(default_factory=set)
+
+    @classmethod
+    def from_state(cls, state: dict) -> "_BatchIndex":
+        """
+        Build the index with a single pass over state["batches"].
+
+        Args:
+            state: Current state dict.
+
+        Returns:
+            Populated _BatchIndex.
+        """
+        index = cls()
+        for batch in state.get("batches", []):
+            batch_id = batch["batch_id"]
+            index.by_id[batch_id] = batch
+            if batch.get("status") != "ended":
+                index.pending.add(batch_id)
+            elif not batch.get("results_downloaded", False):
+                index.downloadable.add(batch_id)
+        return index
+
+    def mark_ended(self, batch_id: str) -> None:
+        """Move a batch from pending to downloadable."""
+        self.pending.discard(batch_id)
+        self.downloadable.add(batch_id)
+
+    def mark_downloaded(self, batch_id: str) -> None:
+        """Drop a batch from downloadable once its results are saved."""
+        self.downloadable.discard(batch_id)
+
+    @property
+    def not_downloaded(self) -> set[str]:
+        """Ids of every batch without downloaded results."""
+        return self.pending | self.downloadable
+
+
+def _apply_batch_status(batch: dict, status: dict) -> bool:
     """
-    Get batches that are complete but haven't had results downloaded.
+    Copy a fetched status onto its batch entry.
 
     Args:
-        state: Current state dict.
+        batch: Batch entry dict from state (modified in place).
+        status: Status dict returned by get_batch_status.
 
     Returns:
-        List of batch entries with status == "ended" and results_downloaded == False.
+        True if the batch transitioned to "ended" status.
     """
-    return [
-        b
-        for b in state.get("batches", [])
-        if b.get("status") == "ended" and not b.get("results_downloaded", False)
-    ]
+    old_status = batch.get("status")
+    batch["status"] = status["processing_status"]
+    batch["request_counts"] = status["request_counts"]
+    batch["ended_at"] = status["ended_at"]
+    batch["results_url"] = status["results_url"]
+
+    if old_status != "ended" and status["processing_status"] == "ended":
+        logger.info(
+            f"Batch {batch['batch_num']} completed: "
+            f"{status['request_counts']['succeeded']} succeeded, "
+            f"{status['request_counts']['errored']} errored"
+        )
+        return True
+
+    logger.debug(f"Batch {batch['batch_num']}: {status['processing_status']}")
+    return False
 
 
-def poll_batch_statuses(state: dict) -> int:
+async def refresh_batch_status(batch: dict, client: anthropic.AsyncAnthropic) -> bool:
     """
-    Update status for all pending batches.
+    Fetch and apply the latest status for a single batch.
 
     Args:
-        state: Current state dict (modified in place).
+        batch: Batch entry dict from state (modified in place).
+        client: Shared AsyncAnthropic client.
 
     Returns:
-        Number of batches that transitioned to "ended" status.
+        True if the batch transitioned to "ended" status.
     """
-    pending = get_pending_batches(state)
-    newly_completed = 0
-
-    for batch in pending:
-        batch_id = batch["batch_id"]
-        try:
-            status = get_batch_status(batch_id)
-            old_status = batch.get("status")
-            batch["status"] = status["processing_status"]
-            batch["request_counts"] = status["request_counts"]
-            batch["ended_at"] = status["ended_at"]
-            batch["results_url"] = status["results_url"]
-
-            if old_status != "ended" and status["processing_status"] == "ended":
-                newly_completed += 1
-                logger.info(
-                    f"Batch {batch['batch_num']} completed: "
-                    f"{status['request_counts']['succeeded']} succeeded, "
-                    f"{status['request_counts']['errored']} errored"
-                )
-            else:
-                logger.debug(
-                    f"Batch {batch['batch_num']}: {status['processing_status']}"
-                )
-
-        except RuntimeError as e:
-            logger.error(f"Failed to get status for batch {batch_id}: {e}")
+    try:
+        status = await get_batch_status_async(batch["batch_id"], client)
+    except RuntimeError as e:
+        logger.error(f"Failed to get status for batch {batch['batch_id']}: {e}")
+        return False
 
-    return newly_completed
+    return _apply_batch_status(batch, status)
 
 
-def download_batch_results(batch: dict, responses_dir: Path) -> Path:
+async def download_batch_results(
+    batch: dict, responses_dir: Path, client: anthropic.AsyncAnthropic
+) -> Path:
     """
     Download and save results for a single batch.
 
     Args:
         batch: Batch entry dict from state.
-        responses_dir: Directory to save results.
+        responses_dir: Directory to save results (must already exist).
+        client: Shared AsyncAnthropic client.
 
     Returns:
         Path to the saved results file.
@@ -173,15 +255,18 @@ def download_batch_results(batch: dict, responses_dir: Path) -> Path:
 
     logger.info(f"Downloading results for batch {batch_num}...")
 
-    results = download_results(batch_id)
+    results = await download_results_async(batch_id, client)
 
-    responses_dir.mkdir(parents=True, exist_ok=True)
-    with open(output_file, "w") as f:
-        for result in results:
-            f.write(json.dumps(result) + "\n")
+    # Serialize and count in one pass, then write with a single call
+    lines = []
+    succeeded = 0
+    for result in results:
+        succeeded += result["result_type"] == "succeeded"
+        lines.append(orjson.dumps(result))
+    errored = len(results) - succeeded
+    payload = b"\n".join(lines) + b"\n" if lines else b""
+    await asyncio.to_thread(output_file.write_bytes, payload)
 
-    succeeded = sum(1 for r in results if r["result_type"] == "succeeded")
-    errored = sum(1 for r in results if r["result_type"] != "succeeded")
     logger.info(
         f"  -> Saved {len(results)} results ({succeeded} succeeded, {errored} failed)"
     )
@@ -189,82 +274,379 @@ def download_batch_results(batch: dict, responses_dir: Path) -> Path:
     return output_file
 
 
-def poll_until_complete(
-    state: dict,
-    state_path: Path,
+async def _poll_and_download(
+    batch: dict,
+    index: _BatchIndex,
+    journal: StateJournal,
+    responses_dir: Path,
+    client: anthropic.AsyncAnthropic,
+    download_slots: asyncio.Semaphore,
+) -> bool:
+    """
+    Refresh one batch and download its results as soon as it has ended.
+
+    Args:
+        batch: Batch entry dict from state (modified in place).
+        index: Batch index (updated as the batch moves between stages).
+        journal: State journal that records each batch change.
+        responses_dir: Directory to save results.
+        client: Shared AsyncAnthropic client.
+        download_slots: Semaphore bounding concurrent downloads.
+
+    Returns:
+        True if the batch ended or had its results downloaded this cycle.
+    """
+    batch_id = batch["batch_id"]
+    progressed = False
+    if batch_id in index.pending:
+        before = [batch.get(key) for key in STATUS_FIELDS]
+        if await refresh_batch_status(batch, client):
+            index.mark_ended(batch_id)
+            progressed = True
+        if [batch.get(key) for key in STATUS_FIELDS] != before:
+            journal.record(
+                {"batch_id": batch_id, **{key: batch[key] for key in STATUS_FIELDS}}
+            )
+
+    if batch_id not in index.downloadable:
+        return progressed
+
+    async with download_slots:
+        try:
+            await download_batch_results(batch, responses_dir, client)
+        except RuntimeError as e:
+            logger.error(f"Failed to download batch {batch['batch_num']}: {e}")
+            return progressed
+
+    batch["results_downloaded"] = True
+    index.mark_downloaded(batch_id)
+    journal.record({"batch_id": batch_id, "results_downloaded": True})
+    return True
+
+
+async def poll_and_download_batches(
+    index: _BatchIndex,
+    journal: StateJournal,
+    responses_dir: Path,
+    client: anthropic.AsyncAnthropic,
+) -> int:
+    """
+    Run one poll cycle over every batch without downloaded results.
+
+    Each batch gets its own task, so a download starts as soon as that
+    batch reports "ended" while the other status checks are still in
+    flight. Every status change and download is recorded in the journal.
+
+    Args:
+        index: Batch index built from state (kept in sync).
+        journal: State journal wrapping the current state.
+        responses_dir: Directory to save results (must already exist).
+        client: Shared AsyncAnthropic client.
+
+    Returns:
+        Number of batches that ended or were downloaded this cycle.
+    """
+    download_slots = asyncio.Semaphore(MAX_DOWNLOAD_WORKERS)
+
+    async with asyncio.TaskGroup() as tg:
+        tasks = [
+            tg.create_task(
+                _poll_and_download(
+                    index.by_id[batch_id],
+                    index,
+                    journal,
+                    responses_dir,
+                    client,
+                    download_slots,
+                )
+            )
+            for batch_id in index.not_downloaded
+        ]
+
+    return sum(task.result() for task in tasks)
+
+
+async def poll_until_complete(
+    index: _BatchIndex,
+    journal: StateJournal,
     responses_dir: Path,
     poll_interval: int,
     max_wait: int,
+    min_poll_interval: int = DEFAULT_MIN_POLL_INTERVAL,
 ) -> bool:
     """
     Poll until all batches complete or timeout.
 
-    Downloads results as batches complete.
+    Downloads results as batches complete. The wait between checks starts
+    at min_poll_interval, grows by POLL_BACKOFF_FACTOR after each cycle
+    with no progress up to poll_interval, and resets once a batch ends or
+    is downloaded.
 
     Args:
-        state: Current state dict (modified in place).
-        state_path: Path to save state file.
+        index: Batch index built from state (kept in sync).
+        journal: State journal wrapping the current state.
         responses_dir: Directory to save results.
-        poll_interval: Seconds between status checks.
+        poll_interval: Maximum seconds between status checks.
         max_wait: Maximum wait time in seconds.
+        min_poll_interval: Initial seconds between status checks.
 
     Returns:
         True if all batches completed, False if timeout.
     """
     start_time = time.time()
+    initial_interval = min(min_poll_interval, poll_interval)
+    interval = initial_interval
+
+    async with anthropic.AsyncAnthropic() as client:
+        while True:
+            # Check statuses and download newly completed batches
+            progressed = await poll_and_download_batches(
+                index, journal, responses_dir, client
+            )
 
-    while True:
-        # Check for newly completed batches
-        poll_batch_statuses(state)
-        save_state(state, state_path)
+            # Check if all done
+            pending = index.pending
+            if not pending:
+                logger.info("All batches completed!")
+                return True
+
+            # Check timeout
+            elapsed = time.time() - start_time
+            if elapsed >= max_wait:
+                logger.warning(
+                    f"Timeout after {elapsed:.0f}s with {len(pending)} batches pending"
+                )
+                return False
+
+            # Check again quickly after progress, back off while nothing changes
+            if progressed:
+                interval = initial_interval
+
+            # Wait before next poll
+            remaining = max_wait - elapsed
+            wait_time = min(interval, remaining)
+            logger.info(
+                f"Waiting {wait_time:.0f}s... "
+                f"({len(pending)} batches pending, {remaining:.0f}s remaining)"
+            )
+            await asyncio.sleep(wait_time)
+            interval = min(interval * POLL_BACKOFF_FACTOR, poll_interval)
 
-        # Download any completed batches
-        downloadable = get_downloadable_batches(state)
-        for batch in downloadable:
-            try:
-                download_batch_results(batch, responses_dir)
-                batch["results_downloaded"] = True
-                save_state(state, state_path)
-            except RuntimeError as e:
-                logger.error(f"Failed to download batch {batch['batch_num']}: {e}")
-
-        # Check if all done
-        pending = get_pending_batches(state)
-        if not pending:
-            logger.info("All batches completed!")
-            return True
 
-        # Check timeout
-        elapsed = time.time() - start_time
-        if elapsed >= max_wait:
-            logger.warning(
-                f"Timeout after {elapsed:.0f}s with {len(pending)} batches pending"
-            )
-            return False
+async def check_once(
+    index: _BatchIndex, journal: StateJournal, responses_dir: Path
+) -> None:
+    """
+    Run a single poll cycle for --no-wait mode.
 
-        # Wait before next poll
-        remaining = max_wait - elapsed
-        wait_time = min(poll_interval, remaining)
-        logger.info(
-            f"Waiting {wait_time:.0f}s... "
-            f"({len(pending)} batches pending, {remaining:.0f}s remaining)"
+    Args:
+        index: Batch index built from state (kept in sync).
+        journal: State journal wrapping the current state.
+        responses_dir: Directory to save results.
+    """
+    async with anthropic.AsyncAnthropic() as client:
+        await poll_and_download_batches(index, journal, responses_dir, client)
+
+
+def _parsed_cache_paths(results_file: Path) -> tuple[Path, Path]:
+    """Return (parsed parquet, sha256 sidecar) paths for a results file."""
+    stem = results_file.name.removesuffix("_results.jsonl")
+    return (
+        results_file.with_name(f"{stem}_parsed.parquet"),
+        results_file.with_name(f"{stem}_parsed.sha256"),
+    )
+
+
+def _check_parsed_cache(results_file: Path) -> tuple[str, bool]:
+    """
+    Hash a results file and compare it against its parsed-cache sidecar.
+
+    Args:
+        results_file: Path to a batch_NNN_results.jsonl file.
+
+    Returns:
+        Tuple of (cache key for the sidecar, whether the cache is valid).
+    """
+    parsed_path, digest_path = _parsed_cache_paths(results_file)
+
+    with open(results_file, "rb") as f:
+        if HAS_FADVISE:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        digest = hashlib.file_digest(f, "sha256").hexdigest()
+        cache_key = f"{digest} v{PARSED_CACHE_VERSION}"
+
+        cache_hit = (
+            parsed_path.exists()
+            and digest_path.exists()
+            and digest_path.read_text().strip() == cache_key
         )
-        time.sleep(wait_time)
+        # On a hit the JSONL isn't read again, so release its page cache
+        if cache_hit and HAS_FADVISE:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+
+    return cache_key, cache_hit
+
+
+def _parse_results_file(results_file: Path) -> pl.LazyFrame:
+    """
+    Lazily parse one results file into the cached parsed-results layout.
+
+    Args:
+        results_file: Path to a batch_NNN_results.jsonl file.
+
+    Returns:
+        LazyFrame with custom_id, result_type, sentiment, confidence,
+        sentiment_player, token counts and error.
+    """
+    parsed = pl.col("parsed")
+    return (
+        pl.scan_ndjson(results_file, schema=RESULTS_SCHEMA)
+        .with_columns(
+            parse_response_expr(
+                pl.when(pl.col("result_type") == "succeeded").then(pl.col("content"))
+            ).alias("parsed")
+        )
+        .select(
+            pl.col("custom_id"),
+            pl.col("result_type"),
+            parsed.struct.field("s").alias("sentiment"),
+            parsed.struct.field("c").cast(pl.Float32).alias("confidence"),
+            parsed.struct.field("p").alias("sentiment_player"),
+            pl.col("input_tokens"),
+            pl.col("output_tokens"),
+            pl.col("error"),
+        )
+    )
+
+
+def _load_parsed_results(results_files: list[Path]) -> pl.LazyFrame:
+    """
+    Load all results files with content parsed, reusing cached parses.
+
+    Each file's parsed rows are stored next to it as batch_NNN_parsed.parquet,
+    with a batch_NNN_parsed.sha256 sidecar holding the digest of the JSONL
+    they came from and PARSED_CACHE_VERSION. Files with a matching sidecar
+    skip parsing; the rest are parsed together in one collect_all so Polars
+    works on several files at once. Confidence is stored as Float32 and
+    token counts as UInt32.
+
+    Args:
+        results_files: Paths to batch_NNN_results.jsonl files.
+
+    Returns:
+        LazyFrame concatenating the per-file parsed parquets.
+    """
+    stale = []
+    for results_file in results_files:
+        cache_key, cache_hit = _check_parsed_cache(results_file)
+        if cache_hit:
+            logger.debug(f"Using cached parse for {results_file.name}")
+        else:
+            stale.append((results_file, cache_key))
+
+    if stale:
+        logger.info(f"Parsing {len(stale)} new or changed results files...")
+        # Drop old digests first so an interrupted rewrite is never trusted
+        for results_file, _ in stale:
+            _parsed_cache_paths(results_file)[1].unlink(missing_ok=True)
+
+        pl.collect_all(
+            [
+                _parse_results_file(results_file).sink_parquet(
+                    _parsed_cache_paths(results_file)[0], lazy=True
+                )
+                for results_file, _ in stale
+            ]
+        )
+        for results_file, cache_key in stale:
+            _parsed_cache_paths(results_file)[1].write_text(cache_key + "\n")
+
+    return pl.concat(
+        [pl.scan_parquet(_parsed_cache_paths(path)[0]) for path in results_files],
+        how="vertical",
+        parallel=True,
+    )
+
+
+def _filtered_cache_key(filtered_path: Path) -> str:
+    """
+    Build the cache key for a filtered comments file's parquet.
+
+    Args:
+        filtered_path: Path to filtered comments JSONL file.
+
+    Returns:
+        The JSONL's size and mtime (ns), FILTERED_CACHE_VERSION and a digest
+        of FILTERED_SCHEMA, so a changed, replaced or restored JSONL and a
+        schema change all miss.
+    """
+    stat = filtered_path.stat()
+    schema = ",".join(f"{name}:{dtype}" for name, dtype in FILTERED_SCHEMA.items())
+    schema_digest = hashlib.sha256(schema.encode()).hexdigest()[:16]
+    return (
+        f"{stat.st_size} {stat.st_mtime_ns} v{FILTERED_CACHE_VERSION} {schema_digest}"
+    )
+
+
+def _get_filtered_lazy(filtered_path: Path) -> pl.LazyFrame:
+    """
+    Scan filtered comments, converting to a parquet cache on first use.
+
+    The cache lives next to the JSONL (same stem, .parquet suffix) and holds
+    only the FILTERED_SCHEMA columns. A .parquet.key sidecar holds the cache
+    key (see _filtered_cache_key); the parquet is rebuilt whenever the key
+    no longer matches.
+
+    Args:
+        filtered_path: Path to filtered comments JSONL file.
+
+    Returns:
+        LazyFrame over the cached parquet.
+    """
+    parquet_path = filtered_path.with_suffix(".parquet")
+    key_path = filtered_path.with_suffix(".parquet.key")
+    cache_key = _filtered_cache_key(filtered_path)
+
+    if (
+        parquet_path.exists()
+        and key_path.exists()
+        and key_path.read_text().strip() == cache_key
+    ):
+        return pl.scan_parquet(parquet_path)
+
+    logger.info(f"Caching filtered comments to {parquet_path}...")
+    # Drop the old key first so an interrupted rewrite is never trusted
+    key_path.unlink(missing_ok=True)
+    temp_path = parquet_path.with_suffix(".parquet.tmp")
+    pl.scan_ndjson(filtered_path, schema=FILTERED_SCHEMA).sink_parquet(
+        temp_path, compression="zstd"
+    )
+    os.replace(temp_path, parquet_path)
+    key_path.write_text(cache_key + "\n")
+
+    return pl.scan_parquet(parquet_path)
 
 
 def build_sentiment_dataframe(
-    responses_dir: Path, filtered_path: Path, state: dict
-) -> tuple[pl.DataFrame, list[dict]]:
+    responses_dir: Path, filtered_path: Path, state: dict, failed_path: Path
+) -> tuple[pl.LazyFrame, int, int]:
     """
-    Build sentiment DataFrame by joining results with comment metadata.
+    Build sentiment LazyFrame by joining results with comment metadata.
+
+    Each results file is parsed once and cached as parquet (see
+    _load_parsed_results). Token totals and the result count are collected
+    here and failed requests are streamed to failed_path; the join itself
+    stays lazy so the caller can stream it straight to disk.
 
     Args:
         responses_dir: Directory containing batch_NNN_results.jsonl files.
         filtered_path: Path to filtered comments JSONL file.
         state: State dict to update with token totals.
+        failed_path: Path to write failed requests JSONL (only if any).
 
     Returns:
-        Tuple of (sentiment DataFrame, list of failed requests).
+        Tuple of (joined sentiment LazyFrame, number of failed requests,
+        number of successful results before the join).
     """
     # Load all results
     results_files = sorted(responses_dir.glob("batch_*_results.jsonl"))
@@ -273,38 +655,63 @@ def build_sentiment_dataframe(
 
     logger.info(f"Loading results from {len(results_files)} files...")
 
-    all_results = []
-    failed_requests = []
-    total_input_tokens = 0
-    total_output_tokens = 0
+    results_lf = _load_parsed_results(results_files)
+    succeeded_lf = results_lf.filter(pl.col("result_type") == "succeeded")
 
-    for results_file in results_files:
-        with open(results_file) as f:
-            for line in f:
-                if not line.strip():
-                    continue
-                result = json.loads(line)
-
-                if result["result_type"] == "succeeded":
-                    parsed = parse_response(result["content"])
-                    all_results.append(
-                        {
-                            "id": result["custom_id"],
-                            "sentiment": parsed["s"],
-                            "confidence": parsed["c"],
-                            "sentiment_player": parsed.get("p"),
-                            "input_tokens": result["input_tokens"],
-                            "output_tokens": result["output_tokens"],
-                        }
-                    )
-                    total_input_tokens += result["input_tokens"]
-                    total_output_tokens += result["output_tokens"]
-                else:
-                    failed_requests.append(result)
-
-    logger.info(f"Loaded {len(all_results)} successful results")
-    if failed_requests:
-        logger.warning(f"Found {len(failed_requests)} failed requests")
+    parsed_lf = succeeded_lf.select(
+        pl.col("custom_id").alias("id"),
+        pl.col("sentiment"),
+        pl.col("confidence"),
+        pl.col("sentiment_player"),
+        pl.col("input_tokens"),
+        pl.col("output_tokens"),
+    )
+    # Per-type row counts and token sums in one aggregation (<= 4 rows)
+    stats_lf = results_lf.group_by("result_type").agg(
+        pl.len().alias("count"),
+        pl.col("input_tokens").cast(pl.Int64).sum(),
+        pl.col("output_tokens").cast(pl.Int64).sum(),
+    )
+    failed_lf = results_lf.filter(pl.col("result_type") != "succeeded").select(
+        ["custom_id", "result_type", "error"]
+    )
+
+    # Load comments with lazy evaluation
+    logger.info(f"Loading comments from {filtered_path}...")
+    comments_lf = _get_filtered_lazy(filtered_path)
+
+    # Join results with comments (executed when the caller sinks it)
+    joined_lf = (
+        comments_lf.join(parsed_lf, on="id", how="inner")
+        .rename({"id": "comment_id"})
+        .select(OUTPUT_COLUMNS)
+    )
+
+    stats_df = stats_lf.collect(engine="streaming")
+    succeeded_stats = stats_df.filter(pl.col("result_type") == "succeeded")
+    if succeeded_stats.is_empty():
+        results_count, total_input_tokens, total_output_tokens = 0, 0, 0
+    else:
+        succeeded_row = succeeded_stats.row(0, named=True)
+        results_count = succeeded_row["count"]
+        total_input_tokens = succeeded_row["input_tokens"]
+        total_output_tokens = succeeded_row["output_tokens"]
+    failed_stats = stats_df.filter(pl.col("result_type") != "succeeded")
+    failed_count = failed_stats["count"].sum()
+
+    logger.info(f"Loaded {results_count} successful results")
+    if failed_count:
+        failed_counts = ", ".join(
+            f"{count} {result_type}"
+            for result_type, count in failed_stats.sort("result_type")
+            .select("result_type", "count")
+            .iter_rows()
+        )
+        logger.warning(f"Found {failed_count} failed requests ({failed_counts})")
+
+        # Stream failures straight from the parsed results to disk
+        failed_lf.sink_ndjson(failed_path)
+        logger.warning(f"Wrote {failed_count} failed requests to {failed_path}")
 
     # Update state with token totals
     state["total_input_tokens"] = total_input_tokens
@@ -313,36 +720,30 @@ def build_sentiment_dataframe(
         total_input_tokens, total_output_tokens
     )
 
-    # Create results DataFrame
-    results_df = pl.DataFrame(all_results)
+    return joined_lf, failed_count, results_count
 
-    # Load comments with lazy evaluation
-    logger.info(f"Loading comments from {filtered_path}...")
-    comments_df = pl.scan_ndjson(filtered_path).select(
-        [
-            pl.col("id"),
-            pl.col("body"),
-            pl.col("author"),
-            pl.col("author_flair_text"),
-            pl.col("author_flair_css_class"),
-            pl.col("created_utc"),
-            pl.col("score"),
-            pl.col("mentioned_players"),
-        ]
-    )
 
-    # Join results with comments
+def write_sentiment_parquet(
+    joined_lf: pl.LazyFrame, output_path: Path, results_count: int
+) -> int:
+    """
+    Stream the joined sentiment rows to parquet and validate the row count.
+
+    Args:
+        joined_lf: Joined sentiment LazyFrame from build_sentiment_dataframe.
+        output_path: Destination parquet path.
+        results_count: Number of successful results before the join.
+
+    Returns:
+        Number of rows written.
+    """
     logger.info("Joining results with comments...")
-    results_count = len(all_results)
-    joined_df = (
-        comments_df.join(results_df.lazy(), on="id", how="inner")
-        .rename({"id": "comment_id"})
-        .select(OUTPUT_COLUMNS)
-        .collect()
-    )
+    joined_lf.sink_parquet(output_path, compression="zstd", row_group_size=100_000)
+
+    # Row count comes from parquet metadata, no data pages are read
+    joined_count = pl.scan_parquet(output_path).select(pl.len()).collect().item()
 
     # Validate join didn't drop rows
-    joined_count = len(joined_df)
     if joined_count < results_count:
         dropped = results_count - joined_count
         logger.warning(
@@ -350,9 +751,9 @@ def build_sentiment_dataframe(
             f"({dropped / results_count * 100:.1f}% - comments may be missing from filtered file)"
         )
 
-    logger.info(f"Final DataFrame: {joined_count} rows")
+    logger.info(f"Wrote {joined_count} rows to {output_path}")
 
-    return joined_df, failed_requests
+    return joined_count
 
 
 # -----------------------------------------------------------------------------
@@ -372,7 +773,17 @@ def main() -> None:
         type=int,
         default=60,
         metavar="N",
-        help="Seconds between status checks (default: 60)",
+        help="Maximum seconds between status checks (default: 60)",
+    )
+    parser.add_argument(
+        "--min-poll-interval",
+        type=int,
+        default=DEFAULT_MIN_POLL_INTERVAL,
+        metavar="N",
+        help=(
+            "Initial seconds between status checks, backing off to "
+            f"--poll-interval (default: {DEFAULT_MIN_POLL_INTERVAL})"
+        ),
     )
     parser.add_argument(
         "--max-wait",
@@ -418,50 +829,49 @@ def main() -> None:
         sys.exit(1)
 
     logger.info(f"Found {batch_count} batch(es) in state")
+    index = _BatchIndex.from_state(state)
+    journal = StateJournal(state, state_path)
+    responses_dir.mkdir(parents=True, exist_ok=True)
 
     # Handle --no-wait mode
     if args.no_wait:
         logger.info("Running in --no-wait mode (single check)")
 
-        # Update statuses
-        poll_batch_statuses(state)
-        save_state(state, state_path)
+        # Update statuses and download completed batches
+        asyncio.run(check_once(index, journal, responses_dir))
 
-        # Download completed batches
-        downloadable = get_downloadable_batches(state)
-        for batch in downloadable:
-            try:
-                download_batch_results(batch, responses_dir)
-                batch["results_downloaded"] = True
-                save_state(state, state_path)
-            except RuntimeError as e:
-                logger.error(f"Failed to download batch {batch['batch_num']}: {e}")
-
-        pending = get_pending_batches(state)
-        if pending:
-            logger.info(f"{len(pending)} batch(es) still pending")
+        if index.pending:
+            logger.info(f"{len(index.pending)} batch(es) still pending")
         else:
             logger.info("All batches completed!")
 
     else:
         # Poll until complete or timeout
-        logger.info(f"Polling every {args.poll_interval}s (max {args.max_wait}s)...")
-        completed = poll_until_complete(
-            state, state_path, responses_dir, args.poll_interval, args.max_wait
+        logger.info(
+            f"Polling every {args.min_poll_interval}-{args.poll_interval}s "
+            f"(max {args.max_wait}s)..."
+        )
+        completed = asyncio.run(
+            poll_until_complete(
+                index,
+                journal,
+                responses_dir,
+                args.poll_interval,
+                args.max_wait,
+                args.min_poll_interval,
+            )
         )
         if not completed:
             logger.warning("Exiting with pending batches due to timeout")
 
-    # Check if we can build the final output
-    pending = get_pending_batches(state)
-    not_downloaded = [
-        b for b in state.get("batches", []) if not b.get("results_downloaded", False)
-    ]
+    # Fold the logged deltas back into a full snapshot
+    journal.snapshot()
 
-    if pending or not_downloaded:
+    # Check if we can build the final output
+    if index.not_downloaded:
         logger.info(
-            f"Cannot build final output: {len(pending)} pending, "
-            f"{len(not_downloaded)} not downloaded"
+            f"Cannot build final output: {len(index.pending)} pending, "
+            f"{len(index.not_downloaded)} not downloaded"
         )
         sys.exit(0)
 
@@ -471,23 +881,13 @@ def main() -> None:
     logger.info("=" * 60)
 
     try:
-        sentiment_df, failed_requests = build_sentiment_dataframe(
-            responses_dir, filtered_path, state
+        sentiment_lf, _, results_count = build_sentiment_dataframe(
+            responses_dir, filtered_path, state, failed_path
         )
 
-        # Save parquet
+        # Stream parquet to disk
         processed_dir.mkdir(parents=True, exist_ok=True)
-        sentiment_df.write_parquet(output_path)
-        logger.info(f"Wrote {len(sentiment_df)} rows to {output_path}")
-
-        # Save failed requests
-        if failed_requests:
-            with open(failed_path, "w") as f:
-                for req in failed_requests:
-                    f.write(json.dumps(req) + "\n")
-            logger.warning(
-                f"Wrote {len(failed_requests)} failed requests to {failed_path}"
-            )
+        write_sentiment_parquet(sentiment_lf, output_path, results_count)
 
         # Update and save final state
         save_state(state, state_path)
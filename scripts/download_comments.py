@@ -17,12 +17,21 @@ Usage:
     # Combine options
     uv run python -m scripts.download_comments --subreddit nba --force
 
+    # Download more subreddits at once (or set CONCURRENCY in the environment)
+    uv run python -m scripts.download_comments --concurrency 8
+
 Design decisions:
-    - Sequential downloads (one subreddit at a time) to respect the free API
+    - Concurrent downloads (asyncio + aiohttp), capped by a semaphore at
+      ARCTIC_SHIFT_MAX_CONCURRENT_SUBREDDITS to respect the free API
     - Pagination via created_utc ascending - simple and reliable
-    - Progress saved after each subreddit completes (resumable)
+    - Progress logged after each subreddit completes, and checkpointed every
+      WRITE_BATCH_SIZE comments within a subreddit (resumable mid-download);
+      events are appended to .progress.log and compacted into .progress.json
+      at startup and exit
     - Rate limit headers checked to avoid hitting limits
-    - Configurable delay between requests (default 0.5s)
+    - Requests paced across the remaining rate limit quota (fixed 0.5s delay
+      only when the API omits rate limit headers); concurrency backs off
+      (AIMD) on 429/5xx
 
 Known limitations:
     - Pagination uses timestamp + 1 second to avoid refetching the same comment.
@@ -33,16 +42,26 @@ Known limitations:
 """
 
 import argparse
+import asyncio
 import json
 import logging
+import os
 import sys
 import time
-from datetime import datetime
+from collections.abc import Callable
+from datetime import date, datetime
 from pathlib import Path
 from typing import Any
 
-from pipeline.arctic_shift import ArcticShiftClient
-from utils.constants import ARCTIC_SHIFT_PAGE_SIZE, PROGRESS_FILENAME
+import orjson
+import zstandard
+
+from pipeline.arctic_shift_async import ArcticShiftAsyncClient
+from utils.constants import (
+    ARCTIC_SHIFT_MAX_CONCURRENT_SUBREDDITS,
+    ARCTIC_SHIFT_PAGE_SIZE,
+    PROGRESS_FILENAME,
+)
 from utils.formatting import format_duration
 from utils.paths import get_raw_dir
 from utils.season_config import load_season_config
@@ -58,6 +77,20 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Comments serialized per write() call (10 pages). Each batch is compressed
+# into its own zstd frame and is also a resume checkpoint.
+WRITE_BATCH_SIZE = ARCTIC_SHIFT_PAGE_SIZE * 10
+OUTPUT_ZSTD_LEVEL = 3
+
+# Serialized batches buffered between the fetching and writing coroutines
+WRITE_QUEUE_SIZE = 2
+
+# Append-only progress events next to the snapshot, e.g. .progress.log
+PROGRESS_LOG_SUFFIX = ".log"
+
+# posix_fadvise is Linux/Unix only; page cache hints are skipped elsewhere
+HAS_FADVISE = hasattr(os, "posix_fadvise")
+
 
 # -----------------------------------------------------------------------------
 # Helper functions
@@ -72,7 +105,8 @@ def date_to_epoch(date_str: str) -> int:
     Returns:
         Unix timestamp (seconds since epoch)
     """
-    dt = datetime.strptime(date_str, "%Y-%m-%d")
+    # fromisoformat is C-implemented; strptime re-parses the format each call
+    dt = datetime.fromisoformat(date_str)
     return int(dt.timestamp())
 
 
@@ -84,84 +118,258 @@ def load_progress(progress_path: Path) -> dict[str, Any]:
         {
             "completed": ["subreddit1", "subreddit2"],
             "in_progress": {
-                "subreddit3": {"last_timestamp": 1234567890, "count": 50000}
+                "subreddit3": {
+                    "last_timestamp": 1234567890,
+                    "count": 50000,
+                    "offset": 1048576
+                }
             }
         }
 
-    Returns empty structure if file doesn't exist (fresh start).
+    The snapshot is read first, then any events appended to the progress
+    log since are replayed on top. Returns empty structure if neither file
+    exists (fresh start).
     """
     if progress_path.exists():
         with open(progress_path, "r") as f:
-            return json.load(f)
-    return {"completed": [], "in_progress": {}}
+            progress = json.load(f)
+    else:
+        progress = {"completed": [], "in_progress": {}}
+
+    _replay_progress_log(progress, _progress_log_path(progress_path))
+    return progress
 
 
 def save_progress(progress_path: Path, progress: dict[str, Any]) -> None:
     """
-    Save download progress to disk.
+    Save a full progress snapshot to disk.
 
-    Called after each subreddit completes so we can resume on failure.
+    Writes to a temp sibling and renames it into place so an interrupt never
+    leaves a truncated file. The progress log is removed once the snapshot
+    is in place, compacting it to the latest state per subreddit.
     """
-    with open(progress_path, "w") as f:
+    tmp_path = progress_path.with_suffix(progress_path.suffix + ".tmp")
+    with open(tmp_path, "w") as f:
         json.dump(progress, f, indent=2)
+    os.replace(tmp_path, progress_path)
+
+    # Snapshot now covers every logged event
+    _progress_log_path(progress_path).unlink(missing_ok=True)
     logger.debug(f"Progress saved to {progress_path}")
 
 
+def _progress_log_path(progress_path: Path) -> Path:
+    """Return the append-only event log stored next to the progress file."""
+    return progress_path.with_suffix(PROGRESS_LOG_SUFFIX)
+
+
+def _replay_progress_log(progress: dict[str, Any], log_path: Path) -> None:
+    """
+    Apply logged progress events to progress in order.
+
+    Events are either {"event": "checkpoint", "subreddit", "last_timestamp",
+    "count", "offset"} or {"event": "complete", "subreddit"}. A truncated
+    final line (crash mid-append) is ignored.
+
+    Args:
+        progress: Progress dict to update in place.
+        log_path: Path to the progress log.
+    """
+    if not log_path.exists():
+        return
+
+    in_progress = progress.setdefault("in_progress", {})
+    with open(log_path, "rb") as f:
+        for line in f:
+            try:
+                event = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                continue
+            subreddit = event["subreddit"]
+            if event["event"] == "complete":
+                in_progress.pop(subreddit, None)
+                if subreddit not in progress["completed"]:
+                    progress["completed"].append(subreddit)
+            else:
+                # Checkpoints logged before offsets were recorded lack one
+                in_progress[subreddit] = {
+                    key: value
+                    for key, value in event.items()
+                    if key not in ("event", "subreddit")
+                }
+
+
+def append_progress_event(progress_path: Path, event: dict[str, Any]) -> None:
+    """
+    Append a single progress event to the progress log.
+
+    One small append per checkpoint instead of rewriting the whole progress
+    file; load_progress replays the log and save_progress compacts it.
+
+    Args:
+        progress_path: Path to progress JSON file (the log sits next to it).
+        event: Checkpoint or completion event (see _replay_progress_log).
+    """
+    with open(_progress_log_path(progress_path), "ab") as f:
+        f.write(orjson.dumps(event) + b"\n")
+
+
 # -----------------------------------------------------------------------------
 # Download logic
 # -----------------------------------------------------------------------------
-def download_subreddit(
-    client: ArcticShiftClient,
+async def download_subreddit(
+    client: ArcticShiftAsyncClient,
     subreddit: str,
     output_path: Path,
     start_timestamp: int,
     end_timestamp: int,
     resume_from: int | None = None,
+    resume_offset: int | None = None,
+    progress_callback: Callable[[int, int, int], None] | None = None,
 ) -> int:
     """
     Download all comments for a subreddit within the date range.
 
-    Uses ArcticShiftClient's generator-based API for memory-efficient
-    streaming to disk.
+    Uses ArcticShiftAsyncClient's async generator API for memory-efficient
+    streaming to disk. Comments are serialized with orjson and written in
+    batches of WRITE_BATCH_SIZE lines, one write() per batch. Each batch is
+    a self-contained zstd frame; frames concatenate, so resuming simply
+    appends new frames and the file decompresses as one JSONL stream. A
+    resume first truncates the file back to the checkpointed byte offset,
+    dropping any frame a crash left half-written, which would otherwise
+    corrupt every frame appended after it.
+
+    Fetching and writing run as a producer/consumer pair joined by a queue of
+    at most WRITE_QUEUE_SIZE batches: the producer keeps paginating while the
+    consumer writes the previous batch in a worker thread, so disk latency
+    hides behind the next HTTP round trip and memory stays bounded.
+
+    After each full batch is flushed, progress_callback receives the
+    timestamp of the last comment on disk, the running count and the file
+    size in bytes. Batches are
+    written and checkpointed strictly in order, so the checkpoint always
+    matches the file contents and a resume neither skips nor duplicates
+    whole batches.
 
     Args:
-        client: ArcticShiftClient instance
+        client: ArcticShiftAsyncClient instance
         subreddit: Subreddit name
-        output_path: Path to write JSONL file
+        output_path: Path to write zstd-compressed JSONL file
         start_timestamp: Start of date range (Unix timestamp)
         end_timestamp: End of date range (Unix timestamp)
-        resume_from: If resuming, the timestamp to continue from
+        resume_from: If resuming, the last checkpointed timestamp; download
+            continues from the following second
+        resume_offset: If resuming, the file size at that checkpoint; None
+            (a checkpoint without one) appends to the file as it is
+        progress_callback: Called as (last_timestamp, count, offset) per
+            flushed batch
 
     Returns:
         Total number of comments downloaded
     """
-    # Use resume timestamp if provided, otherwise start from beginning
-    after_timestamp = resume_from if resume_from else start_timestamp
+    # Use resume timestamp if provided, otherwise start from beginning.
+    # Resume one second past the checkpoint, matching the pagination cursor.
+    after_timestamp = resume_from + 1 if resume_from else start_timestamp
     total_count = 0
-    last_timestamp = after_timestamp
+    # Output file size, i.e. where the next frame starts
+    offset = 0
+
+    # Append if resuming, truncate if fresh
+    flags = os.O_WRONLY | os.O_CREAT | (os.O_APPEND if resume_from else os.O_TRUNC)
 
-    # Open in append mode if resuming, write mode if fresh
-    mode = "a" if resume_from else "w"
+    # (lines, last_timestamp, count, is_full_batch); None marks the end
+    queue: asyncio.Queue[tuple[bytes, int, int, bool] | None] = asyncio.Queue(
+        maxsize=WRITE_QUEUE_SIZE
+    )
 
-    with open(output_path, mode) as f:
-        for comment in client.fetch_comments(
+    async def produce() -> None:
+        nonlocal total_count
+        last_timestamp = after_timestamp
+        pending: list[bytes] = []
+
+        async for comment in client.fetch_comments(
             subreddit=subreddit,
             after=after_timestamp,
             before=end_timestamp,
         ):
-            # Write comment to file
-            f.write(json.dumps(comment) + "\n")
+            try:
+                pending.append(orjson.dumps(comment))
+            except TypeError:
+                # Lone surrogates ("\ud83d") orjson cannot encode; json
+                # writes them escaped
+                pending.append(json.dumps(comment).encode())
             total_count += 1
 
-            # Track last timestamp for progress logging
+            # Track last timestamp for progress logging and checkpoints
             last_timestamp = comment.get("created_utc", last_timestamp)
 
-            # Progress logging every 1000 comments
-            if total_count % (ARCTIC_SHIFT_PAGE_SIZE * 10) == 0:
-                logger.info(
-                    f"  Progress: {total_count:,} comments "
-                    f"(up to {datetime.fromtimestamp(last_timestamp).date()})"
-                )
+            if len(pending) >= WRITE_BATCH_SIZE:
+                batch = b"\n".join(pending) + b"\n"
+                pending.clear()
+                await queue.put((batch, last_timestamp, total_count, True))
+
+        if pending:
+            batch = b"\n".join(pending) + b"\n"
+            await queue.put((batch, last_timestamp, total_count, False))
+        await queue.put(None)
+
+    compressor = zstandard.ZstdCompressor(level=OUTPUT_ZSTD_LEVEL)
+
+    def write_batch(fd: int, batch: bytes) -> int:
+        # zstd releases the GIL, so compression also runs off the event loop.
+        # Each frame goes straight to the fd, with no file-object buffer to
+        # flush, so it is on disk (in the kernel) before the checkpoint.
+        frame = memoryview(compressor.compress(batch))
+        size = len(frame)
+        while frame:
+            frame = frame[os.write(fd, frame) :]
+        return size
+
+    # The batch being written in a worker thread. A thread cannot be
+    # cancelled, so the fd must stay open until it finishes.
+    write_task: asyncio.Task[int] | None = None
+
+    async def consume(fd: int) -> None:
+        nonlocal offset, write_task
+        while (item := await queue.get()) is not None:
+            batch, last_timestamp, count, is_full_batch = item
+            write_task = asyncio.create_task(asyncio.to_thread(write_batch, fd, batch))
+            offset += await asyncio.shield(write_task)
+            if not is_full_batch:
+                continue
+
+            if progress_callback:
+                progress_callback(last_timestamp, count, offset)
+
+            # Progress logging once per flushed batch (every 1000 comments)
+            logger.info(
+                f"  Progress: {count:,} comments "
+                f"(up to {date.fromtimestamp(last_timestamp)})"
+            )
+
+    fd = os.open(output_path, flags, 0o644)
+    try:
+        if resume_from:
+            # O_APPEND writes land at the new end of file
+            if resume_offset is not None:
+                os.ftruncate(fd, resume_offset)
+            offset = os.fstat(fd).st_size
+
+        # A failure on either side cancels the other and propagates
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(produce())
+            tg.create_task(consume(fd))
+    finally:
+        # On cancellation, wait out a write already in its thread. A frame it
+        # completes is not checkpointed, so the next resume truncates it.
+        if write_task is not None:
+            await asyncio.wait([write_task])
+
+        # Raw output is write-once here and read much later by another
+        # stage, so don't let it crowd the page cache
+        if HAS_FADVISE:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        os.close(fd)
 
     if total_count == 0:
         logger.info(f"  No comments found after {after_timestamp}")
@@ -169,6 +377,159 @@ def download_subreddit(
     return total_count
 
 
+async def download_one(
+    client: ArcticShiftAsyncClient,
+    semaphore: asyncio.Semaphore,
+    subreddit: str,
+    raw_dir: Path,
+    progress: dict[str, Any],
+    progress_path: Path,
+    session_stats: dict[str, dict[str, float]],
+    start_timestamp: int,
+    end_timestamp: int,
+) -> None:
+    """
+    Download one subreddit under the concurrency cap and record completion.
+
+    Progress is mutated and logged synchronously on the event loop thread
+    with no await in between, so each update is already a critical section:
+    concurrent tasks never interleave appends to the progress log and no
+    lock is needed. Output files are per-subreddit, so writes are disjoint.
+
+    Args:
+        client: Shared ArcticShiftAsyncClient instance
+        semaphore: Caps how many subreddits download at once
+        subreddit: Subreddit name
+        raw_dir: Directory for r_<subreddit>_comments.jsonl.zst output
+        progress: Progress dict (mutated in place)
+        progress_path: Where progress is persisted
+        session_stats: Per-subreddit count/duration (mutated in place)
+        start_timestamp: Start of date range (Unix timestamp)
+        end_timestamp: End of date range (Unix timestamp)
+    """
+    async with semaphore:
+        output_path = raw_dir / f"r_{subreddit}_comments.jsonl.zst"
+
+        # Check if we're resuming mid-download
+        resume_from = None
+        resume_offset = None
+        resumed_count = 0
+        if subreddit in progress.get("in_progress", {}):
+            resume_info = progress["in_progress"][subreddit]
+            resume_from = resume_info.get("last_timestamp")
+            resume_offset = resume_info.get("offset")
+            resumed_count = resume_info.get("count", 0)
+            logger.info(
+                f"Resuming {subreddit} from {resume_from} "
+                f"({resumed_count:,} comments so far)"
+            )
+        else:
+            logger.info(f"Starting {subreddit}...")
+
+        def checkpoint(last_timestamp: int, count: int, offset: int) -> None:
+            progress.setdefault("in_progress", {})[subreddit] = {
+                "last_timestamp": last_timestamp,
+                "count": resumed_count + count,
+                "offset": offset,
+            }
+            append_progress_event(
+                progress_path,
+                {
+                    "event": "checkpoint",
+                    "subreddit": subreddit,
+                    "last_timestamp": last_timestamp,
+                    "count": resumed_count + count,
+                    "offset": offset,
+                },
+            )
+
+        try:
+            sub_start_time = time.time()
+
+            count = await download_subreddit(
+                client=client,
+                subreddit=subreddit,
+                output_path=output_path,
+                start_timestamp=start_timestamp,
+                end_timestamp=end_timestamp,
+                resume_from=resume_from,
+                resume_offset=resume_offset,
+                progress_callback=checkpoint,
+            )
+
+            sub_elapsed = time.time() - sub_start_time
+
+        except Exception as e:
+            # Checkpoints are already in the progress log, so we can resume
+            logger.error(f"Failed on {subreddit}: {e}")
+            raise
+
+    # Mark as complete
+    progress["completed"].append(subreddit)
+    if subreddit in progress.get("in_progress", {}):
+        del progress["in_progress"][subreddit]
+
+    session_stats[subreddit] = {"count": count, "duration": sub_elapsed}
+
+    # Calculate throughput
+    throughput = count / sub_elapsed if sub_elapsed > 0 else 0
+    logger.info(
+        f"Completed {subreddit}: {count:,} comments "
+        f"in {format_duration(sub_elapsed)} ({throughput:.1f} comments/sec)"
+    )
+
+    # Log completion after each subreddit
+    append_progress_event(progress_path, {"event": "complete", "subreddit": subreddit})
+
+
+async def download_all(
+    subreddits: list[str],
+    raw_dir: Path,
+    progress: dict[str, Any],
+    progress_path: Path,
+    session_stats: dict[str, dict[str, float]],
+    start_timestamp: int,
+    end_timestamp: int,
+    max_concurrent: int = ARCTIC_SHIFT_MAX_CONCURRENT_SUBREDDITS,
+) -> None:
+    """
+    Download subreddits concurrently through one pooled client.
+
+    Downloads are network-bound, so overlapping them cuts wall-clock time.
+    If any subreddit fails, the TaskGroup cancels the rest and the error
+    propagates; subreddits that already finished stay marked complete.
+
+    Args:
+        subreddits: Subreddits still to download
+        raw_dir: Directory for output files
+        progress: Progress dict (mutated in place)
+        progress_path: Where progress is persisted
+        session_stats: Per-subreddit count/duration (mutated in place)
+        start_timestamp: Start of date range (Unix timestamp)
+        end_timestamp: End of date range (Unix timestamp)
+        max_concurrent: Max subreddits downloading at once
+    """
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    # Use client as context manager for automatic cleanup
+    async with ArcticShiftAsyncClient() as client:
+        async with asyncio.TaskGroup() as tg:
+            for subreddit in subreddits:
+                tg.create_task(
+                    download_one(
+                        client=client,
+                        semaphore=semaphore,
+                        subreddit=subreddit,
+                        raw_dir=raw_dir,
+                        progress=progress,
+                        progress_path=progress_path,
+                        session_stats=session_stats,
+                        start_timestamp=start_timestamp,
+                        end_timestamp=end_timestamp,
+                    )
+                )
+
+
 def main() -> None:
     """
     Main entry point - download all target subreddits.
@@ -176,10 +537,8 @@ def main() -> None:
     Flow:
         1. Parse CLI arguments
         2. Load progress (skip completed subreddits, unless --force)
-        3. For each incomplete subreddit:
-           a. Download all comments
-           b. Mark as complete
-           c. Save progress
+        3. Download incomplete subreddits concurrently (see download_all); each
+           one is marked complete in the progress log as soon as it finishes
         4. Print summary
     """
     # Parse CLI arguments
@@ -196,6 +555,13 @@ def main() -> None:
         action="store_true",
         help="Ignore progress file and start fresh",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=int(os.getenv("CONCURRENCY", ARCTIC_SHIFT_MAX_CONCURRENT_SUBREDDITS)),
+        help="Subreddits to download at once (default: $CONCURRENCY or "
+        f"{ARCTIC_SHIFT_MAX_CONCURRENT_SUBREDDITS})",
+    )
     args = parser.parse_args()
 
     # Setup paths
@@ -211,6 +577,9 @@ def main() -> None:
     else:
         progress = load_progress(progress_path)
 
+    # Start from a compact snapshot (and drop stale events on --force)
+    save_progress(progress_path, progress)
+
     # Load season config
     season_cfg = load_season_config()
     configured_subs = season_cfg["subreddits"]
@@ -218,7 +587,7 @@ def main() -> None:
     # Determine which subreddits to download
     if args.subreddit:
         # Single subreddit mode (for testing)
-        if args.subreddit.lower() not in [s.lower() for s in configured_subs]:
+        if args.subreddit.lower() not in {s.lower() for s in configured_subs}:
             logger.warning(
                 f"'{args.subreddit}' is not in configured subreddits. "
                 "Proceeding anyway (might be intentional for testing)."
@@ -236,83 +605,46 @@ def main() -> None:
     logger.info("=" * 60)
     logger.info(f"Date range: {season_cfg['start_date']} to {season_cfg['end_date']}")
     logger.info(f"Subreddits to process: {len(targets)}")
+    logger.info(f"Concurrency: {args.concurrency}")
     logger.info(f"Output dir: {raw_dir}")
     if not args.force:
         logger.info(f"Already completed: {len(progress['completed'])}")
     logger.info("=" * 60)
 
+    # Skip if already completed (unless in single-sub mode with --force)
+    # Set lookup keeps the resume check O(1) per subreddit
+    completed = set(progress["completed"])
+    pending = []
+    for subreddit in targets:
+        if subreddit in completed and not args.force:
+            logger.info(f"Skipping {subreddit} (already complete)")
+            continue
+        pending.append(subreddit)
+
     # Track stats and timing for summary
     session_start_time = time.time()
     session_stats: dict[str, dict[str, float]] = {}
 
-    # Use client as context manager for automatic cleanup
-    with ArcticShiftClient() as client:
-        for subreddit in targets:
-            # Skip if already completed (unless in single-sub mode with --force)
-            if subreddit in progress["completed"] and not args.force:
-                logger.info(f"Skipping {subreddit} (already complete)")
-                continue
-
-            output_path = raw_dir / f"r_{subreddit}_comments.jsonl"
-
-            # Check if we're resuming mid-download
-            resume_from = None
-            if subreddit in progress.get("in_progress", {}):
-                resume_info = progress["in_progress"][subreddit]
-                resume_from = resume_info.get("last_timestamp")
-                logger.info(
-                    f"Resuming {subreddit} from {resume_from} "
-                    f"({resume_info.get('count', 0):,} comments so far)"
-                )
-            else:
-                logger.info(f"Starting {subreddit}...")
-
-            # Download!
-            try:
-                sub_start_time = time.time()
-
-                count = download_subreddit(
-                    client=client,
-                    subreddit=subreddit,
-                    output_path=output_path,
-                    start_timestamp=start_ts,
-                    end_timestamp=end_ts,
-                    resume_from=resume_from,
-                )
-
-                sub_elapsed = time.time() - sub_start_time
-
-                # Mark as complete
-                progress["completed"].append(subreddit)
-                if subreddit in progress.get("in_progress", {}):
-                    del progress["in_progress"][subreddit]
-
-                session_stats[subreddit] = {"count": count, "duration": sub_elapsed}
-
-                # Calculate throughput
-                throughput = count / sub_elapsed if sub_elapsed > 0 else 0
-                logger.info(
-                    f"Completed {subreddit}: {count:,} comments "
-                    f"in {format_duration(sub_elapsed)} ({throughput:.1f} comments/sec)"
-                )
-
-            except KeyboardInterrupt:
-                logger.warning("\nInterrupted! Saving progress...")
-                # Save partial progress
-                if subreddit not in progress.get("in_progress", {}):
-                    progress["in_progress"] = progress.get("in_progress", {})
-                # Note: We could track last_timestamp here for better resume
-                save_progress(progress_path, progress)
-                sys.exit(1)
-
-            except Exception as e:
-                logger.error(f"Failed on {subreddit}: {e}")
-                # Save progress so we can resume
-                save_progress(progress_path, progress)
-                raise
+    try:
+        asyncio.run(
+            download_all(
+                subreddits=pending,
+                raw_dir=raw_dir,
+                progress=progress,
+                progress_path=progress_path,
+                session_stats=session_stats,
+                start_timestamp=start_ts,
+                end_timestamp=end_ts,
+                max_concurrent=args.concurrency,
+            )
+        )
+    except KeyboardInterrupt:
+        logger.warning("\nInterrupted! Saving progress...")
+        # In-progress subreddits keep their last checkpoint for resume
+        save_progress(progress_path, progress)
+        sys.exit(1)
 
-            # Save progress after each subreddit
-            save_progress(progress_path, progress)
+    save_progress(progress_path, progress)
 
     # Summary
     session_elapsed = time.time() - session_start_time
@@ -322,8 +654,10 @@ def main() -> None:
     logger.info("=" * 60)
 
     total_comments = sum(s["count"] for s in session_stats.values())
-    total_duration = sum(s["duration"] for s in session_stats.values())
-    overall_throughput = total_comments / total_duration if total_duration > 0 else 0
+    # Subreddits overlap, so throughput is measured against wall-clock time
+    overall_throughput = (
+        total_comments / session_elapsed if session_elapsed > 0 else 0
+    )
 
     logger.info(
         f"This session: {len(session_stats)} subreddits, {total_comments:,} comments"
@@ -5,6 +5,12 @@ This script downloads posts from r/nba for the active NBA season.
 Unlike download_comments.py, this script does not support resume - if interrupted,
 delete the output file and restart.
 
+The season is split into POST_WINDOW_SECONDS time windows that are paginated
+concurrently (at most ARCTIC_SHIFT_MAX_CONCURRENT_POST_WINDOWS at once) through the async
+client; a single writer task appends every post, trimmed to POST_FIELDS,
+to the output file. Posts are therefore grouped by window, not globally
+sorted by created_utc.
+
 Usage:
     # Download posts
     uv run python -m scripts.download_posts
@@ -14,13 +20,18 @@ Usage:
 """
 
 import argparse
+import asyncio
 import json
 import logging
+import os
 import time
 from datetime import datetime
 from pathlib import Path
 
-from pipeline.arctic_shift import ArcticShiftClient
+import orjson
+
+from pipeline.arctic_shift_async import ArcticShiftAsyncClient
+from utils.constants import ARCTIC_SHIFT_MAX_CONCURRENT_POST_WINDOWS, POST_FIELDS
 from utils.formatting import format_duration
 from utils.paths import get_raw_dir
 from utils.season_config import load_season_config
@@ -36,6 +47,14 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Time window paginated by one task (one week)
+POST_WINDOW_SECONDS = 7 * 24 * 60 * 60
+
+# Posts handed from a window task to the writer at a time, and the number of
+# such batches buffered between them
+POST_BATCH_SIZE = 1000
+POST_QUEUE_SIZE = 8
+
 
 # -----------------------------------------------------------------------------
 # Helper functions
@@ -50,15 +69,35 @@ def date_to_epoch(date_str: str) -> int:
     Returns:
         Unix timestamp (seconds since epoch).
     """
-    dt = datetime.strptime(date_str, "%Y-%m-%d")
+    # fromisoformat is C-implemented; strptime re-parses the format each call
+    dt = datetime.fromisoformat(date_str)
     return int(dt.timestamp())
 
 
 # -----------------------------------------------------------------------------
 # Download logic
 # -----------------------------------------------------------------------------
-def download_posts(
-    client: ArcticShiftClient,
+def split_time_range(start: int, end: int, window: int) -> list[tuple[int, int]]:
+    """
+    Split [start, end) into consecutive (after, before) windows.
+
+    The API's ``after`` is inclusive and ``before`` exclusive (pagination
+    resumes at last timestamp + 1), so adjacent windows neither overlap
+    nor leave gaps.
+
+    Args:
+        start: Start of range (Unix timestamp).
+        end: End of range (Unix timestamp).
+        window: Window length in seconds.
+
+    Returns:
+        List of (after, before) pairs covering the range.
+    """
+    return [(after, min(after + window, end)) for after in range(start, end, window)]
+
+
+async def download_posts(
+    client: ArcticShiftAsyncClient,
     subreddit: str,
     output_path: Path,
     start_timestamp: int,
@@ -67,11 +106,13 @@ def download_posts(
     """
     Download all posts for a subreddit within the date range.
 
-    Uses ArcticShiftClient's generator-based API for memory-efficient
-    streaming to disk.
+    Windows of POST_WINDOW_SECONDS are paginated concurrently, bounded by a
+    semaphore; retries and backoff come from ArcticShiftAsyncClient. Posts
+    are passed in batches through a bounded queue to one writer task, so
+    only one coroutine ever touches the output file.
 
     Args:
-        client: ArcticShiftClient instance.
+        client: ArcticShiftAsyncClient instance.
         subreddit: Subreddit name to download from.
         output_path: Path to write JSONL file.
         start_timestamp: Start of date range (Unix timestamp).
@@ -80,30 +121,105 @@ def download_posts(
     Returns:
         Total number of posts downloaded.
     """
+    semaphore = asyncio.Semaphore(ARCTIC_SHIFT_MAX_CONCURRENT_POST_WINDOWS)
+    queue: asyncio.Queue[list[dict] | None] = asyncio.Queue(maxsize=POST_QUEUE_SIZE)
     total_count = 0
-    last_timestamp = start_timestamp
-
-    with open(output_path, "w") as f:
-        for post in client.fetch_posts(
-            subreddit=subreddit,
-            after=start_timestamp,
-            before=end_timestamp,
-        ):
-            f.write(json.dumps(post) + "\n")
-            total_count += 1
 
-            last_timestamp = post.get("created_utc", last_timestamp)
-
-            # Progress logging every 1000 posts
-            if total_count % 1000 == 0:
+    async def fetch_window(after: int, before: int) -> None:
+        async with semaphore:
+            batch: list[dict] = []
+            async for post in client.fetch_posts(
+                subreddit=subreddit,
+                after=after,
+                before=before,
+            ):
+                batch.append(post)
+                if len(batch) >= POST_BATCH_SIZE:
+                    await queue.put(batch)
+                    batch = []
+            if batch:
+                await queue.put(batch)
+
+    async def fetch_all() -> None:
+        async with asyncio.TaskGroup() as tg:
+            for after, before in split_time_range(
+                start_timestamp, end_timestamp, POST_WINDOW_SECONDS
+            ):
+                tg.create_task(fetch_window(after, before))
+        await queue.put(None)
+
+    def write_batch(fd: int, batch: list[dict]) -> None:
+        # Only POST_FIELDS are kept (raw posts carry ~100 fields). The batch
+        # is serialized and written with os.write, off the event loop
+        lines = []
+        for post in batch:
+            record = {field: post.get(field) for field in POST_FIELDS}
+            try:
+                lines.append(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+            except TypeError:
+                # Lone surrogates ("\ud83d") orjson cannot encode; json
+                # writes them escaped
+                lines.append(json.dumps(record).encode() + b"\n")
+        data = memoryview(b"".join(lines))
+        while data:
+            data = data[os.write(fd, data) :]
+
+    # The batch being written in a worker thread. A thread cannot be
+    # cancelled, so the fd must stay open until it finishes.
+    write_task: asyncio.Task[None] | None = None
+
+    async def write_all(fd: int) -> None:
+        nonlocal total_count, write_task
+        last_timestamp = start_timestamp
+
+        while (batch := await queue.get()) is not None:
+            write_task = asyncio.create_task(asyncio.to_thread(write_batch, fd, batch))
+            await asyncio.shield(write_task)
+            previous_count = total_count
+            total_count += len(batch)
+
+            # Progress logging every 1000 posts (only these need the
+            # post's timestamp, so it is not tracked per post)
+            if total_count // 1000 > previous_count // 1000:
+                last_timestamp = batch[-1].get("created_utc", last_timestamp)
                 logger.info(
                     f"  Progress: {total_count:,} posts "
-                    f"(up to {datetime.fromtimestamp(last_timestamp).date()})"
+                    f"(latest {datetime.fromtimestamp(last_timestamp).date()})"
                 )
 
+    fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        # A failure on either side cancels the other and propagates
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(fetch_all())
+            tg.create_task(write_all(fd))
+    finally:
+        # On cancellation, wait out a write already in its thread
+        if write_task is not None:
+            await asyncio.wait([write_task])
+        os.close(fd)
+
     return total_count
 
 
+async def run_download(
+    subreddit: str,
+    output_path: Path,
+    start_timestamp: int,
+    end_timestamp: int,
+) -> int:
+    """Open a pooled async client and download posts through it."""
+    # Use client as context manager for automatic cleanup
+    async with ArcticShiftAsyncClient() as client:
+        return await download_posts(
+            client=client,
+            subreddit=subreddit,
+            output_path=output_path,
+            start_timestamp=start_timestamp,
+            end_timestamp=end_timestamp,
+        )
+
+
 def main() -> None:
     """
     Main entry point - download r/nba posts.
@@ -160,14 +276,14 @@ def main() -> None:
 
     start_time = time.time()
 
-    with ArcticShiftClient() as client:
-        count = download_posts(
-            client=client,
+    count = asyncio.run(
+        run_download(
             subreddit=subreddit,
             output_path=output_path,
             start_timestamp=start_ts,
             end_timestamp=end_ts,
         )
+    )
 
     elapsed = time.time() - start_time
     throughput = count / elapsed if elapsed > 0 else 0
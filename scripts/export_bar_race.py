@@ -12,11 +12,12 @@ Usage:
 """
 
 import argparse
-import json
 import logging
 import sys
 from pathlib import Path
 
+import orjson
+
 from pipeline.aggregation import (
     compute_cumulative_metrics,
     pivot_bar_race_wide,
@@ -108,9 +109,8 @@ def main() -> None:
     logger.info(f"Min entry comments:   {args.min_entry_comments}")
     logger.info("=" * 60)
 
-    # Load aggregates
-    with open(input_path) as f:
-        data = json.load(f)
+    # Load aggregates (one read, parsed in C)
+    data = orjson.loads(input_path.read_bytes())
 
     # Transform
     cumulative = compute_cumulative_metrics(data["player_temporal"])
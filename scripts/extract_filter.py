@@ -6,19 +6,33 @@ validates comment bodies, and outputs clean JSONL for downstream processing.
 
 Usage:
     uv run python scripts/extract_filter.py data/raw/RC_2024-12.zst data/filtered/RC_2024-12_filtered.jsonl
+
+    # Several archives in parallel, one worker process per file
+    uv run python scripts/extract_filter.py data/raw/RC_2024-*.zst data/filtered/ --workers 4
 """
 
 import argparse
+import io
 import json
 import logging
+import mmap
+import os
+import re
 import sys
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
+from typing import BinaryIO
 
+import orjson
 import zstandard
 from tqdm import tqdm
 
-from pipeline.processors import CommentPipeline, has_valid_body, extract_fields
-from utils.constants import TARGET_SUBREDDITS
+from utils.constants import (
+    INVALID_BODY_VALUES,
+    REQUIRED_FIELDS,
+    TARGET_SUBREDDITS,
+)
 
 logging.basicConfig(
     level=logging.INFO,
@@ -27,6 +41,23 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Decompressed read buffer, and bytes of complete lines handled per batch
+READ_BUFFER_SIZE = 1024 * 1024
+READ_BATCH_BYTES = 1024 * 1024 * 16
+
+# madvise is Unix-only; elsewhere the mapping just uses default readahead
+HAS_MADVISE = hasattr(mmap, "MADV_SEQUENTIAL")
+
+# Output file buffer, and the serialized bytes gathered before each write()
+OUTPUT_BUFFER_SIZE = 4 * 1024 * 1024
+OUTPUT_FLUSH_BYTES = 1024 * 1024
+
+# The subreddit field of a raw JSON line, and the lowercased target names as
+# bytes. One regex search plus a set lookup costs the same for any number of
+# target subreddits.
+SUBREDDIT_FIELD_PATTERN = re.compile(rb'"subreddit"\s*:\s*"([^"]*)"')
+TARGET_SUBREDDIT_BYTES = frozenset(s.encode() for s in TARGET_SUBREDDITS)
+
 
 # ---------------------------------------------------------------------------
 # Statistics logging
@@ -78,56 +109,115 @@ def is_target_subreddit(comment: dict) -> dict | None:
     return None
 
 
+def may_be_target_subreddit(line: bytes) -> bool:
+    """
+    Cheap raw-bytes check for a target subreddit, run before JSON parsing.
+
+    Reads the "subreddit" field straight from the raw line, so comments from
+    other subreddits are rejected without parsing. A line where the field
+    cannot be found is kept as a candidate; the parsed field is still
+    checked afterwards.
+
+    Args:
+        line: Raw JSON line.
+
+    Returns:
+        False if the line cannot be from a target subreddit.
+    """
+    match = SUBREDDIT_FIELD_PATTERN.search(line)
+    return match is None or match.group(1).lower() in TARGET_SUBREDDIT_BYTES
+
+
 # ---------------------------------------------------------------------------
 # Streaming processing
 # ---------------------------------------------------------------------------
 
 
-def stream_zst_lines(filepath: Path, chunk_size: int = 1024 * 1024 * 16):
+def open_zst_lines(fh: BinaryIO | mmap.mmap) -> io.BufferedReader:
+    """
+    Wrap an open .zst file in a buffered reader over its decompressed bytes.
+
+    Iterating the result (or calling readlines) splits lines in C, so no
+    Python-side buffer or split is needed.
+
+    Args:
+        fh: Compressed file opened in binary mode, or a read-only mmap of it.
+
+    Returns:
+        Buffered binary reader yielding decompressed lines.
+    """
+    decompressor = zstandard.ZstdDecompressor(max_window_size=2**31)
+    return io.BufferedReader(
+        decompressor.stream_reader(fh), buffer_size=READ_BUFFER_SIZE
+    )
+
+
+def stream_zst_lines(
+    filepath: Path, on_progress: Callable[[int], None] | None = None
+) -> Iterator[bytes]:
     """
     Stream lines from a zstandard-compressed file.
 
-    Uses chunked decompression to handle files larger than memory.
+    Uses streaming decompression to handle files larger than memory. The
+    compressed file is memory-mapped, so zstd reads straight from the page
+    cache (no read() syscall or file-object buffer per chunk) and the
+    kernel reads ahead sequentially. Lines stay as bytes (orjson parses
+    them without a decode) and are read READ_BATCH_BYTES at a time, split
+    in C.
 
     Args:
         filepath: Path to .zst file.
-        chunk_size: Bytes to read per chunk (default 16MB).
+        on_progress: Called once per batch with the compressed bytes read
+            since the previous call (e.g. a progress bar's update).
 
     Yields:
-        Individual lines (strings) from the decompressed content.
+        Individual non-blank lines (bytes, newline included).
     """
-    decompressor = zstandard.ZstdDecompressor(max_window_size=2**31)
+    last_position = 0
 
     with open(filepath, "rb") as fh:
-        reader = decompressor.stream_reader(fh)
-        buffer = ""
+        # An empty file cannot be mapped (and has no lines)
+        if os.fstat(fh.fileno()).st_size == 0:
+            return
 
-        while True:
-            chunk = reader.read(chunk_size)
-            if not chunk:
-                break
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if HAS_MADVISE:
+                mm.madvise(mmap.MADV_SEQUENTIAL)
 
-            buffer += chunk.decode("utf-8", errors="replace")
-            lines = buffer.split("\n")
+            reader = open_zst_lines(mm)
+            for lines in iter(lambda: reader.readlines(READ_BATCH_BYTES), []):
+                if on_progress is not None:
+                    position = mm.tell()
+                    on_progress(position - last_position)
+                    last_position = position
 
-            # Last element might be incomplete — keep in buffer
-            buffer = lines[-1]
+                for line in lines:
+                    if line.strip():
+                        yield line
 
-            for line in lines[:-1]:
-                if line.strip():
-                    yield line
 
-
-def parse_json_line(line: str) -> dict | None:
+def parse_json_line(line: str | bytes) -> dict | None:
     """
     Safely parse a JSON line.
 
+    Lines orjson rejects are retried with the stdlib parser, which accepts
+    lone UTF-16 surrogates ("\\ud83d") as real Reddit comments contain.
+    Raw bytes are decoded first with invalid UTF-8 sequences replaced,
+    matching a lenient text decode.
+
     Args:
-        line: Raw JSON string.
+        line: Raw JSON string or bytes.
 
     Returns:
         Parsed dictionary, or None if parsing fails.
     """
+    try:
+        return orjson.loads(line)
+    except orjson.JSONDecodeError:
+        pass
+
+    if isinstance(line, bytes):
+        line = line.decode("utf-8", errors="replace")
     try:
         return json.loads(line)
     except json.JSONDecodeError:
@@ -139,23 +229,34 @@ def parse_json_line(line: str) -> dict | None:
 # ---------------------------------------------------------------------------
 
 
-def process_file(input_path: Path, output_path: Path) -> dict[str, int]:
+def process_file(
+    input_path: Path, output_path: Path, show_progress: bool = True
+) -> dict[str, int]:
     """
     Process a ZST archive file and write filtered JSONL output.
 
     Args:
         input_path: Path to input .zst file.
         output_path: Path to output .jsonl file.
+        show_progress: Draw a tqdm progress bar (off in worker processes).
 
     Returns:
         Stats dict with processing counts.
     """
-    # Build pipeline
-    pipeline = CommentPipeline()
-    pipeline.add_step(is_target_subreddit)
-    pipeline.add_step(has_valid_body)
-    pipeline.add_step(extract_fields)
-
+    # is_target_subreddit -> has_valid_body -> extract_fields, fused into the
+    # loop below with local counters (no per-step calls through
+    # CommentPipeline on every line). Stats keys match the pipeline's. The
+    # inline checks must stay equivalent to those steps in
+    # pipeline.processors; TestProcessFile compares the two.
+    target_subreddits = TARGET_SUBREDDITS
+    invalid_bodies = INVALID_BODY_VALUES
+    fields = REQUIRED_FIELDS
+    append_newline = orjson.OPT_APPEND_NEWLINE
+
+    total_count = 0
+    accepted_count = 0
+    rejected_subreddit_count = 0
+    rejected_body_count = 0
     malformed_count = 0
 
     # Ensure output directory exists
@@ -167,57 +268,108 @@ def process_file(input_path: Path, output_path: Path) -> dict[str, int]:
     # Get file size for progress bar
     file_size = input_path.stat().st_size
 
-    with open(output_path, "w", encoding="utf-8") as out_file:
+    # orjson emits UTF-8 bytes, so write in binary mode. Accepted lines are
+    # gathered in a bytearray and written ~1MB at a time.
+    pending = bytearray()
+
+    with open(output_path, "wb", buffering=OUTPUT_BUFFER_SIZE) as out_file:
         with tqdm(
             total=file_size,
             unit="B",
             unit_scale=True,
             desc="Processing",
+            disable=not show_progress,
+            # Redraw at most once a second over multi-hour runs
+            mininterval=1.0,
+            smoothing=0.1,
         ) as pbar:
-            # Track bytes for progress updates
-            last_position = 0
-
-            with open(input_path, "rb") as in_file:
-                decompressor = zstandard.ZstdDecompressor(max_window_size=2**31)
-                reader = decompressor.stream_reader(in_file)
-                buffer = ""
-                chunk_size = 1024 * 1024 * 16  # 16MB chunks
-
-                while True:
-                    chunk = reader.read(chunk_size)
-                    if not chunk:
-                        break
-
-                    # Update progress bar based on compressed bytes read
-                    current_position = in_file.tell()
-                    pbar.update(current_position - last_position)
-                    last_position = current_position
-
-                    buffer += chunk.decode("utf-8", errors="replace")
-                    lines = buffer.split("\n")
-                    buffer = lines[-1]
-
-                    for line in lines[:-1]:
-                        if not line.strip():
-                            continue
-
-                        comment = parse_json_line(line)
-                        if comment is None:
-                            malformed_count += 1
-                            continue
-
-                        result = pipeline.process(comment)
-                        if result is not None:
-                            out_file.write(json.dumps(result) + "\n")
-
-    # Combine stats
-    stats = pipeline.stats
-    stats["rejected_malformed"] = malformed_count
+            # Progress bar tracks compressed bytes read
+            for line in stream_zst_lines(input_path, on_progress=pbar.update):
+                # Most lines are other subreddits; skip parsing them
+                if not may_be_target_subreddit(line):
+                    total_count += 1
+                    rejected_subreddit_count += 1
+                    continue
+
+                comment = parse_json_line(line)
+                if comment is None:
+                    malformed_count += 1
+                    continue
+
+                total_count += 1
+                get = comment.get
+
+                subreddit = get("subreddit")
+                if not subreddit or subreddit.lower() not in target_subreddits:
+                    rejected_subreddit_count += 1
+                    continue
+
+                body = get("body")
+                if not body or body in invalid_bodies:
+                    rejected_body_count += 1
+                    continue
+
+                accepted_count += 1
+                # One short-lived dict is the cheapest input for orjson;
+                # templating each value separately is slower
+                record = {field: get(field) for field in fields}
+                try:
+                    pending += orjson.dumps(record, option=append_newline)
+                except TypeError:
+                    # Lone surrogates from the stdlib fallback; written escaped
+                    pending += json.dumps(record).encode() + b"\n"
+                if len(pending) >= OUTPUT_FLUSH_BYTES:
+                    out_file.write(pending)
+                    pending.clear()
+
+        out_file.write(pending)
+
+    # Prefiltered lines count as subreddit rejections
+    stats = {
+        "total": total_count,
+        "accepted": accepted_count,
+        "rejected_is_target_subreddit": rejected_subreddit_count,
+        "rejected_has_valid_body": rejected_body_count,
+        "rejected_malformed": malformed_count,
+    }
 
     log_stats_summary(stats)
     return stats
 
 
+def process_files(
+    jobs: list[tuple[Path, Path]], max_workers: int | None = None
+) -> dict[str, int]:
+    """
+    Process several ZST archives in parallel, one worker process per file.
+
+    Archives are independent, so they split cleanly across processes. JSON
+    parsing holds the GIL, which is why this uses processes, not threads.
+
+    Args:
+        jobs: (input .zst path, output .jsonl path) pairs.
+        max_workers: Max worker processes. Defaults to one per CPU.
+
+    Returns:
+        Stats dict with processing counts summed across all files.
+    """
+    totals: dict[str, int] = {}
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(process_file, input_path, output_path, False): input_path
+            for input_path, output_path in jobs
+        }
+        for future in as_completed(futures):
+            stats = future.result()
+            logger.info(f"Finished {futures[future].name}")
+            for key, value in stats.items():
+                totals[key] = totals.get(key, 0) + value
+
+    log_stats_summary(totals)
+    return totals
+
+
 def main():
     """CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -226,23 +378,39 @@ def main():
     parser.add_argument(
         "input",
         type=Path,
-        help="Path to input .zst file",
+        nargs="+",
+        help="Path to input .zst file(s)",
     )
     parser.add_argument(
         "output",
         type=Path,
-        help="Path to output .jsonl file",
+        help="Path to output .jsonl file, or output directory for several inputs",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Archives to process in parallel (default: one per CPU)",
     )
     args = parser.parse_args()
 
-    if not args.input.exists():
-        logger.error(f"Input file not found: {args.input}")
-        sys.exit(1)
+    for input_path in args.input:
+        if not input_path.exists():
+            logger.error(f"Input file not found: {input_path}")
+            sys.exit(1)
+
+        if not input_path.suffix == ".zst":
+            logger.warning(f"Input file does not have .zst extension: {input_path}")
 
-    if not args.input.suffix == ".zst":
-        logger.warning(f"Input file does not have .zst extension: {args.input}")
+    if len(args.input) == 1:
+        process_file(args.input[0], args.output)
+        return
 
-    process_file(args.input, args.output)
+    jobs = [
+        (input_path, args.output / f"{input_path.stem}_filtered.jsonl")
+        for input_path in args.input
+    ]
+    process_files(jobs, max_workers=args.workers)
 
 
 if __name__ == "__main__":
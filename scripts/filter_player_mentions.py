@@ -14,6 +14,9 @@ Usage:
     # Preview first 1K lines (for testing)
     uv run python -m scripts.filter_player_mentions --limit 1000
 
+    # Split the input across 8 worker processes
+    uv run python -m scripts.filter_player_mentions --workers 8
+
 Input: Cleaned JSONL from clean_raw_comments.py
 Output: JSONL with only player-mentioning comments, plus mentioned_players field
 """
@@ -21,13 +24,20 @@ Output: JSONL with only player-mentioning comments, plus mentioned_players field
 import argparse
 import json
 import logging
+import shutil
 import sys
 import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice, pairwise
 from pathlib import Path
+from typing import BinaryIO
 
+import orjson
 from tqdm import tqdm
 
-from pipeline.processors import filter_player_mentions
+from pipeline.processors import filter_player_mentions, find_player_mentions
+from utils.file_io import count_lines, iter_lines, open_sequential
 from utils.formatting import format_duration, format_size
 from utils.paths import get_filtered_dir
 
@@ -50,35 +60,225 @@ logger = logging.getLogger(__name__)
 DEFAULT_INPUT_FILENAME = "r_nba_cleaned.jsonl"
 DEFAULT_OUTPUT_FILENAME = "r_nba_player_mentions.jsonl"
 
+# Serialized output gathered before each write()
+OUTPUT_FLUSH_BYTES = 1024 * 1024
+
+# Raw JSON prefix of the field added to accepted comments
+MENTIONED_PLAYERS_FIELD = b',"mentioned_players":'
+
 
 # -----------------------------------------------------------------------------
 # Core processing
 # -----------------------------------------------------------------------------
 
 
-def count_lines(filepath: Path) -> int:
+def filter_lines(lines: Iterable[bytes], f_out: BinaryIO) -> dict[str, int]:
     """
-    Count lines in a file for progress bar total.
+    Parse JSONL lines, writing those that mention a tracked player.
+
+    An accepted line is written back as its original bytes with the
+    mentioned_players field spliced in before the closing brace, instead
+    of re-serializing the whole comment. Lines that already carry the
+    field are re-serialized in full.
 
     Args:
-        filepath: Path to the file to count.
+        lines: Raw JSONL lines (bytes).
+        f_out: Binary output file for accepted comments. Accepted lines are
+            gathered in a bytearray and written ~OUTPUT_FLUSH_BYTES at a time.
 
     Returns:
-        Number of lines in the file.
+        Stats dict with total, accepted, rejected, and malformed counts.
+    """
+    # Hot-loop state kept in locals (no stats dict or module lookups per
+    # line); the stats dict is built once at the end
+    loads = orjson.loads
+    dumps = orjson.dumps
+    decode_error = orjson.JSONDecodeError
+    find_mentions = find_player_mentions
+    total_count = 0
+    accepted_count = 0
+    malformed_count = 0
+    pending = bytearray()
+
+    for line in lines:
+        record = line.strip()
+        if not record:
+            continue
+
+        total_count += 1
+
+        # Parse JSON; orjson rejects lone surrogates ("\ud83d") that the
+        # stdlib accepts, so those lines are retried with json
+        try:
+            comment = loads(record)
+        except decode_error:
+            try:
+                comment = json.loads(record)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                malformed_count += 1
+                continue
+
+        # Filter for player mentions
+        players = find_mentions(comment.get("body", ""))
+        if not players:
+            continue
+
+        accepted_count += 1
+        if "mentioned_players" in comment:
+            result = filter_player_mentions(comment)
+            try:
+                pending += dumps(result, option=orjson.OPT_APPEND_NEWLINE)
+            except TypeError:
+                pending += json.dumps(result).encode() + b"\n"
+        else:
+            # A parsed object ends in "}"; the other fields pass through
+            pending += record[:-1]
+            pending += MENTIONED_PLAYERS_FIELD
+            pending += dumps(players)
+            pending += b"}\n"
+        if len(pending) >= OUTPUT_FLUSH_BYTES:
+            f_out.write(pending)
+            pending.clear()
+
+    f_out.write(pending)
+    return {
+        "total": total_count,
+        "accepted": accepted_count,
+        "rejected": total_count - accepted_count - malformed_count,
+        "malformed": malformed_count,
+    }
+
+
+def find_chunk_boundaries(filepath: Path, num_chunks: int) -> list[tuple[int, int]]:
+    """
+    Split a file into byte ranges that start and end on line boundaries.
+
+    Each cut point is moved forward to the start of the next line, so every
+    line falls in exactly one range.
+
+    Args:
+        filepath: Path to the JSONL file.
+        num_chunks: Number of ranges to aim for.
+
+    Returns:
+        List of non-empty (start, end) byte offsets covering the file.
+    """
+    size = filepath.stat().st_size
+    offsets = [0]
+
+    with open(filepath, "rb") as f:
+        for i in range(1, num_chunks):
+            f.seek(size * i // num_chunks)
+            f.readline()
+            offsets.append(max(f.tell(), offsets[-1]))
+
+    offsets.append(size)
+    return [(start, end) for start, end in pairwise(offsets) if start < end]
+
+
+def iter_line_range(f: BinaryIO, start: int, end: int) -> Iterator[bytes]:
+    """
+    Yield the lines of an open binary file from start up to end.
+
+    Args:
+        f: File opened in binary mode.
+        start: Byte offset of the first line.
+        end: Byte offset the range stops at (a line boundary).
+
+    Yields:
+        Raw lines (bytes, newline included).
+    """
+    f.seek(start)
+    position = start
+    for line in f:
+        yield line
+        position += len(line)
+        if position >= end:
+            break
+
+
+def process_chunk(
+    input_path: Path, part_path: Path, start: int, end: int
+) -> dict[str, int]:
+    """
+    Filter one byte range of the input into its own part file.
+
+    Runs in a worker process for process_file_parallel.
+
+    Args:
+        input_path: Path to input JSONL file.
+        part_path: Path to write this range's accepted comments.
+        start: Byte offset the range starts at.
+        end: Byte offset the range ends at.
+
+    Returns:
+        Stats dict for the range.
+    """
+    with open_sequential(input_path) as f_in, open(part_path, "wb") as f_out:
+        return filter_lines(iter_line_range(f_in, start, end), f_out)
+
+
+def process_file_parallel(
+    input_path: Path, output_path: Path, workers: int
+) -> tuple[dict[str, int], float]:
     """
-    logger.info(f"Counting lines in {filepath.name}...")
-    count = 0
-    with open(filepath) as f:
-        for _ in f:
-            count += 1
-    return count
+    Filter a JSONL file for player mentions across worker processes.
+
+    The input is split into one line-aligned byte range per worker; each
+    writes a part file, and the parts are concatenated in input order, so
+    the output matches process_file's. Matching and JSON parsing hold the
+    GIL, which is why this uses processes, not threads.
+
+    Args:
+        input_path: Path to input JSONL file.
+        output_path: Path to write filtered JSONL.
+        workers: Number of worker processes (and byte ranges).
+
+    Returns:
+        Tuple of (stats dict, elapsed_seconds).
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    logger.info(f"Processing {input_path.name} with {workers} workers...")
+
+    start_time = time.time()
+
+    chunks = find_chunk_boundaries(input_path, workers)
+    part_paths = [
+        output_path.with_suffix(f".part{i}.jsonl") for i in range(len(chunks))
+    ]
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(process_chunk, input_path, part_path, start, end)
+                for part_path, (start, end) in zip(part_paths, chunks)
+            ]
+            chunk_stats = [future.result() for future in futures]
+
+        with open(output_path, "wb") as f_out:
+            for part_path in part_paths:
+                with open(part_path, "rb") as f_part:
+                    shutil.copyfileobj(f_part, f_out)
+    finally:
+        # Part files are scratch space, even when a worker fails
+        for part_path in part_paths:
+            part_path.unlink(missing_ok=True)
+
+    stats = {"total": 0, "accepted": 0, "rejected": 0, "malformed": 0}
+    for chunk in chunk_stats:
+        for key, value in chunk.items():
+            stats[key] += value
+
+    elapsed = time.time() - start_time
+    return stats, elapsed
 
 
 def process_file(
     input_path: Path,
     output_path: Path,
     limit: int | None = None,
-    skip_line_count: bool = False,
+    exact_count: bool = False,
 ) -> tuple[dict[str, int], float]:
     """
     Stream process a JSONL file, filtering for player mentions.
@@ -87,25 +287,21 @@ def process_file(
         input_path: Path to input JSONL file.
         output_path: Path to write filtered JSONL.
         limit: Optional max lines to process (for testing).
-        skip_line_count: Skip counting lines (faster start, no progress %).
+        exact_count: Count lines first so progress is per line, not per byte.
 
     Returns:
         Tuple of (stats dict, elapsed_seconds).
     """
-    stats = {
-        "total": 0,
-        "accepted": 0,
-        "rejected": 0,
-        "malformed": 0,
-    }
-
-    # Get total for progress bar (unless skipped or limited)
+    # Progress is tracked in input bytes (file size, no pre-pass) unless
+    # lines are limited or an exact line count is requested
+    by_bytes = not limit and not exact_count
     if limit:
         total = limit
-    elif skip_line_count:
-        total = None
-    else:
+    elif exact_count:
+        logger.info(f"Counting lines in {input_path.name}...")
         total = count_lines(input_path)
+    else:
+        total = input_path.stat().st_size
 
     # Ensure output directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -114,34 +310,25 @@ def process_file(
 
     start_time = time.time()
 
-    with open(input_path) as f_in, open(output_path, "w") as f_out:
-        lines = tqdm(f_in, total=total, desc="Filtering", unit=" lines")
-
-        for i, line in enumerate(lines):
-            if limit and i >= limit:
-                break
-
-            line = line.strip()
-            if not line:
-                continue
-
-            stats["total"] += 1
-
-            # Parse JSON
-            try:
-                comment = json.loads(line)
-            except json.JSONDecodeError:
-                stats["malformed"] += 1
-                continue
-
-            # Filter for player mentions
-            result = filter_player_mentions(comment)
-
-            if result is None:
-                stats["rejected"] += 1
-            else:
-                stats["accepted"] += 1
-                f_out.write(json.dumps(result) + "\n")
+    # Binary on both sides: orjson parses bytes and emits UTF-8 bytes, so
+    # lines are never decoded or encoded in Python
+    with open_sequential(input_path) as f_in, open(output_path, "wb") as f_out:
+        pbar = tqdm(
+            total=total,
+            desc="Filtering",
+            unit="B" if by_bytes else " lines",
+            unit_scale=by_bytes,
+        )
+
+        # Advance the progress bar once per block as filter_lines consumes it
+        lines = iter_lines(
+            f_in, lambda size, count: pbar.update(size if by_bytes else count)
+        )
+        if limit:
+            lines = islice(lines, limit)
+        stats = filter_lines(lines, f_out)
+
+        pbar.close()
 
     elapsed = time.time() - start_time
     return stats, elapsed
@@ -182,13 +369,30 @@ def main() -> None:
         default=None,
         help="Process only first N lines (for testing)",
     )
+    parser.add_argument(
+        "--exact-count",
+        action="store_true",
+        help="Count lines first for a per-line progress bar (reads input twice)",
+    )
     parser.add_argument(
         "--skip-line-count",
         action="store_true",
-        help="Skip counting lines (faster start, but no progress percentage)",
+        help="Deprecated, no effect: lines are only counted with --exact-count",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes, each filtering a slice of the input (default: 1)",
     )
     args = parser.parse_args()
 
+    if args.skip_line_count:
+        logger.warning(
+            "--skip-line-count is deprecated and has no effect: lines are "
+            "no longer counted unless --exact-count is given"
+        )
+
     # Apply defaults after parsing (so DATA_DIR is respected)
     if args.input is None:
         args.input = default_input
@@ -208,18 +412,27 @@ def main() -> None:
     logger.info(f"Output: {args.output}")
     if args.limit:
         logger.info(f"Limit:  {args.limit:,} lines")
+    elif args.workers > 1:
+        logger.info(f"Workers: {args.workers}")
     logger.info("=" * 60)
 
     # Get input size before processing
     input_size = args.input.stat().st_size
 
-    # Process
-    stats, elapsed = process_file(
-        input_path=args.input,
-        output_path=args.output,
-        limit=args.limit,
-        skip_line_count=args.skip_line_count,
-    )
+    # Process (--limit previews always run in one process)
+    if args.workers > 1 and not args.limit:
+        stats, elapsed = process_file_parallel(
+            input_path=args.input,
+            output_path=args.output,
+            workers=args.workers,
+        )
+    else:
+        stats, elapsed = process_file(
+            input_path=args.input,
+            output_path=args.output,
+            limit=args.limit,
+            exact_count=args.exact_count,
+        )
 
     # Get output size
     output_size = args.output.stat().st_size if args.output.exists() else 0
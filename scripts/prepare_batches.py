@@ -24,10 +24,13 @@ import logging
 import sys
 import time
 from pathlib import Path
+from typing import BinaryIO
 
+import orjson
 from tqdm import tqdm
 
-from pipeline.batch import format_batch_request, REQUESTS_PER_BATCH
+from pipeline.batch import format_batch_request_bytes, REQUESTS_PER_BATCH
+from utils.file_io import count_lines, iter_lines, open_sequential
 from utils.formatting import format_duration
 from utils.paths import get_batches_dir, get_filtered_dir
 
@@ -50,76 +53,61 @@ logger = logging.getLogger(__name__)
 DEFAULT_INPUT_FILENAME = "r_nba_player_mentions.jsonl"
 REQUESTS_SUBDIR = "requests"
 
+# Serialized requests gathered before each write()
+OUTPUT_FLUSH_BYTES = 1024 * 1024
+
 
 # -----------------------------------------------------------------------------
 # Core processing
 # -----------------------------------------------------------------------------
 
 
-def count_lines(filepath: Path) -> int:
-    """
-    Count lines in a file for progress bar total.
-
-    Args:
-        filepath: Path to the file to count.
-
-    Returns:
-        Number of lines in the file.
-    """
-    logger.info(f"Counting lines in {filepath.name}...")
-    count = 0
-    with open(filepath) as f:
-        for _ in f:
-            count += 1
-    return count
-
-
-def write_batch(output_dir: Path, batch_num: int, requests: list[dict]) -> None:
+def open_batch(output_dir: Path, batch_num: int) -> BinaryIO:
     """
-    Write a batch of requests to a JSONL file.
+    Open a batch request file for writing.
 
     Args:
         output_dir: Directory to write the batch file.
         batch_num: Batch number for filename.
-        requests: List of batch request dicts to write.
+
+    Returns:
+        Binary file handle for batch_NNN.jsonl.
     """
-    batch_path = output_dir / f"batch_{batch_num:03d}.jsonl"
-    with open(batch_path, "w") as f:
-        for request in requests:
-            f.write(json.dumps(request) + "\n")
+    return open(output_dir / f"batch_{batch_num:03d}.jsonl", "wb")
 
 
 def process_file(
     input_path: Path,
     output_dir: Path,
     limit: int | None = None,
-    skip_line_count: bool = False,
+    exact_count: bool = False,
 ) -> tuple[dict[str, int], float]:
     """
     Transform filtered comments into batch request files.
 
+    Requests are serialized as they are formatted and streamed into the
+    current batch file, rolling over to a new file every REQUESTS_PER_BATCH
+    requests, so no batch is ever held in memory as a list of dicts.
+
     Args:
         input_path: Path to input JSONL file.
         output_dir: Directory to write batch request files.
         limit: Optional max comments to process (for testing).
-        skip_line_count: Skip counting lines (faster start, no progress %).
+        exact_count: Count lines first so progress is per line, not per byte.
 
     Returns:
         Tuple of (stats dict, elapsed_seconds).
     """
-    stats = {
-        "total": 0,
-        "batches": 0,
-        "malformed": 0,
-    }
-
-    # Get total for progress bar (unless skipped or limited)
+    # Progress is tracked in input bytes (file size, no pre-pass) unless
+    # lines are limited or an exact line count is requested
+    by_bytes = not limit and not exact_count
     if limit:
         total = limit
-    elif skip_line_count:
-        total = None
-    else:
+    elif exact_count:
+        logger.info(f"Counting lines in {input_path.name}...")
         total = count_lines(input_path)
+    else:
+        total = input_path.stat().st_size
 
     # Ensure output directory exists
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -128,43 +116,91 @@ def process_file(
 
     start_time = time.time()
 
-    batch_num = 0
-    current_batch: list[dict] = []
-
-    with open(input_path) as f_in:
-        lines = tqdm(f_in, total=total, desc="Preparing", unit=" comments")
+    # Hot-loop state kept in locals (no stats dict or module lookups per
+    # line); the stats dict is built once at the end
+    loads = orjson.loads
+    decode_error = orjson.JSONDecodeError
+    format_request = format_batch_request_bytes
+    max_total = limit if limit else sys.maxsize
+    total_count = 0
+    malformed_count = 0
+    batch_total = 0
 
+    batch_num = 0
+    batch_file: BinaryIO | None = None
+    batch_count = 0
+    # Serialized requests not yet written, flushed ~OUTPUT_FLUSH_BYTES at a time
+    pending = bytearray()
+
+    # Binary input: orjson parses the raw bytes without a decode
+    with open_sequential(input_path) as f_in:
+        pbar = tqdm(
+            total=total,
+            desc="Preparing",
+            unit="B" if by_bytes else " comments",
+            unit_scale=by_bytes,
+        )
+
+        # Advance the progress bar once per block rather than per line
+        lines = iter_lines(
+            f_in, lambda size, count: pbar.update(size if by_bytes else count)
+        )
         for line in lines:
-            if limit and stats["total"] >= limit:
-                break
-
-            line = line.strip()
-            if not line:
+            if not line.strip():
                 continue
 
-            # Parse JSON
+            # Parse JSON; orjson rejects lone surrogates ("\ud83d") that the
+            # stdlib accepts, so those lines are retried with json
             try:
-                comment = json.loads(line)
-            except json.JSONDecodeError:
-                stats["malformed"] += 1
-                continue
-
-            request = format_batch_request(comment)
-            current_batch.append(request)
-            stats["total"] += 1
-
-            # Write batch when full
-            if len(current_batch) >= REQUESTS_PER_BATCH:
+                comment = loads(line)
+            except decode_error:
+                try:
+                    comment = json.loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    malformed_count += 1
+                    continue
+
+            # Start the next batch file on its first request, so no empty
+            # file is left behind
+            if batch_file is None:
                 batch_num += 1
-                write_batch(output_dir, batch_num, current_batch)
-                stats["batches"] += 1
-                current_batch = []
+                batch_file = open_batch(output_dir, batch_num)
+
+            pending += format_request(comment)
+            pending += b"\n"
+            batch_count += 1
+            total_count += 1
+
+            # Close the batch when full
+            if batch_count >= REQUESTS_PER_BATCH:
+                batch_file.write(pending)
+                pending.clear()
+                batch_file.close()
+                batch_file = None
+                batch_count = 0
+                batch_total += 1
+            elif len(pending) >= OUTPUT_FLUSH_BYTES:
+                batch_file.write(pending)
+                pending.clear()
+
+            # --limit counts written requests, so blank and malformed lines
+            # never reach this check
+            if total_count >= max_total:
+                break
+
+        pbar.close()
 
     # Write remaining requests
-    if current_batch:
-        batch_num += 1
-        write_batch(output_dir, batch_num, current_batch)
-        stats["batches"] += 1
+    if batch_file is not None:
+        batch_file.write(pending)
+        batch_file.close()
+        batch_total += 1
+
+    stats = {
+        "total": total_count,
+        "batches": batch_total,
+        "malformed": malformed_count,
+    }
 
     elapsed = time.time() - start_time
     return stats, elapsed
@@ -204,13 +240,24 @@ def main() -> None:
         default=None,
         help="Process only first N comments (for testing)",
     )
+    parser.add_argument(
+        "--exact-count",
+        action="store_true",
+        help="Count lines first for a per-line progress bar (reads input twice)",
+    )
     parser.add_argument(
         "--skip-line-count",
         action="store_true",
-        help="Skip counting lines (faster start, but no progress percentage)",
+        help="Deprecated, no effect: lines are only counted with --exact-count",
     )
     args = parser.parse_args()
 
+    if args.skip_line_count:
+        logger.warning(
+            "--skip-line-count is deprecated and has no effect: lines are "
+            "no longer counted unless --exact-count is given"
+        )
+
     # Apply defaults after parsing
     if args.input is None:
         args.input = default_input
@@ -238,7 +285,7 @@ def main() -> None:
         input_path=args.input,
         output_dir=args.output,
         limit=args.limit,
-        skip_line_count=args.skip_line_count,
+        exact_count=args.exact_count,
     )
 
     throughput = stats["total"] / elapsed if elapsed > 0 else 0
@@ -14,6 +14,9 @@ Usage:
     # Submit all pending batches
     uv run python -m scripts.submit_batches
 
+    # Submit up to 8 batches at a time
+    uv run python -m scripts.submit_batches --concurrency 8
+
     # Resume after interruption (automatically skips submitted batches)
     uv run python -m scripts.submit_batches
 
@@ -22,12 +25,13 @@ Output: data/batches/state.json tracking file
 """
 
 import argparse
-import json
 import logging
 import sys
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
+from pathlib import Path
 
+import orjson
 from dotenv import load_dotenv
 
 from pipeline.batch import (
@@ -35,11 +39,13 @@ from pipeline.batch import (
     MAX_TOKENS,
     OUTPUT_COST_PER_MTOK,
     STATE_FILENAME,
+    StateJournal,
     calculate_cost,
     load_state,
     save_state,
     submit_batch,
 )
+from utils.file_io import open_sequential
 from utils.paths import get_batches_dir
 
 # -----------------------------------------------------------------------------
@@ -61,6 +67,10 @@ logger = logging.getLogger(__name__)
 REQUESTS_SUBDIR = "requests"
 AVG_INPUT_TOKENS = 60  # From notebook cost analysis
 
+# Batch files uploaded at once. Each submission holds its whole file's
+# requests in memory (up to REQUESTS_PER_BATCH), so keep this modest.
+SUBMIT_CONCURRENCY = 4
+
 
 # -----------------------------------------------------------------------------
 # Helper functions
@@ -84,68 +94,97 @@ def discover_batch_files(requests_dir: Path) -> list[Path]:
     return files
 
 
-def is_batch_submitted(state: dict, filename: str) -> bool:
+def get_submitted_files(state: dict) -> set[str]:
     """
-    Check if a batch file has already been submitted.
+    Collect the request filenames of all submitted batches.
+
+    Build this once and test membership against it, rather than scanning
+    every batch for each file.
 
     Args:
         state: Current state dict.
-        filename: Batch filename to check.
 
     Returns:
-        True if already submitted, False otherwise.
-    """
-    return any(b["request_file"] == filename for b in state.get("batches", []))
-
-
-def count_requests(batch_file: Path) -> int:
+        Set of submitted batch filenames.
     """
-    Count the number of requests in a batch file.
+    return {b["request_file"] for b in state.get("batches", [])}
 
-    Args:
-        batch_file: Path to JSONL batch file.
 
-    Returns:
-        Number of non-empty lines (requests) in the file.
+def scan_batch_file(batch_file: Path) -> tuple[int, str]:
     """
-    count = 0
-    with open(batch_file) as f:
-        for line in f:
-            if line.strip():
-                count += 1
-    return count
+    Count and validate the requests in a batch file in a single pass.
 
-
-def validate_batch_file(batch_file: Path) -> tuple[bool, str]:
-    """
-    Validate a batch file has valid JSONL with required fields.
+    Every line is still parsed in full, so malformed JSON is caught here
+    rather than by the API. With orjson the parse costs about as much as
+    a bytes-level key search would, and results are cached per file (see
+    scan_batch_file_cached).
 
     Args:
         batch_file: Path to JSONL batch file.
 
     Returns:
-        Tuple of (is_valid, error_message).
+        Tuple of (request_count, error_message). The error message is empty
+        if every line is valid JSON with the required fields; otherwise
+        counting stops at the first invalid line.
     """
+    count = 0
     try:
-        with open(batch_file) as f:
+        with open_sequential(batch_file) as f:
             for i, line in enumerate(f, 1):
-                line = line.strip()
-                if not line:
+                # isspace() tests blank lines without copying like strip()
+                if line.isspace():
                     continue
+                count += 1
 
                 try:
-                    request = json.loads(line)
-                except json.JSONDecodeError as e:
-                    return False, f"Line {i}: Invalid JSON - {e}"
+                    request = orjson.loads(line)
+                except orjson.JSONDecodeError as e:
+                    return count, f"Line {i}: Invalid JSON - {e}"
 
                 if "custom_id" not in request:
-                    return False, f"Line {i}: Missing 'custom_id' field"
+                    return count, f"Line {i}: Missing 'custom_id' field"
                 if "params" not in request:
-                    return False, f"Line {i}: Missing 'params' field"
+                    return count, f"Line {i}: Missing 'params' field"
 
-        return True, ""
+        return count, ""
     except OSError as e:
-        return False, f"Cannot read file: {e}"
+        return count, f"Cannot read file: {e}"
+
+
+def scan_batch_file_cached(batch_file: Path, state: dict) -> tuple[int, str]:
+    """
+    Scan a batch file, reusing the result cached in state if it is unchanged.
+
+    Results are kept in state["file_cache"] keyed by filename, and reused
+    while the file's size and mtime match, so repeated dry runs and the
+    submission that follows do not reread every batch file.
+
+    Args:
+        batch_file: Path to JSONL batch file.
+        state: Current state dict (its file_cache may be updated).
+
+    Returns:
+        Tuple of (request_count, error_message), as from scan_batch_file.
+    """
+    file_cache = state.setdefault("file_cache", {})
+    stat = batch_file.stat()
+
+    cached = file_cache.get(batch_file.name)
+    if (
+        cached is not None
+        and cached["mtime_ns"] == stat.st_mtime_ns
+        and cached["size"] == stat.st_size
+    ):
+        return cached["request_count"], cached["error"]
+
+    request_count, error = scan_batch_file(batch_file)
+    file_cache[batch_file.name] = {
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "request_count": request_count,
+        "error": error,
+    }
+    return request_count, error
 
 
 def estimate_batch_cost(request_count: int) -> float:
@@ -186,13 +225,17 @@ def extract_batch_num(filename: str) -> int:
 # -----------------------------------------------------------------------------
 
 
-def dry_run(batch_files: list[Path], state: dict) -> None:
+def dry_run(batch_files: list[Path], state: dict, state_path: Path) -> None:
     """
     Validate batch files and estimate costs without making API calls.
 
+    Scan results are cached in the state file, so unchanged files are not
+    reread by later dry runs or by the submission.
+
     Args:
         batch_files: List of batch file paths.
-        state: Current state dict.
+        state: Current state dict (its file_cache is updated).
+        state_path: Path to save state file.
     """
     logger.info("DRY RUN MODE - No API calls will be made")
     logger.info("=" * 60)
@@ -201,22 +244,23 @@ def dry_run(batch_files: list[Path], state: dict) -> None:
     total_cost = 0.0
     pending_files = []
     skipped_files = []
+    submitted_files = get_submitted_files(state)
 
     for batch_file in batch_files:
         filename = batch_file.name
 
-        if is_batch_submitted(state, filename):
+        if filename in submitted_files:
             skipped_files.append(filename)
             continue
 
-        # Validate
-        is_valid, error = validate_batch_file(batch_file)
-        if not is_valid:
+        # Validate and count (one pass, or cached)
+        request_count, error = scan_batch_file_cached(batch_file, state)
+        if error:
+            save_state(state, state_path)
             logger.error(f"Invalid batch file {filename}: {error}")
             sys.exit(1)
 
-        # Count and estimate
-        request_count = count_requests(batch_file)
+        # Estimate
         estimated_cost = estimate_batch_cost(request_count)
 
         logger.info(
@@ -228,6 +272,8 @@ def dry_run(batch_files: list[Path], state: dict) -> None:
         total_cost += estimated_cost
         pending_files.append(filename)
 
+    save_state(state, state_path)
+
     logger.info("=" * 60)
     logger.info("Summary")
     logger.info("=" * 60)
@@ -253,19 +299,29 @@ def submit_batches(
     state: dict,
     state_path: Path,
     max_batches: int | None = None,
+    concurrency: int = SUBMIT_CONCURRENCY,
 ) -> None:
     """
     Submit batch files to the Anthropic API.
 
+    Submissions are network-bound, so up to `concurrency` run at once in
+    worker threads. Only this thread touches state: each result is
+    recorded as it completes and appended to the state log (a full
+    snapshot is written every STATE_SNAPSHOT_EVERY batches and at the end),
+    so long runs do not rewrite the whole state file per batch. After a
+    failure or Ctrl-C, queued submissions are cancelled but in-flight ones
+    are still recorded, so no created batch goes missing from state (and
+    gets resubmitted).
+
     Args:
         batch_files: List of batch file paths.
         state: Current state dict (will be modified).
         state_path: Path to save state file.
         max_batches: Maximum number of batches to submit (None = all).
+        concurrency: Maximum submissions in flight at once.
     """
-    pending = [
-        f for f in batch_files if not is_batch_submitted(state, f.name)
-    ]
+    submitted_files = get_submitted_files(state)
+    pending = [f for f in batch_files if f.name not in submitted_files]
 
     if not pending:
         logger.info("No new batches to submit")
@@ -277,50 +333,99 @@ def submit_batches(
     logger.info(f"Submitting {len(pending)} batch(es)...")
     logger.info("=" * 60)
 
+    # Counts come from the dry run's cache when files are unchanged; scanned
+    # here, before any thread starts, since workers must not touch state
+    request_counts = {}
     for batch_file in pending:
+        request_count, error = scan_batch_file_cached(batch_file, state)
+        if error:
+            save_state(state, state_path)
+            logger.error(f"Invalid batch file {batch_file.name}: {error}")
+            sys.exit(1)
+        request_counts[batch_file] = request_count
+
+    def submit_one(batch_file: Path) -> dict:
+        # Runs in a worker thread: no state access here
+        request_count = request_counts[batch_file]
+        logger.info(f"Submitting {batch_file.name} ({request_count:,} requests)...")
+        result = submit_batch(batch_file)
+        # Stamped here, when the API accepted it, not when the main thread
+        # gets round to recording it
+        result["submitted_at"] = datetime.now(timezone.utc).isoformat()
+        return result
+
+    journal = StateJournal(state, state_path)
+    recorded: set[Path] = set()
+
+    def record(batch_file: Path, result: dict) -> None:
         filename = batch_file.name
-        batch_num = extract_batch_num(filename)
-        request_count = count_requests(batch_file)
 
-        logger.info(f"Submitting {filename} ({request_count:,} requests)...")
+        # Add to state
+        batch_entry = {
+            "batch_num": extract_batch_num(filename),
+            "batch_id": result["batch_id"],
+            "request_file": filename,
+            "status": result["processing_status"],
+            "submitted_at": result["submitted_at"],
+            "ended_at": result["ended_at"],
+            "results_url": result["results_url"],
+            "request_counts": result["request_counts"],
+            "results_downloaded": False,
+        }
+        state["batches"].append(batch_entry)
+        recorded.add(batch_file)
+
+        # Log the new entry immediately (replayed by load_state after a crash)
+        journal.record(batch_entry)
+
+        logger.info(
+            f"  {filename} -> batch_id: {result['batch_id']}, "
+            f"status: {result['processing_status']}"
+        )
+
+    first_error: Exception | None = None
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = {executor.submit(submit_one, f): f for f in pending}
 
         try:
-            result = submit_batch(batch_file)
-
-            # Add to state
-            batch_entry = {
-                "batch_num": batch_num,
-                "batch_id": result["batch_id"],
-                "request_file": filename,
-                "status": result["processing_status"],
-                "submitted_at": datetime.now(timezone.utc).isoformat(),
-                "ended_at": result["ended_at"],
-                "results_url": result["results_url"],
-                "request_counts": result["request_counts"],
-                "results_downloaded": False,
-            }
-            state["batches"].append(batch_entry)
-
-            # Save state immediately
-            save_state(state, state_path)
+            for future in as_completed(futures):
+                batch_file = futures[future]
+                if future.cancelled():
+                    continue
+
+                error = future.exception()
+                if error is None:
+                    record(batch_file, future.result())
+                    continue
 
-            logger.info(
-                f"  -> batch_id: {result['batch_id']}, "
-                f"status: {result['processing_status']}"
-            )
+                logger.error(f"Failed to submit {batch_file.name}: {error}")
+                if first_error is None:
+                    first_error = error
+                    # Stop queued submissions; in-flight ones are still recorded
+                    for queued in futures:
+                        queued.cancel()
 
         except KeyboardInterrupt:
-            logger.warning("Interrupted! Saving state...")
-            save_state(state, state_path)
+            logger.warning("Interrupted! Recording in-flight batches, saving state...")
+            for queued in futures:
+                queued.cancel()
+            for future, batch_file in futures.items():
+                if batch_file in recorded or future.cancelled():
+                    continue
+                if future.exception() is None:
+                    record(batch_file, future.result())
+            journal.snapshot()
             sys.exit(1)
 
-        except Exception as e:
-            logger.error(f"Failed to submit {filename}: {e}")
-            save_state(state, state_path)
-            raise
+    # Fold the logged entries into the state file
+    journal.snapshot()
+
+    if first_error is not None:
+        raise first_error
 
     logger.info("=" * 60)
-    logger.info(f"Submitted {len(pending)} batch(es)")
+    logger.info(f"Submitted {len(recorded)} batch(es)")
     logger.info(f"State saved to: {state_path}")
 
 
@@ -350,6 +455,13 @@ def main() -> None:
         metavar="N",
         help="Submit only first N pending batches",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=SUBMIT_CONCURRENCY,
+        metavar="N",
+        help=f"Batches submitted at once (default: {SUBMIT_CONCURRENCY})",
+    )
     parser.add_argument(
         "--requests-dir",
         type=Path,
@@ -384,9 +496,15 @@ def main() -> None:
         logger.info(f"Resuming: {submitted_count} batch(es) already submitted")
 
     if args.dry_run:
-        dry_run(batch_files, state)
+        dry_run(batch_files, state, state_path)
     else:
-        submit_batches(batch_files, state, state_path, max_batches=args.batches)
+        submit_batches(
+            batch_files,
+            state,
+            state_path,
+            max_batches=args.batches,
+            concurrency=args.concurrency,
+        )
 
 
 if __name__ == "__main__":
@@ -5,10 +5,12 @@ Fixtures provide reusable test data and utilities. They're injected
 into test functions by name — pytest handles the wiring automatically.
 """
 
-import json
+import functools
+from collections.abc import Iterator, Mapping
+from types import MappingProxyType
 from typing import Callable
-from unittest.mock import Mock
 
+import orjson
 import pytest
 from pathlib import Path
 
@@ -16,6 +18,112 @@ from pathlib import Path
 # Sample comment data
 # ---------------------------------------------------------------------------
 
+# Canonical comment records, built once at import. Fixtures hand each test
+# its own shallow copy (all values are immutable), so a test or the code
+# under test may modify its comment without affecting other tests.
+
+# Comment timestamps (Unix seconds, UTC)
+_TS_2024_03_01 = 1709251200
+_TS_2024_03_02 = 1709337600
+
+_VALID_NBA_COMMENT = {
+    "id": "abc123",
+    "body": "LeBron is washed, can't believe we traded for him",
+    "author": "hoopsfan42",
+    "author_flair_text": "Lakers",
+    "author_flair_css_class": "lakers",
+    "subreddit": "nba",
+    "created_utc": _TS_2024_03_01,
+    "score": 42,
+    "controversiality": 0,
+    "parent_id": "t1_xyz789",
+    "link_id": "t3_post123",
+}
+
+_VALID_TEAM_SUBREDDIT_COMMENT = {
+    "id": "def456",
+    "body": "Tatum is carrying this team",
+    "author": "celticspride",
+    "author_flair_text": "Banner 18",
+    "author_flair_css_class": "celtics",
+    "subreddit": "bostonceltics",
+    "created_utc": _TS_2024_03_02,
+    "score": 156,
+    "controversiality": 0,
+    "parent_id": "t1_aaa111",
+    "link_id": "t3_post456",
+}
+
+_WRONG_SUBREDDIT_COMMENT = {
+    "id": "xyz789",
+    "body": "Great goal by Messi!",
+    "author": "soccerfan",
+    "author_flair_text": "Barcelona",
+    "author_flair_css_class": "barca",
+    "subreddit": "soccer",
+    "created_utc": _TS_2024_03_01,
+    "score": 1024,
+    "controversiality": 0,
+    "parent_id": "t1_bbb222",
+    "link_id": "t3_post789",
+}
+
+_UPPERCASE_SUBREDDIT_COMMENT = {
+    "id": "case123",
+    "body": "This is a test comment",
+    "author": "testuser",
+    "author_flair_text": None,
+    "author_flair_css_class": None,
+    "subreddit": "NBA",  # Uppercase!
+    "created_utc": _TS_2024_03_01,
+    "score": 1,
+    "controversiality": 0,
+    "parent_id": "t1_ccc333",
+    "link_id": "t3_post000",
+}
+
+_MISSING_BODY_COMMENT = {
+    "id": "nobody123",
+    "author": "deleteduser",
+    "author_flair_text": None,
+    "author_flair_css_class": None,
+    "subreddit": "nba",
+    "created_utc": _TS_2024_03_01,
+    "score": 0,
+    "controversiality": 0,
+    "parent_id": "t1_ddd444",
+    "link_id": "t3_post111",
+    # Note: no "body" key at all
+}
+
+_DELETED_BODY_COMMENT = {
+    "id": "deleted123",
+    "body": "[deleted]",
+    "author": "[deleted]",
+    "author_flair_text": None,
+    "author_flair_css_class": None,
+    "subreddit": "lakers",
+    "created_utc": _TS_2024_03_01,
+    "score": 5,
+    "controversiality": 0,
+    "parent_id": "t1_eee555",
+    "link_id": "t3_post222",
+}
+
+_EMPTY_BODY_COMMENT = {
+    "id": "empty123",
+    "body": "",
+    "author": "quietuser",
+    "author_flair_text": "Heat",
+    "author_flair_css_class": "heat",
+    "subreddit": "heat",
+    "created_utc": _TS_2024_03_01,
+    "score": 1,
+    "controversiality": 0,
+    "parent_id": "t1_fff666",
+    "link_id": "t3_post333",
+}
+
 
 @pytest.fixture
 def valid_nba_comment() -> dict:
@@ -25,37 +133,13 @@ def valid_nba_comment() -> dict:
     This represents the 'happy path' — exactly what we expect
     to extract and keep.
     """
-    return {
-        "id": "abc123",
-        "body": "LeBron is washed, can't believe we traded for him",
-        "author": "hoopsfan42",
-        "author_flair_text": "Lakers",
-        "author_flair_css_class": "lakers",
-        "subreddit": "nba",
-        "created_utc": 1709251200,
-        "score": 42,
-        "controversiality": 0,
-        "parent_id": "t1_xyz789",
-        "link_id": "t3_post123",
-    }
+    return dict(_VALID_NBA_COMMENT)
 
 
 @pytest.fixture
 def valid_team_subreddit_comment() -> dict:
     """Comment from a team-specific subreddit (not r/nba)."""
-    return {
-        "id": "def456",
-        "body": "Tatum is carrying this team",
-        "author": "celticspride",
-        "author_flair_text": "Banner 18",
-        "author_flair_css_class": "celtics",
-        "subreddit": "bostonceltics",
-        "created_utc": 1709337600,
-        "score": 156,
-        "controversiality": 0,
-        "parent_id": "t1_aaa111",
-        "link_id": "t3_post456",
-    }
+    return dict(_VALID_TEAM_SUBREDDIT_COMMENT)
 
 
 @pytest.fixture
@@ -65,19 +149,7 @@ def wrong_subreddit_comment() -> dict:
 
     This should be filtered OUT by our extraction logic.
     """
-    return {
-        "id": "xyz789",
-        "body": "Great goal by Messi!",
-        "author": "soccerfan",
-        "author_flair_text": "Barcelona",
-        "author_flair_css_class": "barca",
-        "subreddit": "soccer",
-        "created_utc": 1709251200,
-        "score": 1024,
-        "controversiality": 0,
-        "parent_id": "t1_bbb222",
-        "link_id": "t3_post789",
-    }
+    return dict(_WRONG_SUBREDDIT_COMMENT)
 
 
 @pytest.fixture
@@ -88,19 +160,7 @@ def uppercase_subreddit_comment() -> dict:
     Reddit data is messy — subreddit names appear as 'nba', 'NBA', 'Nba'.
     Our filter must handle all variants.
     """
-    return {
-        "id": "case123",
-        "body": "This is a test comment",
-        "author": "testuser",
-        "author_flair_text": None,
-        "author_flair_css_class": None,
-        "subreddit": "NBA",  # Uppercase!
-        "created_utc": 1709251200,
-        "score": 1,
-        "controversiality": 0,
-        "parent_id": "t1_ccc333",
-        "link_id": "t3_post000",
-    }
+    return dict(_UPPERCASE_SUBREDDIT_COMMENT)
 
 
 @pytest.fixture
@@ -110,19 +170,7 @@ def missing_body_comment() -> dict:
 
     Useless for sentiment analysis — should be rejected but logged.
     """
-    return {
-        "id": "nobody123",
-        "author": "deleteduser",
-        "author_flair_text": None,
-        "author_flair_css_class": None,
-        "subreddit": "nba",
-        "created_utc": 1709251200,
-        "score": 0,
-        "controversiality": 0,
-        "parent_id": "t1_ddd444",
-        "link_id": "t3_post111",
-        # Note: no "body" key at all
-    }
+    return dict(_MISSING_BODY_COMMENT)
 
 
 @pytest.fixture
@@ -132,37 +180,13 @@ def deleted_body_comment() -> dict:
 
     Reddit replaces content with these placeholders. Also useless.
     """
-    return {
-        "id": "deleted123",
-        "body": "[deleted]",
-        "author": "[deleted]",
-        "author_flair_text": None,
-        "author_flair_css_class": None,
-        "subreddit": "lakers",
-        "created_utc": 1709251200,
-        "score": 5,
-        "controversiality": 0,
-        "parent_id": "t1_eee555",
-        "link_id": "t3_post222",
-    }
+    return dict(_DELETED_BODY_COMMENT)
 
 
 @pytest.fixture
 def empty_body_comment() -> dict:
     """Comment with empty string body."""
-    return {
-        "id": "empty123",
-        "body": "",
-        "author": "quietuser",
-        "author_flair_text": "Heat",
-        "author_flair_css_class": "heat",
-        "subreddit": "heat",
-        "created_utc": 1709251200,
-        "score": 1,
-        "controversiality": 0,
-        "parent_id": "t1_fff666",
-        "link_id": "t3_post333",
-    }
+    return dict(_EMPTY_BODY_COMMENT)
 
 
 # ---------------------------------------------------------------------------
@@ -170,25 +194,23 @@ def empty_body_comment() -> dict:
 # ---------------------------------------------------------------------------
 
 
+_MIXED_COMMENTS = (
+    _VALID_NBA_COMMENT,
+    _VALID_TEAM_SUBREDDIT_COMMENT,
+    _WRONG_SUBREDDIT_COMMENT,
+    _MISSING_BODY_COMMENT,
+)
+
+
 @pytest.fixture
-def mixed_comments_batch(
-    valid_nba_comment,
-    valid_team_subreddit_comment,
-    wrong_subreddit_comment,
-    missing_body_comment,
-) -> list[dict]:
+def mixed_comments_batch() -> list[dict]:
     """
     A batch with a mix of valid and invalid comments.
 
     Useful for testing filter logic processes batches correctly.
     Expected: 2 accepted (nba + bostonceltics), 2 rejected.
     """
-    return [
-        valid_nba_comment,
-        valid_team_subreddit_comment,
-        wrong_subreddit_comment,
-        missing_body_comment,
-    ]
+    return [dict(comment) for comment in _MIXED_COMMENTS]
 
 
 # ---------------------------------------------------------------------------
@@ -196,78 +218,168 @@ def mixed_comments_batch(
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
-def sample_jsonl_file(tmp_path, mixed_comments_batch) -> Path:
+@pytest.fixture(scope="session")
+def sample_jsonl_payload() -> bytes:
+    """JSONL bytes for mixed_comments_batch, serialized once per session."""
+    return b"".join(
+        orjson.dumps(c, option=orjson.OPT_APPEND_NEWLINE) for c in _MIXED_COMMENTS
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_jsonl_file(tmp_path_factory, sample_jsonl_payload) -> Path:
     """
     Creates a temporary .jsonl file with test data.
 
-    tmp_path is a built-in pytest fixture that provides a unique
-    temporary directory for each test. Automatically cleaned up.
+    Written once per session under tmp_path_factory (pytest's session-wide
+    temporary directory, cleaned up automatically) and shared by every
+    test, so tests must only read it.
     """
-    filepath = tmp_path / "test_comments.jsonl"
-    with open(filepath, "w") as f:
-        for comment in mixed_comments_batch:
-            f.write(json.dumps(comment) + "\n")
+    filepath = tmp_path_factory.mktemp("jsonl") / "test_comments.jsonl"
+    filepath.write_bytes(sample_jsonl_payload)
     return filepath
 
 
-@pytest.fixture
-def malformed_jsonl_file(tmp_path) -> Path:
+# Three good records interleaved with two corrupt lines (no trailing newline)
+_MALFORMED_JSONL_BYTES = b"\n".join(
+    [
+        b'{"id": "good1", "body": "valid json", "subreddit": "nba"}',
+        b"this is not json at all",
+        b'{"id": "good2", "body": "also valid", "subreddit": "nba"}',
+        b'{"incomplete": "json',
+        b'{"id": "good3", "body": "still going", "subreddit": "nba"}',
+    ]
+)
+
+
+@pytest.fixture(scope="session")
+def malformed_jsonl_file(tmp_path_factory) -> Path:
     """
     JSONL file with some corrupted lines.
 
     Tests that our parser handles bad data gracefully
-    instead of crashing the whole pipeline.
-    """
-    filepath = tmp_path / "malformed_comments.jsonl"
-    lines = [
-        '{"id": "good1", "body": "valid json", "subreddit": "nba"}',
-        "this is not json at all",
-        '{"id": "good2", "body": "also valid", "subreddit": "nba"}',
-        '{"incomplete": "json',
-        '{"id": "good3", "body": "still going", "subreddit": "nba"}',
-    ]
-    filepath.write_text("\n".join(lines))
+    instead of crashing the whole pipeline. Written once per session and
+    shared, so tests must only read it.
+    """
+    filepath = tmp_path_factory.mktemp("jsonl") / "malformed_comments.jsonl"
+    filepath.write_bytes(_MALFORMED_JSONL_BYTES)
     return filepath
 
 
+def _iter_jsonl(path: Path) -> Iterator[dict]:
+    """Yield each record in a JSONL file, skipping blank and malformed lines."""
+    with open(path, "rb") as f:
+        for line in f:
+            if line.isspace():
+                continue
+            try:
+                yield orjson.loads(line)
+            except orjson.JSONDecodeError:
+                continue
+
+
+@pytest.fixture(scope="session")
+def jsonl_iter() -> Callable[[Path], Iterator[dict]]:
+    """
+    Reader for JSONL fixture files such as malformed_jsonl_file.
+
+    Parses each line with orjson from raw bytes and skips lines that fail,
+    the same per-line recovery the pipeline scripts use.
+
+    Usage:
+        records = list(jsonl_iter(malformed_jsonl_file))
+    """
+    return _iter_jsonl
+
+
 # ---------------------------------------------------------------------------
 # API mock fixtures — for Arctic Shift client tests
 # ---------------------------------------------------------------------------
 
 
+# Page items are built once per (start_id, count) and shared: the client
+# only reads them, and each response gets its own list
+@functools.cache
+def _comment_page_items(start_id: int, count: int) -> tuple[dict, ...]:
+    """Sequential comment dicts for a mock page."""
+    return tuple(
+        {"id": str(i), "body": f"comment {i}", "created_utc": 100 + i}
+        for i in range(start_id, start_id + count)
+    )
+
+
+@functools.cache
+def _post_page_items(start_id: int, count: int) -> tuple[dict, ...]:
+    """Sequential post dicts for a mock page."""
+    return tuple(
+        {"id": f"post{i}", "title": f"Post {i}", "created_utc": 100 + i}
+        for i in range(start_id, start_id + count)
+    )
+
+
+class _FakeResponse:
+    """
+    Lightweight stand-in for requests.Response in client tests.
+
+    Plain methods and slots instead of a Mock, which is slow to build.
+    Set `error` to make raise_for_status() raise it (e.g. an HTTPError).
+    """
+
+    __slots__ = ("_data", "headers", "error")
+
+    def __init__(
+        self,
+        data: list[dict],
+        headers: Mapping[str, str] | None = None,
+        error: Exception | None = None,
+    ) -> None:
+        self._data = data
+        self.headers = headers or {}
+        self.error = error
+
+    def json(self) -> dict:
+        """Return the page body as the API shapes it."""
+        return {"data": self._data}
+
+    def raise_for_status(self) -> None:
+        """Raise the configured error, if any."""
+        if self.error is not None:
+            raise self.error
+
+
+@functools.cache
+def _rate_limit_headers(remaining: int, reset: int) -> MappingProxyType:
+    """Read-only rate limit headers, built once per (remaining, reset)."""
+    return MappingProxyType(
+        {
+            "X-RateLimit-Remaining": str(remaining),
+            "X-RateLimit-Reset": str(reset),
+        }
+    )
+
+
 @pytest.fixture
-def mock_api_response() -> Callable[[list[dict], dict[str, str] | None], Mock]:
+def mock_api_response() -> Callable[[list[dict], dict[str, str] | None], _FakeResponse]:
     """
     Factory fixture for creating mock API responses.
 
-    Returns a function that creates a Mock with the specified data and headers.
+    Returns a function that creates a response with the specified data and
+    headers.
 
     Usage:
         response = mock_api_response([{"id": "1"}], {"X-RateLimit-Remaining": "100"})
     """
-
-    def _create_response(
-        data: list[dict],
-        headers: dict[str, str] | None = None,
-    ) -> Mock:
-        mock = Mock()
-        mock.json.return_value = {"data": data}
-        mock.headers = headers or {}
-        mock.raise_for_status = Mock()
-        return mock
-
-    return _create_response
+    return _FakeResponse
 
 
 @pytest.fixture
-def mock_empty_response(mock_api_response) -> Mock:
+def mock_empty_response(mock_api_response) -> _FakeResponse:
     """Empty API response — signals end of pagination."""
     return mock_api_response(data=[], headers={})
 
 
 @pytest.fixture
-def mock_comments_page(mock_api_response) -> Callable[[int, int], Mock]:
+def mock_comments_page(mock_api_response) -> Callable[[int, int], _FakeResponse]:
     """
     Factory for creating mock comment page responses.
 
@@ -278,36 +390,32 @@ def mock_comments_page(mock_api_response) -> Callable[[int, int], Mock]:
         # Creates comments with id="1", id="2"
     """
 
-    def _create_page(start_id: int = 1, count: int = 2) -> Mock:
-        comments = [
-            {"id": str(i), "body": f"comment {i}", "created_utc": 100 + i}
-            for i in range(start_id, start_id + count)
-        ]
+    def _create_page(start_id: int = 1, count: int = 2) -> _FakeResponse:
+        comments = list(_comment_page_items(start_id, count))
         return mock_api_response(data=comments, headers={})
 
     return _create_page
 
 
 @pytest.fixture
-def mock_posts_page(mock_api_response) -> Callable[[int, int], Mock]:
+def mock_posts_page(mock_api_response) -> Callable[[int, int], _FakeResponse]:
     """
     Factory for creating mock post page responses.
 
     Creates posts with sequential IDs and timestamps.
     """
 
-    def _create_page(start_id: int = 1, count: int = 2) -> Mock:
-        posts = [
-            {"id": f"post{i}", "title": f"Post {i}", "created_utc": 100 + i}
-            for i in range(start_id, start_id + count)
-        ]
+    def _create_page(start_id: int = 1, count: int = 2) -> _FakeResponse:
+        posts = list(_post_page_items(start_id, count))
         return mock_api_response(data=posts, headers={})
 
     return _create_page
 
 
 @pytest.fixture
-def mock_rate_limited_response(mock_api_response) -> Callable[[int, int, int], Mock]:
+def mock_rate_limited_response(
+    mock_api_response,
+) -> Callable[[int, int, int], _FakeResponse]:
     """
     Factory for creating responses with rate limit headers.
 
@@ -321,15 +429,9 @@ def mock_rate_limited_response(mock_api_response) -> Callable[[int, int, int], M
         remaining: int,
         reset_timestamp: int,
         count: int = 1,
-    ) -> Mock:
-        data = [
-            {"id": str(i), "body": f"comment {i}", "created_utc": 100 + i}
-            for i in range(1, count + 1)
-        ]
-        headers = {
-            "X-RateLimit-Remaining": str(remaining),
-            "X-RateLimit-Reset": str(reset_timestamp),
-        }
+    ) -> _FakeResponse:
+        data = list(_comment_page_items(1, count))
+        headers = _rate_limit_headers(remaining, reset_timestamp)
         return mock_api_response(data=data, headers=headers)
 
     return _create_response
@@ -339,41 +441,60 @@ def mock_rate_limited_response(mock_api_response) -> Callable[[int, int, int], M
 # Player mention fixtures
 # ---------------------------------------------------------------------------
 
+# Copied per test like the sample comments above
+_PLAYER_MENTION_COMMENT = {
+    "id": "player123",
+    "body": "LeBron is washed, can't believe we traded for him",
+    "author": "hoopsfan42",
+    "author_flair_text": "Lakers",
+    "author_flair_css_class": "lakers",
+    "subreddit": "nba",
+    "created_utc": _TS_2024_03_01,
+    "score": 42,
+    "controversiality": 0,
+    "parent_id": "t1_xyz789",
+    "link_id": "t3_post123",
+}
+
+_NO_PLAYER_MENTION_COMMENT = {
+    "id": "noplayer456",
+    "body": "Great game last night, really exciting finish",
+    "author": "casualfan",
+    "author_flair_text": None,
+    "author_flair_css_class": None,
+    "subreddit": "nba",
+    "created_utc": _TS_2024_03_01,
+    "score": 10,
+    "controversiality": 0,
+    "parent_id": "t1_aaa111",
+    "link_id": "t3_post456",
+}
+
+_SHORT_ALIAS_FALSE_POSITIVE_COMMENT = {
+    "id": "falsepos789",
+    "body": "This advertisement for java programming is bad",
+    "author": "techfan",
+    "author_flair_text": None,
+    "author_flair_css_class": None,
+    "subreddit": "nba",
+    "created_utc": _TS_2024_03_01,
+    "score": 5,
+    "controversiality": 0,
+    "parent_id": "t1_bbb222",
+    "link_id": "t3_post789",
+}
+
 
 @pytest.fixture
 def player_mention_comment() -> dict:
     """Comment that mentions a tracked player (LeBron)."""
-    return {
-        "id": "player123",
-        "body": "LeBron is washed, can't believe we traded for him",
-        "author": "hoopsfan42",
-        "author_flair_text": "Lakers",
-        "author_flair_css_class": "lakers",
-        "subreddit": "nba",
-        "created_utc": 1709251200,
-        "score": 42,
-        "controversiality": 0,
-        "parent_id": "t1_xyz789",
-        "link_id": "t3_post123",
-    }
+    return dict(_PLAYER_MENTION_COMMENT)
 
 
 @pytest.fixture
 def no_player_mention_comment() -> dict:
     """Comment with no tracked player mentions."""
-    return {
-        "id": "noplayer456",
-        "body": "Great game last night, really exciting finish",
-        "author": "casualfan",
-        "author_flair_text": None,
-        "author_flair_css_class": None,
-        "subreddit": "nba",
-        "created_utc": 1709251200,
-        "score": 10,
-        "controversiality": 0,
-        "parent_id": "t1_aaa111",
-        "link_id": "t3_post456",
-    }
+    return dict(_NO_PLAYER_MENTION_COMMENT)
 
 
 @pytest.fixture
@@ -383,81 +504,7 @@ def short_alias_false_positive_comment() -> dict:
 
     Tests word boundary matching - 'AD' should not match 'advertisement'.
     """
-    return {
-        "id": "falsepos789",
-        "body": "This advertisement for java programming is bad",
-        "author": "techfan",
-        "author_flair_text": None,
-        "author_flair_css_class": None,
-        "subreddit": "nba",
-        "created_utc": 1709251200,
-        "score": 5,
-        "controversiality": 0,
-        "parent_id": "t1_bbb222",
-        "link_id": "t3_post789",
-    }
-
-
-# ---------------------------------------------------------------------------
-# Batch API / Sentiment response fixtures
-# ---------------------------------------------------------------------------
-
-
-@pytest.fixture
-def valid_sentiment_responses() -> list[tuple[str, dict]]:
-    """
-    Valid JSON responses from sentiment classification.
-
-    Returns list of (raw_response, expected_parsed) tuples.
-    """
-    return [
-        (
-            '{"s": "pos", "c": 0.95, "p": "LeBron James"}',
-            {"s": "pos", "c": 0.95, "p": "LeBron James"},
-        ),
-        (
-            '{"s": "neg", "c": 0.8, "p": "Russell Westbrook"}',
-            {"s": "neg", "c": 0.8, "p": "Russell Westbrook"},
-        ),
-        (
-            '{"s": "neu", "c": 0.6, "p": null}',
-            {"s": "neu", "c": 0.6, "p": None},
-        ),
-        (
-            '{"s": "pos", "c": 0.9, "p": null}',
-            {"s": "pos", "c": 0.9, "p": None},
-        ),
-    ]
-
-
-@pytest.fixture
-def markdown_wrapped_responses() -> list[tuple[str, str, str | None]]:
-    """
-    Responses wrapped in markdown code blocks.
-
-    Returns list of (raw_response, expected_sentiment, expected_player) tuples.
-    """
-    return [
-        ('```json\n{"s": "pos", "c": 0.9, "p": "LeBron James"}\n```', "pos", "LeBron James"),
-        ('```\n{"s": "neg", "c": 0.75, "p": null}\n```', "neg", None),
-        ('```json{"s": "neu", "c": 0.5, "p": "Curry"}```', "neu", "Curry"),
-    ]
-
-
-@pytest.fixture
-def malformed_responses() -> list[str]:
-    """
-    Malformed responses that should return error dicts.
-
-    Includes: non-JSON, wrong field names, invalid values, etc.
-    """
-    return [
-        "not json at all",
-        '{"sentiment": "positive"}',  # Wrong field names
-        '{"s": "invalid", "c": 0.5}',  # Invalid sentiment value
-        "{malformed json",
-        "[]",  # Array instead of object
-    ]
+    return dict(_SHORT_ALIAS_FALSE_POSITIVE_COMMENT)
 
 
 # ---------------------------------------------------------------------------
@@ -6,8 +6,14 @@ from unittest.mock import patch
 
 import requests
 
-from pipeline.arctic_shift import ArcticShiftClient
+from pipeline.arctic_shift import (
+    ArcticShiftClient,
+    PageHeaders,
+    paced_delay_seconds,
+    parse_page_headers,
+)
 from utils.constants import (
+    ARCTIC_SHIFT_ACCEPT_ENCODING,
     ARCTIC_SHIFT_BASE_URL,
     ARCTIC_SHIFT_COMMENTS_ENDPOINT,
     ARCTIC_SHIFT_POSTS_ENDPOINT,
@@ -249,6 +255,54 @@ class TestRateLimiting:
 
         mock_sleep.assert_not_called()
 
+    def test_paces_requests_over_remaining_quota(
+        self, mock_rate_limited_response, mock_empty_response
+    ):
+        """Verify delay spreads remaining quota over the reset window."""
+        client = ArcticShiftClient(rate_limit_buffer=10, delay=0.5)
+        page = mock_rate_limited_response(remaining=100, reset_timestamp=1050)
+
+        with patch.object(
+            client.session, "get", side_effect=[page, mock_empty_response]
+        ):
+            with patch("pipeline.arctic_shift.time.sleep") as mock_sleep:
+                with patch("pipeline.arctic_shift.time.time", return_value=1000):
+                    list(client.fetch_comments("nba", after=0, before=200))
+
+        # 50s window / 100 remaining = 0.5s, not the fixed delay
+        mock_sleep.assert_called_once_with(0.5)
+
+    def test_paced_delay_scales_with_streams(self):
+        """Verify concurrent streams sharing a quota each wait proportionally longer."""
+        headers = parse_page_headers(
+            {"X-RateLimit-Remaining": "200", "X-RateLimit-Reset": "1100"}
+        )
+
+        with patch("pipeline.arctic_shift.time.time", return_value=1000):
+            assert paced_delay_seconds(headers) == 0.5
+            assert paced_delay_seconds(headers, streams=4) == 2.0
+
+    def test_paced_delay_none_without_reset_header(self):
+        """Verify pacing defers to the fixed delay when no window is reported."""
+        headers = parse_page_headers({"X-RateLimit-Remaining": "100"})
+
+        assert paced_delay_seconds(headers) is None
+        assert paced_delay_seconds(PageHeaders()) is None
+
+    def test_parses_rate_limit_headers_to_ints(self):
+        """Verify headers are parsed once; an empty reset counts as missing."""
+        headers = parse_page_headers(
+            {
+                "X-RateLimit-Remaining": "42",
+                "X-RateLimit-Reset": "",
+                "Content-Encoding": "gzip",
+            }
+        )
+
+        assert headers == PageHeaders(
+            rate_limit_remaining=42, rate_limit_reset=None, content_encoding="gzip"
+        )
+
 
 class TestErrorHandling:
     """Tests for error handling."""
@@ -257,7 +311,7 @@ class TestErrorHandling:
         """Verify HTTP errors are raised as exceptions."""
         client = ArcticShiftClient()
         mock_response = mock_api_response(data=[])
-        mock_response.raise_for_status.side_effect = requests.HTTPError("404 Not Found")
+        mock_response.error = requests.HTTPError("404 Not Found")
 
         with patch.object(client.session, "get", return_value=mock_response):
             with pytest.raises(requests.HTTPError):
@@ -307,3 +361,18 @@ class TestSessionManagement:
         """Verify client can be used as context manager."""
         with ArcticShiftClient() as client:
             assert client.session is not None
+
+    def test_session_mounts_retrying_pooled_adapter(self):
+        """Verify HTTPS requests go through a pooled adapter that retries 5xx/429."""
+        client = ArcticShiftClient()
+        adapter = client.session.get_adapter(ARCTIC_SHIFT_BASE_URL)
+
+        assert adapter.max_retries.total > 0
+        assert 429 in adapter.max_retries.status_forcelist
+        assert 503 in adapter.max_retries.status_forcelist
+
+    def test_session_requests_compressed_responses(self):
+        """Verify the session advertises gzip/deflate so pages arrive compressed."""
+        client = ArcticShiftClient()
+
+        assert client.session.headers["Accept-Encoding"] == ARCTIC_SHIFT_ACCEPT_ENCODING
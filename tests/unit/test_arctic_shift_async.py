@@ -0,0 +1,285 @@
+"""Tests for pipeline.arctic_shift_async module."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiohttp
+import orjson
+import pytest
+
+from pipeline.arctic_shift_async import (
+    AIMDLimiter,
+    ArcticShiftAsyncClient,
+    retry_delay_seconds,
+)
+from utils.constants import (
+    ARCTIC_SHIFT_BASE_URL,
+    ARCTIC_SHIFT_COMMENTS_ENDPOINT,
+    ARCTIC_SHIFT_MAX_RETRIES,
+    ARCTIC_SHIFT_RETRY_MAX_BACKOFF,
+)
+
+
+def _async_response(data: list[dict], headers: dict[str, str] | None = None):
+    """Build a mock usable as ``async with session.get(...) as response``."""
+    response = MagicMock()
+    response.json = AsyncMock(return_value={"data": data})
+    response.headers = headers or {}
+    response.raise_for_status = MagicMock()
+
+    ctx = MagicMock()
+    ctx.__aenter__ = AsyncMock(return_value=response)
+    ctx.__aexit__ = AsyncMock(return_value=None)
+    return ctx
+
+
+def _raw_response(text: str):
+    """Build a mock response whose json() decodes ``text`` with the given loads."""
+    page = _async_response([])
+    response = page.__aenter__.return_value
+    response.json = AsyncMock(side_effect=lambda loads: loads(text))
+    response.text = AsyncMock(return_value=text)
+    return page
+
+
+def _throttled_response(status: int = 429, headers: dict[str, str] | None = None):
+    """Build a mock response whose raise_for_status fails with ``status``."""
+    page = _async_response([], headers)
+    response = page.__aenter__.return_value
+    response.status = status
+    response.raise_for_status.side_effect = aiohttp.ClientResponseError(
+        request_info=MagicMock(), history=(), status=status, headers=headers or {}
+    )
+    return page
+
+
+async def _collect(client: ArcticShiftAsyncClient, responses: list) -> list[dict]:
+    """Run fetch_comments against canned responses and gather the results."""
+    session = MagicMock()
+    session.get = MagicMock(side_effect=responses)
+    client.session = session
+    return [c async for c in client.fetch_comments("nba", after=0, before=200)]
+
+
+class TestFetchComments:
+    """Tests for async comment pagination."""
+
+    def test_paginates_until_empty_page(self):
+        """Verify pages are fetched until an empty response is received."""
+        client = ArcticShiftAsyncClient(delay=0)
+        page = _async_response(
+            [{"id": "1", "created_utc": 101}, {"id": "2", "created_utc": 102}]
+        )
+
+        comments = asyncio.run(_collect(client, [page, _async_response([])]))
+
+        assert [c["id"] for c in comments] == ["1", "2"]
+
+    def test_decodes_body_with_orjson(self):
+        """Verify the response body is decoded with orjson rather than stdlib json."""
+        client = ArcticShiftAsyncClient(delay=0)
+        page = _async_response([{"id": "1", "created_utc": 101}])
+
+        asyncio.run(_collect(client, [page, _async_response([])]))
+
+        response = page.__aenter__.return_value
+        response.json.assert_awaited_once_with(loads=orjson.loads)
+
+    def test_lone_surrogate_body_falls_back_to_stdlib(self):
+        """Verify a lone surrogate orjson rejects is decoded with stdlib json."""
+        client = ArcticShiftAsyncClient(delay=0)
+        page = _raw_response(
+            '{"data": [{"id": "1", "created_utc": 101, "body": "hi \\ud83d"}]}'
+        )
+
+        comments = asyncio.run(_collect(client, [page, _async_response([])]))
+
+        assert comments == [{"id": "1", "created_utc": 101, "body": "hi \ud83d"}]
+
+    def test_invalid_body_raises_chained_error(self):
+        """Verify a body neither parser accepts raises, chained to orjson's error."""
+        client = ArcticShiftAsyncClient(delay=0)
+
+        with pytest.raises(json.JSONDecodeError) as exc_info:
+            asyncio.run(_collect(client, [_raw_response('{"data": [')]))
+
+        assert isinstance(exc_info.value.__cause__, orjson.JSONDecodeError)
+
+    def test_cursor_advances_past_last_timestamp(self):
+        """Verify second request starts after the last item's timestamp."""
+        client = ArcticShiftAsyncClient(delay=0)
+        page = _async_response([{"id": "1", "created_utc": 150}])
+        session = MagicMock()
+        session.get = MagicMock(side_effect=[page, _async_response([])])
+        client.session = session
+
+        async def run() -> None:
+            async for _ in client.fetch_comments("nba", after=0, before=200):
+                pass
+
+        asyncio.run(run())
+
+        first_url = session.get.call_args_list[0].args[0]
+        second_params = session.get.call_args_list[1].kwargs["params"]
+        assert first_url == f"{ARCTIC_SHIFT_BASE_URL}{ARCTIC_SHIFT_COMMENTS_ENDPOINT}"
+        assert second_params["after"] == 151
+
+
+class TestRateLimiting:
+    """Tests for async rate limit handling."""
+
+    def test_sleeps_when_rate_limit_low(self):
+        """Verify client awaits a sleep when approaching rate limit."""
+        client = ArcticShiftAsyncClient(rate_limit_buffer=10, delay=0)
+        page = _async_response(
+            [{"id": "1", "created_utc": 100}],
+            headers={"X-RateLimit-Remaining": "5"},
+        )
+
+        with patch(
+            "pipeline.arctic_shift_async.asyncio.sleep", new=AsyncMock()
+        ) as mock_sleep:
+            asyncio.run(_collect(client, [page, _async_response([])]))
+
+        mock_sleep.assert_awaited_once_with(60)
+
+
+class TestAIMDLimiter:
+    """Tests for adaptive request concurrency."""
+
+    def test_throttle_halves_limit_down_to_floor(self):
+        """Verify multiplicative decrease never drops below min_limit."""
+        limiter = AIMDLimiter(max_limit=8, decrease=0.5)
+
+        limiter.record_throttle()
+        assert limiter.limit == 4
+        for _ in range(10):
+            limiter.record_throttle()
+        assert limiter.limit == 1
+
+    def test_success_grows_limit_up_to_ceiling(self):
+        """Verify additive increase recovers the limit but caps at max_limit."""
+        limiter = AIMDLimiter(max_limit=4, increase=0.5)
+        limiter.limit = 2.0
+
+        limiter.record_success()
+        assert limiter.limit == 2.25
+        for _ in range(100):
+            limiter.record_success()
+        assert limiter.limit == 4
+
+    def test_caps_in_flight_requests(self):
+        """Verify no more than int(limit) holders run concurrently."""
+        limiter = AIMDLimiter(max_limit=4)
+        limiter.limit = 2.0
+        peak = 0
+
+        async def worker() -> None:
+            nonlocal peak
+            async with limiter:
+                peak = max(peak, limiter.in_flight)
+                await asyncio.sleep(0)
+
+        async def run() -> None:
+            await asyncio.gather(*(worker() for _ in range(6)))
+
+        asyncio.run(run())
+
+        assert peak == 2
+        assert limiter.in_flight == 0
+
+    def test_throttled_response_reduces_limit(self):
+        """Verify a 429 response shrinks the client's concurrency cap."""
+        client = ArcticShiftAsyncClient(delay=0, connection_limit=8)
+
+        with patch("pipeline.arctic_shift_async.asyncio.sleep", new=AsyncMock()):
+            asyncio.run(_collect(client, [_throttled_response(), _async_response([])]))
+
+        # Halved to 4 by the 429, then nudged up by the successful retry
+        assert 4 <= client.limiter.limit < 5
+
+
+class TestErrorHandling:
+    """Tests for async error handling."""
+
+    def test_http_error_raises_exception(self):
+        """Verify HTTP errors are raised as exceptions."""
+        client = ArcticShiftAsyncClient(delay=0)
+        page = _async_response([])
+        response = page.__aenter__.return_value
+        response.raise_for_status.side_effect = aiohttp.ClientResponseError(
+            request_info=MagicMock(), history=(), status=404
+        )
+
+        with pytest.raises(aiohttp.ClientResponseError):
+            asyncio.run(_collect(client, [page]))
+
+    def test_retries_transient_status_then_succeeds(self):
+        """Verify a 503 is retried and pagination continues."""
+        client = ArcticShiftAsyncClient(delay=0)
+        page = _async_response([{"id": "1", "created_utc": 100}])
+
+        with patch(
+            "pipeline.arctic_shift_async.asyncio.sleep", new=AsyncMock()
+        ) as mock_sleep:
+            comments = asyncio.run(
+                _collect(client, [_throttled_response(503), page, _async_response([])])
+            )
+
+        assert [c["id"] for c in comments] == ["1"]
+        mock_sleep.assert_awaited_once()
+
+    def test_honours_retry_after_header(self):
+        """Verify a 429 with Retry-After waits the server-requested time."""
+        client = ArcticShiftAsyncClient(delay=0)
+        throttled = _throttled_response(429, headers={"Retry-After": "7"})
+
+        with patch(
+            "pipeline.arctic_shift_async.asyncio.sleep", new=AsyncMock()
+        ) as mock_sleep:
+            asyncio.run(_collect(client, [throttled, _async_response([])]))
+
+        mock_sleep.assert_awaited_once_with(7.0)
+
+    def test_raises_after_exhausting_retries(self):
+        """Verify persistent failures propagate instead of retrying forever."""
+        client = ArcticShiftAsyncClient(delay=0)
+        attempts = ARCTIC_SHIFT_MAX_RETRIES + 1
+        responses = [_throttled_response(500) for _ in range(attempts)]
+
+        with (
+            patch(
+                "pipeline.arctic_shift_async.asyncio.sleep", new=AsyncMock()
+            ) as mock_sleep,
+            pytest.raises(aiohttp.ClientResponseError),
+        ):
+            asyncio.run(_collect(client, responses))
+
+        assert mock_sleep.await_count == ARCTIC_SHIFT_MAX_RETRIES
+
+    def test_backoff_grows_exponentially_with_cap(self):
+        """Verify computed backoff doubles per attempt and stays under the cap."""
+        with patch("pipeline.arctic_shift_async.random.uniform", return_value=0):
+            delays = [retry_delay_seconds(attempt) for attempt in range(10)]
+
+        assert delays[:3] == [0.5, 1.0, 2.0]
+        assert max(delays) == ARCTIC_SHIFT_RETRY_MAX_BACKOFF
+
+
+class TestSessionManagement:
+    """Tests for async session lifecycle."""
+
+    def test_context_manager_opens_and_closes_session(self):
+        """Verify session exists inside the context and is closed after."""
+
+        async def run() -> tuple[bool, bool]:
+            async with ArcticShiftAsyncClient() as client:
+                session = client.session
+                opened = session is not None and not session.closed
+            return opened, session.closed and client.session is None
+
+        opened, closed = asyncio.run(run())
+
+        assert opened
+        assert closed
@@ -1,22 +1,95 @@
 """Tests for pipeline.batch module."""
 
 import json
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import NamedTuple
 
+import orjson
+import polars as pl
 import pytest
 
 from pipeline.batch import (
     MAX_TOKENS,
     MODEL,
     TEMPERATURE,
+    StateJournal,
+    append_state_delta,
     build_prompt,
     calculate_cost,
     format_batch_request,
+    format_batch_request_bytes,
     init_state,
     load_state,
     parse_response,
+    parse_response_expr,
     save_state,
 )
 
+# -----------------------------------------------------------------------------
+# Sentiment response cases
+# -----------------------------------------------------------------------------
+
+
+class _SentimentCase(NamedTuple):
+    """Raw model output and the dict parse_response should return."""
+
+    raw: str
+    parsed: Mapping[str, object]
+
+
+class _WrappedCase(NamedTuple):
+    """Markdown-wrapped model output and its expected fields."""
+
+    raw: str
+    sentiment: str
+    player: str | None
+
+
+# Well-formed model output: parse_response should match a plain JSON decode
+_VALID_SENTIMENT_RAW = (
+    '{"s": "pos", "c": 0.95, "p": "LeBron James"}',
+    '{"s": "neg", "c": 0.8, "p": "Russell Westbrook"}',
+    '{"s": "neu", "c": 0.6, "p": null}',
+    '{"s": "pos", "c": 0.9, "p": null}',
+)
+
+# Expected dicts are decoded once from the raw strings, so the two sides
+# cannot drift, and are read-only so no test can alter another's case
+_VALID_SENTIMENT_RESPONSES = tuple(
+    _SentimentCase(raw, MappingProxyType(orjson.loads(raw)))
+    for raw in _VALID_SENTIMENT_RAW
+)
+
+_MARKDOWN_WRAPPED_RESPONSES = (
+    _WrappedCase(
+        '```json\n{"s": "pos", "c": 0.9, "p": "LeBron James"}\n```',
+        "pos",
+        "LeBron James",
+    ),
+    _WrappedCase('```\n{"s": "neg", "c": 0.75, "p": null}\n```', "neg", None),
+    _WrappedCase('```json{"s": "neu", "c": 0.5, "p": "Curry"}```', "neu", "Curry"),
+)
+
+# (raw_response, expected_player): a non-string "p" is stringified in the
+# Expr path so the row fits the struct's String field
+_NON_STRING_PLAYER_RESPONSES = (
+    ('{"s": "pos", "c": 0.9, "p": 5}', "5"),
+    (
+        '{"s": "neg", "c": 0.5, "p": ["LeBron James", "Anthony Davis"]}',
+        "['LeBron James', 'Anthony Davis']",
+    ),
+)
+
+# Should parse to error dicts: non-JSON, wrong field names, invalid values
+_MALFORMED_RESPONSES = (
+    "not json at all",
+    '{"sentiment": "positive"}',  # Wrong field names
+    '{"s": "invalid", "c": 0.5}',  # Invalid sentiment value
+    "{malformed json",
+    "[]",  # Array instead of object
+)
+
 
 class TestBuildPrompt:
     """Tests for build_prompt function."""
@@ -54,31 +127,33 @@ class TestBuildPrompt:
 class TestParseResponse:
     """Tests for parse_response function."""
 
-    def test_valid_json(self, valid_sentiment_responses: list[tuple[str, dict]]):
+    @pytest.mark.parametrize(("raw_response", "expected"), _VALID_SENTIMENT_RESPONSES)
+    def test_valid_json(self, raw_response: str, expected: Mapping[str, object]):
         """Verify valid JSON responses are parsed correctly."""
-        for raw_response, expected in valid_sentiment_responses:
-            result = parse_response(raw_response)
-            assert result == expected
+        result = parse_response(raw_response)
+        assert result == expected
 
+    @pytest.mark.parametrize(
+        ("raw_response", "expected_s", "expected_p"), _MARKDOWN_WRAPPED_RESPONSES
+    )
     def test_markdown_wrapped(
-        self, markdown_wrapped_responses: list[tuple[str, str, str | None]]
+        self, raw_response: str, expected_s: str, expected_p: str | None
     ):
         """Verify markdown-wrapped JSON is handled correctly."""
-        for raw_response, expected_s, expected_p in markdown_wrapped_responses:
-            result = parse_response(raw_response)
+        result = parse_response(raw_response)
 
-            assert result["s"] == expected_s
-            assert result["p"] == expected_p
+        assert result["s"] == expected_s
+        assert result["p"] == expected_p
 
-    def test_malformed_returns_error(self, malformed_responses: list[str]):
+    @pytest.mark.parametrize("raw_response", _MALFORMED_RESPONSES)
+    def test_malformed_returns_error(self, raw_response: str):
         """Verify malformed responses return error dict with raw field."""
-        for raw_response in malformed_responses:
-            result = parse_response(raw_response)
+        result = parse_response(raw_response)
 
-            assert result["s"] == "error"
-            assert result["c"] == 0.0
-            assert result["p"] is None
-            assert result["raw"] == raw_response
+        assert result["s"] == "error"
+        assert result["c"] == 0.0
+        assert result["p"] is None
+        assert result["raw"] == raw_response
 
     def test_empty_string(self):
         """Verify empty string returns error dict."""
@@ -98,6 +173,57 @@ class TestParseResponse:
         assert result["p"] is None
 
 
+class TestParseResponseExpr:
+    """Tests for parse_response_expr function."""
+
+    @staticmethod
+    def _parse(texts: list[str | None]) -> list[dict | None]:
+        """Run parse_response_expr over texts and return struct rows."""
+        return (
+            pl.DataFrame({"content": texts}, schema={"content": pl.Utf8})
+            .select(parse_response_expr(pl.col("content")).alias("parsed"))
+            .get_column("parsed")
+            .to_list()
+        )
+
+    def test_matches_parse_response(self):
+        """Verify fast and fallback paths agree with parse_response."""
+        texts = (
+            [case.raw for case in _VALID_SENTIMENT_RESPONSES]
+            + [case.raw for case in _MARKDOWN_WRAPPED_RESPONSES]
+            + list(_MALFORMED_RESPONSES)
+            + ['{"p": null, "c": 0.5, "s": "neg"}', '{"s": "pos", "c": 1, "p": ""}']
+        )
+
+        for text, parsed in zip(texts, self._parse(texts)):
+            expected = parse_response(text)
+            expected.pop("raw", None)
+            assert parsed == expected
+
+    def test_escaped_player_uses_fallback(self):
+        """Verify JSON escapes in the player name are decoded."""
+        parsed = self._parse(['{"s": "pos", "c": 0.9, "p": "Luka Don\\u010di\\u0107"}'])
+
+        assert parsed == [{"s": "pos", "c": 0.9, "p": "Luka Dončić"}]
+
+    @pytest.mark.parametrize(
+        ("raw_response", "expected_p"), _NON_STRING_PLAYER_RESPONSES
+    )
+    def test_non_string_player_is_stringified(self, raw_response: str, expected_p: str):
+        """Verify a non-string "p" does not fail the column and becomes a str."""
+        parsed = self._parse([_VALID_SENTIMENT_RAW[0], raw_response])
+
+        assert parsed[0] == dict(_VALID_SENTIMENT_RESPONSES[0].parsed)
+        assert parsed[1]["s"] == parse_response(raw_response)["s"]
+        assert parsed[1]["p"] == expected_p
+
+    def test_null_stays_null(self):
+        """Verify null content produces null fields."""
+        parsed = self._parse([None])
+
+        assert parsed == [{"s": None, "c": None, "p": None}]
+
+
 class TestCalculateCost:
     """Tests for calculate_cost function."""
 
@@ -161,6 +287,50 @@ class TestFormatBatchRequest:
         assert valid_nba_comment["body"] in messages[0]["content"]
 
 
+class TestFormatBatchRequestBytes:
+    """Tests for format_batch_request_bytes function."""
+
+    def test_matches_serialized_dict(self, valid_nba_comment: dict):
+        """Verify output is byte-identical to serializing format_batch_request."""
+        result = format_batch_request_bytes(valid_nba_comment)
+
+        assert result == orjson.dumps(format_batch_request(valid_nba_comment))
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            'He said "washed" \\ twice',
+            "Line one\nLine two\ttabbed",
+            "Jokić is the MVP 🃏",
+            "\x00\x01 control chars",
+        ],
+    )
+    def test_escapes_body(self, valid_nba_comment: dict, body: str):
+        """Verify quotes, backslashes, control chars, and non-ASCII round-trip."""
+        comment = {**valid_nba_comment, "body": body}
+
+        result = format_batch_request_bytes(comment)
+
+        assert result == orjson.dumps(format_batch_request(comment))
+        assert orjson.loads(result) == format_batch_request(comment)
+
+    def test_non_string_body_falls_back(self, valid_nba_comment: dict):
+        """Verify a non-string body is serialized through the dict path."""
+        comment = {**valid_nba_comment, "body": None}
+
+        result = format_batch_request_bytes(comment)
+
+        assert result == orjson.dumps(format_batch_request(comment))
+
+    def test_lone_surrogate_body_escaped(self, valid_nba_comment: dict):
+        """Verify a lone surrogate orjson cannot encode is written escaped."""
+        comment = {**valid_nba_comment, "body": "Jokić \ud83d"}
+
+        result = format_batch_request_bytes(comment)
+
+        assert json.loads(result) == format_batch_request(comment)
+
+
 class TestInitState:
     """Tests for init_state function."""
 
@@ -316,3 +486,101 @@ class TestSaveState:
             loaded = json.load(f)
 
         assert loaded["total_input_tokens"] == 9999
+
+
+class TestStateLog:
+    """Tests for append_state_delta and state log replay."""
+
+    def test_load_state_replays_deltas(self, tmp_path):
+        """Verify logged deltas are applied on top of the snapshot."""
+        state_path = tmp_path / "state.json"
+        state = init_state()
+        state["batches"] = [{"batch_id": "msgbatch_a", "status": "in_progress"}]
+        save_state(state, state_path)
+
+        append_state_delta(state_path, {"batch_id": "msgbatch_a", "status": "ended"})
+        append_state_delta(
+            state_path, {"batch_id": "msgbatch_a", "results_downloaded": True}
+        )
+
+        loaded = load_state(state_path)
+
+        assert loaded["batches"] == [
+            {"batch_id": "msgbatch_a", "status": "ended", "results_downloaded": True}
+        ]
+
+    def test_unknown_batch_is_appended(self, tmp_path):
+        """Verify a delta for a new batch_id adds a batch entry."""
+        state_path = tmp_path / "state.json"
+        append_state_delta(state_path, {"batch_id": "msgbatch_new", "batch_num": 1})
+
+        loaded = load_state(state_path)
+
+        assert loaded["batches"] == [{"batch_id": "msgbatch_new", "batch_num": 1}]
+
+    def test_replay_is_idempotent(self, tmp_path):
+        """Verify loading twice without a snapshot gives the same state."""
+        state_path = tmp_path / "state.json"
+        append_state_delta(state_path, {"batch_id": "msgbatch_a", "status": "ended"})
+
+        assert load_state(state_path) == load_state(state_path)
+
+    def test_ignores_truncated_last_line(self, tmp_path):
+        """Verify a partial delta from an interrupted append is skipped."""
+        state_path = tmp_path / "state.json"
+        append_state_delta(state_path, {"batch_id": "msgbatch_a", "status": "ended"})
+        with open(tmp_path / "state.log", "ab") as f:
+            f.write(b'{"batch_id": "msgbatch_a", "sta')
+
+        loaded = load_state(state_path)
+
+        assert loaded["batches"] == [{"batch_id": "msgbatch_a", "status": "ended"}]
+
+    def test_save_state_clears_log(self, tmp_path):
+        """Verify a full snapshot removes the delta log."""
+        state_path = tmp_path / "state.json"
+        append_state_delta(state_path, {"batch_id": "msgbatch_a", "status": "ended"})
+
+        save_state(load_state(state_path), state_path)
+
+        assert not (tmp_path / "state.log").exists()
+        assert load_state(state_path)["batches"][0]["status"] == "ended"
+
+
+class TestStateJournal:
+    """Tests for StateJournal class."""
+
+    def test_record_appends_without_snapshot(self, tmp_path):
+        """Verify record writes to the log, not the state file."""
+        state_path = tmp_path / "state.json"
+        journal = StateJournal(init_state(), state_path, snapshot_every=10)
+
+        journal.record({"batch_id": "msgbatch_a", "status": "ended"})
+
+        assert not state_path.exists()
+        assert (tmp_path / "state.log").exists()
+
+    def test_snapshots_after_threshold(self, tmp_path):
+        """Verify the full state is saved once snapshot_every deltas accumulate."""
+        state_path = tmp_path / "state.json"
+        state = init_state()
+        journal = StateJournal(state, state_path, snapshot_every=2)
+
+        state["batches"].append({"batch_id": "msgbatch_a", "status": "ended"})
+        journal.record({"batch_id": "msgbatch_a", "status": "ended"})
+        journal.record({"batch_id": "msgbatch_a", "results_downloaded": True})
+
+        assert state_path.exists()
+        assert not (tmp_path / "state.log").exists()
+
+    def test_snapshot_writes_state(self, tmp_path):
+        """Verify snapshot persists the in-memory state."""
+        state_path = tmp_path / "state.json"
+        state = init_state()
+        state["total_input_tokens"] = 42
+        journal = StateJournal(state, state_path)
+
+        journal.snapshot()
+
+        with open(state_path) as f:
+            assert json.load(f)["total_input_tokens"] == 42
@@ -0,0 +1,53 @@
+"""Unit tests for clean_raw_comments script."""
+
+import json
+from pathlib import Path
+
+import zstandard
+
+from scripts.clean_raw_comments import open_raw_lines, process_file
+
+
+class TestOpenRawLines:
+    """Tests for open_raw_lines function."""
+
+    def test_reads_across_zstd_frames(self, tmp_path: Path):
+        """Lines from every concatenated frame should be read, in order."""
+        input_path = tmp_path / "raw.jsonl.zst"
+        compressor = zstandard.ZstdCompressor()
+        input_path.write_bytes(
+            compressor.compress(b'{"id": "1"}\n{"id": "2"}\n')
+            + compressor.compress(b'{"id": "3"}\n')
+        )
+
+        with open_raw_lines(input_path) as f:
+            ids = [json.loads(line)["id"] for line in f]
+
+        assert ids == ["1", "2", "3"]
+
+    def test_reads_plain_jsonl(self, tmp_path: Path):
+        """Uncompressed files should be read as text."""
+        input_path = tmp_path / "raw.jsonl"
+        input_path.write_text('{"id": "1"}\n')
+
+        with open_raw_lines(input_path) as f:
+            assert f.readlines() == ['{"id": "1"}\n']
+
+
+class TestProcessFile:
+    """Tests for process_file function."""
+
+    def test_lone_surrogate_body_written(self, tmp_path: Path):
+        """A lone surrogate json.loads accepts should not abort the run."""
+        input_path = tmp_path / "raw.jsonl"
+        input_path.write_text(
+            '{"id": "1", "body": "LeBron \\ud83d"}\n{"id": "2", "body": "Steph"}\n'
+        )
+        output_path = tmp_path / "cleaned.jsonl"
+
+        stats, _ = process_file(input_path, output_path, skip_line_count=True)
+
+        assert stats.accepted == 2
+        first, second = map(json.loads, output_path.read_text().splitlines())
+        assert first["body"] == "LeBron \ud83d"
+        assert second["body"] == "Steph"
@@ -0,0 +1,548 @@
+"""Unit tests for collect_results script."""
+
+import asyncio
+import os
+from pathlib import Path
+
+import orjson
+import pytest
+
+import scripts.collect_results as cr
+from pipeline.batch import StateJournal, init_state, load_state, save_state
+from scripts.collect_results import (
+    _BatchIndex,
+    build_sentiment_dataframe,
+    poll_and_download_batches,
+)
+
+# -----------------------------------------------------------------------------
+# Helpers
+# -----------------------------------------------------------------------------
+
+
+def _batch(batch_num: int, status: str, downloaded: bool = False) -> dict:
+    """Build a state batch entry."""
+    batch = {
+        "batch_num": batch_num,
+        "batch_id": f"msgbatch_{batch_num}",
+        "status": status,
+    }
+    if downloaded:
+        batch["results_downloaded"] = True
+    return batch
+
+
+def _status(processing_status: str) -> dict:
+    """Build a get_batch_status_async result."""
+    return {
+        "processing_status": processing_status,
+        "request_counts": {"succeeded": 1, "errored": 0},
+        "ended_at": "2025-01-01T00:00:00Z" if processing_status == "ended" else None,
+        "results_url": None,
+    }
+
+
+def _succeeded(custom_id: str, content: str, tokens: int = 10) -> dict:
+    """Build a succeeded results row."""
+    return {
+        "custom_id": custom_id,
+        "result_type": "succeeded",
+        "content": content,
+        "input_tokens": tokens,
+        "output_tokens": tokens // 10,
+        "error": None,
+    }
+
+
+def _failed(custom_id: str, result_type: str) -> dict:
+    """Build a non-succeeded results row."""
+    return {
+        "custom_id": custom_id,
+        "result_type": result_type,
+        "content": None,
+        "input_tokens": None,
+        "output_tokens": None,
+        "error": f"request {result_type}",
+    }
+
+
+def _write_jsonl(path: Path, rows: list[dict]) -> None:
+    """Write rows as JSONL."""
+    path.write_bytes(
+        b"".join(orjson.dumps(row, option=orjson.OPT_APPEND_NEWLINE) for row in rows)
+    )
+
+
+def _comment(comment_id: str) -> dict:
+    """Build a filtered comment row."""
+    return {
+        "id": comment_id,
+        "body": f"comment {comment_id}",
+        "author": "fan",
+        "author_flair_text": None,
+        "author_flair_css_class": None,
+        "created_utc": 1709251200,
+        "score": 1,
+        "mentioned_players": ["LeBron James"],
+    }
+
+
+@pytest.fixture
+def fake_batch_api(monkeypatch):
+    """Replace the async Batch API calls with canned statuses and results."""
+    api = {"statuses": {}, "results": {}, "downloads": []}
+
+    async def get_status(batch_id, client):
+        return api["statuses"][batch_id]
+
+    async def download(batch_id, client):
+        api["downloads"].append(batch_id)
+        return api["results"][batch_id]
+
+    monkeypatch.setattr(cr, "get_batch_status_async", get_status)
+    monkeypatch.setattr(cr, "download_results_async", download)
+    return api
+
+
+# -----------------------------------------------------------------------------
+# Tests
+# -----------------------------------------------------------------------------
+
+
+class TestBatchIndex:
+    """Tests for _BatchIndex stage tracking."""
+
+    def test_from_state_groups_by_stage(self):
+        """Batches should be split into pending and downloadable by state."""
+        state = init_state()
+        state["batches"] = [
+            _batch(1, "in_progress"),
+            _batch(2, "ended"),
+            _batch(3, "ended", downloaded=True),
+        ]
+
+        index = _BatchIndex.from_state(state)
+
+        assert index.pending == {"msgbatch_1"}
+        assert index.downloadable == {"msgbatch_2"}
+        assert index.not_downloaded == {"msgbatch_1", "msgbatch_2"}
+        assert index.by_id["msgbatch_3"] is state["batches"][2]
+
+    def test_marks_move_batches_between_stages(self):
+        """mark_ended and mark_downloaded should move a batch forward."""
+        state = init_state()
+        state["batches"] = [_batch(1, "in_progress")]
+        index = _BatchIndex.from_state(state)
+
+        index.mark_ended("msgbatch_1")
+        assert index.pending == set()
+        assert index.downloadable == {"msgbatch_1"}
+
+        index.mark_downloaded("msgbatch_1")
+        assert index.not_downloaded == set()
+
+
+class TestPollAndDownloadBatches:
+    """Tests for one poll cycle."""
+
+    def test_downloads_ended_batches(self, tmp_path: Path, fake_batch_api):
+        """A batch that ends this cycle should be downloaded in the same cycle."""
+        state = init_state()
+        state["batches"] = [
+            _batch(1, "in_progress"),
+            _batch(2, "in_progress"),
+            _batch(3, "ended"),
+        ]
+        fake_batch_api["statuses"] = {
+            "msgbatch_1": _status("ended"),
+            "msgbatch_2": _status("in_progress"),
+        }
+        fake_batch_api["results"] = {
+            "msgbatch_1": [_succeeded("c1", '{"s":"pos","c":0.9,"p":null}')],
+            "msgbatch_3": [_failed("c3", "errored")],
+        }
+        index = _BatchIndex.from_state(state)
+        journal = StateJournal(state, tmp_path / "state.json")
+
+        progressed = asyncio.run(
+            poll_and_download_batches(index, journal, tmp_path, client=None)
+        )
+
+        assert progressed == 2
+        assert sorted(fake_batch_api["downloads"]) == ["msgbatch_1", "msgbatch_3"]
+        assert index.pending == {"msgbatch_2"}
+        assert index.downloadable == set()
+        assert state["batches"][0]["status"] == "ended"
+        assert state["batches"][0]["results_downloaded"] is True
+        assert "results_downloaded" not in state["batches"][1]
+        rows = (tmp_path / "batch_001_results.jsonl").read_bytes().splitlines()
+        assert [orjson.loads(row)["custom_id"] for row in rows] == ["c1"]
+
+    def test_failed_download_stays_downloadable(
+        self, tmp_path: Path, fake_batch_api, monkeypatch
+    ):
+        """A download error should leave the batch for the next cycle."""
+        state = init_state()
+        state["batches"] = [_batch(1, "ended")]
+
+        async def failing_download(batch_id, client):
+            raise RuntimeError("API down")
+
+        monkeypatch.setattr(cr, "download_results_async", failing_download)
+        index = _BatchIndex.from_state(state)
+        journal = StateJournal(state, tmp_path / "state.json")
+
+        progressed = asyncio.run(
+            poll_and_download_batches(index, journal, tmp_path, client=None)
+        )
+
+        assert progressed == 0
+        assert index.downloadable == {"msgbatch_1"}
+        assert "results_downloaded" not in state["batches"][0]
+
+
+class TestStateReplay:
+    """Tests that journaled poll cycles replay to the in-memory state."""
+
+    def test_interrupted_run_resumes_from_log(self, tmp_path: Path, fake_batch_api):
+        """Deltas logged before a crash should rebuild the state and index."""
+        state_path = tmp_path / "state.json"
+        state = init_state()
+        state["batches"] = [_batch(1, "in_progress"), _batch(2, "in_progress")]
+        save_state(state, state_path)
+        fake_batch_api["statuses"] = {
+            "msgbatch_1": _status("ended"),
+            "msgbatch_2": _status("in_progress"),
+        }
+        fake_batch_api["results"] = {"msgbatch_1": [_failed("c1", "expired")]}
+        index = _BatchIndex.from_state(state)
+        journal = StateJournal(state, state_path, snapshot_every=100)
+
+        asyncio.run(poll_and_download_batches(index, journal, tmp_path, client=None))
+
+        # No snapshot was taken, so the reload comes from snapshot + log
+        reloaded = load_state(state_path)
+        assert (tmp_path / "state.log").exists()
+        assert reloaded == state
+        reloaded_index = _BatchIndex.from_state(reloaded)
+        assert reloaded_index.pending == {"msgbatch_2"}
+        assert reloaded_index.downloadable == set()
+
+    def test_unchanged_status_not_logged(self, tmp_path: Path, fake_batch_api):
+        """A poll that changes nothing should not append to the log."""
+        state_path = tmp_path / "state.json"
+        state = init_state()
+        status = _status("in_progress")
+        state["batches"] = [
+            {
+                **_batch(1, "in_progress"),
+                "request_counts": status["request_counts"],
+                "ended_at": None,
+                "results_url": None,
+            }
+        ]
+        fake_batch_api["statuses"] = {"msgbatch_1": status}
+        index = _BatchIndex.from_state(state)
+        journal = StateJournal(state, state_path)
+
+        asyncio.run(poll_and_download_batches(index, journal, tmp_path, client=None))
+
+        assert not (tmp_path / "state.log").exists()
+
+
+class TestBuildSentimentDataframe:
+    """Tests for build_sentiment_dataframe counts and totals."""
+
+    def test_counts_and_token_totals(self, tmp_path: Path):
+        """Counts, token totals and failed rows should come from the results."""
+        responses_dir = tmp_path / "responses"
+        responses_dir.mkdir()
+        _write_jsonl(
+            responses_dir / "batch_001_results.jsonl",
+            [
+                _succeeded("c1", '{"s":"pos","c":0.9,"p":"LeBron James"}', 100),
+                _succeeded("c2", "not json", 200),
+                _failed("c3", "errored"),
+            ],
+        )
+        _write_jsonl(
+            responses_dir / "batch_002_results.jsonl",
+            [
+                _succeeded("c4", '{"s":"neg","c":0.5,"p":null}', 300),
+                _failed("c5", "expired"),
+            ],
+        )
+        filtered_path = tmp_path / "mentions.jsonl"
+        _write_jsonl(filtered_path, [_comment(c) for c in ("c1", "c2", "c4")])
+        failed_path = tmp_path / "failed_requests.jsonl"
+        state = init_state()
+
+        joined_lf, failed_count, results_count = build_sentiment_dataframe(
+            responses_dir, filtered_path, state, failed_path
+        )
+
+        assert results_count == 3
+        assert failed_count == 2
+        assert state["total_input_tokens"] == 600
+        assert state["total_output_tokens"] == 60
+        failed = [orjson.loads(line) for line in failed_path.read_bytes().splitlines()]
+        assert sorted(row["custom_id"] for row in failed) == ["c3", "c5"]
+
+        joined = joined_lf.collect().sort("comment_id")
+        assert joined["comment_id"].to_list() == ["c1", "c2", "c4"]
+        assert joined["sentiment"].to_list() == ["pos", "error", "neg"]
+        assert joined["sentiment_player"].to_list() == ["LeBron James", None, None]
+
+    def test_no_failures_writes_no_failed_file(self, tmp_path: Path):
+        """Without failed requests, no failed file should be written."""
+        responses_dir = tmp_path / "responses"
+        responses_dir.mkdir()
+        _write_jsonl(
+            responses_dir / "batch_001_results.jsonl",
+            [_succeeded("c1", '{"s":"neu","c":0.7,"p":null}')],
+        )
+        filtered_path = tmp_path / "mentions.jsonl"
+        _write_jsonl(filtered_path, [_comment("c1")])
+        failed_path = tmp_path / "failed_requests.jsonl"
+
+        _, failed_count, results_count = build_sentiment_dataframe(
+            responses_dir, filtered_path, init_state(), failed_path
+        )
+
+        assert (failed_count, results_count) == (0, 1)
+        assert not failed_path.exists()
+
+    def test_missing_results_raises(self, tmp_path: Path):
+        """An empty responses directory should raise FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            build_sentiment_dataframe(
+                tmp_path, tmp_path / "mentions.jsonl", init_state(), tmp_path / "f"
+            )
+
+
+class TestParsedResultsCache:
+    """Tests for the per-file parsed-results parquet cache."""
+
+    @pytest.fixture
+    def results_file(self, tmp_path: Path) -> Path:
+        """A results file with one succeeded and one failed row."""
+        path = tmp_path / "batch_001_results.jsonl"
+        _write_jsonl(
+            path,
+            [
+                _succeeded("c1", '{"s":"pos","c":0.9,"p":"LeBron James"}'),
+                _failed("c2", "errored"),
+            ],
+        )
+        return path
+
+    @pytest.fixture
+    def parse_calls(self, monkeypatch) -> list[Path]:
+        """Record every results file that is actually parsed."""
+        calls = []
+        parse_results_file = cr._parse_results_file
+
+        def recording_parse(results_file: Path):
+            calls.append(results_file)
+            return parse_results_file(results_file)
+
+        monkeypatch.setattr(cr, "_parse_results_file", recording_parse)
+        return calls
+
+    def test_miss_parses_and_writes_sidecar(self, results_file, parse_calls):
+        """A file without a cache should be parsed and get parquet + sidecar."""
+        parsed = cr._load_parsed_results([results_file]).collect()
+
+        parsed_path, digest_path = cr._parsed_cache_paths(results_file)
+        assert parse_calls == [results_file]
+        assert parsed_path.exists()
+        assert digest_path.read_text().strip().endswith(f" v{cr.PARSED_CACHE_VERSION}")
+        assert parsed["sentiment"].to_list() == ["pos", None]
+        assert parsed["sentiment_player"].to_list() == ["LeBron James", None]
+
+    def test_hit_skips_parse(self, results_file, parse_calls):
+        """An unchanged file should be served from its parquet."""
+        first = cr._load_parsed_results([results_file]).collect()
+        second = cr._load_parsed_results([results_file]).collect()
+
+        assert parse_calls == [results_file]
+        assert second.equals(first)
+
+    def test_changed_content_reparses(self, results_file, parse_calls):
+        """Editing the results file should invalidate its cache."""
+        cr._load_parsed_results([results_file]).collect()
+        _write_jsonl(results_file, [_succeeded("c1", '{"s":"neg","c":0.1,"p":null}')])
+
+        parsed = cr._load_parsed_results([results_file]).collect()
+
+        assert parse_calls == [results_file, results_file]
+        assert parsed["sentiment"].to_list() == ["neg"]
+
+    def test_version_bump_reparses(self, results_file, parse_calls, monkeypatch):
+        """Bumping PARSED_CACHE_VERSION should invalidate every cache."""
+        cr._load_parsed_results([results_file]).collect()
+        monkeypatch.setattr(cr, "PARSED_CACHE_VERSION", cr.PARSED_CACHE_VERSION + 1)
+
+        cr._load_parsed_results([results_file]).collect()
+
+        assert parse_calls == [results_file, results_file]
+
+    def test_missing_parquet_reparses(self, results_file, parse_calls):
+        """A sidecar without its parquet should not count as a hit."""
+        cr._load_parsed_results([results_file]).collect()
+        cr._parsed_cache_paths(results_file)[0].unlink()
+
+        cr._load_parsed_results([results_file]).collect()
+
+        assert parse_calls == [results_file, results_file]
+
+
+class TestPollUntilComplete:
+    """Tests for poll_until_complete backoff."""
+
+    @pytest.fixture
+    def fake_poll(self, monkeypatch):
+        """
+        Script poll cycles and record the sleeps between them.
+
+        Each entry in cycles is the number of batches that progressed in
+        that cycle; the batch stays pending until the cycles run out.
+        """
+        script = {"cycles": [], "sleeps": []}
+
+        class FakeClient:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc_info):
+                return None
+
+        async def poll(index, journal, responses_dir, client):
+            progressed = script["cycles"].pop(0)
+            if not script["cycles"]:
+                index.pending.clear()
+            return progressed
+
+        async def sleep(seconds):
+            script["sleeps"].append(seconds)
+
+        monkeypatch.setattr(cr.anthropic, "AsyncAnthropic", FakeClient)
+        monkeypatch.setattr(cr, "poll_and_download_batches", poll)
+        monkeypatch.setattr(cr.asyncio, "sleep", sleep)
+        return script
+
+    def _index(self) -> _BatchIndex:
+        """Index with one pending batch."""
+        state = init_state()
+        state["batches"] = [_batch(1, "in_progress")]
+        return _BatchIndex.from_state(state)
+
+    def test_backs_off_and_resets_on_progress(self, tmp_path: Path, fake_poll):
+        """Waits should grow to poll_interval and reset after progress."""
+        fake_poll["cycles"] = [0, 0, 0, 1, 0, 0, 0, 0, 0, 0]
+
+        completed = asyncio.run(
+            cr.poll_until_complete(
+                self._index(),
+                journal=None,
+                responses_dir=tmp_path,
+                poll_interval=20,
+                max_wait=3600,
+                min_poll_interval=5,
+            )
+        )
+
+        assert completed is True
+        assert fake_poll["sleeps"] == pytest.approx(
+            [5, 7.5, 11.25, 5, 7.5, 11.25, 16.875, 20, 20]
+        )
+
+    def test_min_interval_capped_by_poll_interval(self, tmp_path: Path, fake_poll):
+        """A min_poll_interval above poll_interval should not be used."""
+        fake_poll["cycles"] = [0, 0, 0]
+
+        asyncio.run(
+            cr.poll_until_complete(
+                self._index(), None, tmp_path, poll_interval=3, max_wait=3600
+            )
+        )
+
+        assert fake_poll["sleeps"] == [3, 3]
+
+    def test_timeout_returns_false(self, tmp_path: Path, fake_poll):
+        """Pending batches at max_wait should end polling without success."""
+        fake_poll["cycles"] = [0, 0]
+
+        completed = asyncio.run(
+            cr.poll_until_complete(
+                self._index(), None, tmp_path, poll_interval=60, max_wait=0
+            )
+        )
+
+        assert completed is False
+        assert fake_poll["sleeps"] == []
+
+
+class TestFilteredCache:
+    """Tests for the filtered comments parquet cache."""
+
+    @pytest.fixture
+    def filtered_path(self, tmp_path: Path) -> Path:
+        """A filtered comments JSONL with two comments."""
+        path = tmp_path / "mentions.jsonl"
+        _write_jsonl(path, [_comment("c1"), _comment("c2")])
+        return path
+
+    @pytest.fixture
+    def scans(self, monkeypatch) -> list[Path]:
+        """Record every time the JSONL is scanned to rebuild the cache."""
+        calls = []
+        scan_ndjson = cr.pl.scan_ndjson
+
+        def recording_scan(path, **kwargs):
+            calls.append(path)
+            return scan_ndjson(path, **kwargs)
+
+        monkeypatch.setattr(cr.pl, "scan_ndjson", recording_scan)
+        return calls
+
+    def test_hit_reuses_parquet(self, filtered_path, scans):
+        """An unchanged JSONL should be served from its parquet."""
+        first = cr._get_filtered_lazy(filtered_path).collect()
+        second = cr._get_filtered_lazy(filtered_path).collect()
+
+        assert scans == [filtered_path]
+        assert second.equals(first)
+        assert second.columns == list(cr.FILTERED_SCHEMA)
+
+    def test_restored_older_jsonl_rebuilds(self, filtered_path, scans):
+        """A JSONL replaced by one with an older mtime should not hit."""
+        cr._get_filtered_lazy(filtered_path).collect()
+        _write_jsonl(filtered_path, [_comment("c3")])
+        old = filtered_path.stat().st_mtime_ns - 3_600 * 10**9
+        os.utime(filtered_path, ns=(old, old))
+
+        rebuilt = cr._get_filtered_lazy(filtered_path).collect()
+
+        assert scans == [filtered_path, filtered_path]
+        assert rebuilt["id"].to_list() == ["c3"]
+
+    def test_schema_change_rebuilds(self, filtered_path, scans, monkeypatch):
+        """Changing FILTERED_SCHEMA should invalidate the parquet."""
+        cr._get_filtered_lazy(filtered_path).collect()
+        schema = {**cr.FILTERED_SCHEMA, "score": cr.pl.Int32}
+        monkeypatch.setattr(cr, "FILTERED_SCHEMA", schema)
+
+        rebuilt = cr._get_filtered_lazy(filtered_path).collect()
+
+        assert scans == [filtered_path, filtered_path]
+        assert rebuilt.schema["score"] == cr.pl.Int32
+
+    def test_version_bump_rebuilds(self, filtered_path, scans, monkeypatch):
+        """Bumping FILTERED_CACHE_VERSION should invalidate the parquet."""
+        cr._get_filtered_lazy(filtered_path).collect()
+        monkeypatch.setattr(cr, "FILTERED_CACHE_VERSION", cr.FILTERED_CACHE_VERSION + 1)
+
+        cr._get_filtered_lazy(filtered_path).collect()
+
+        assert scans == [filtered_path, filtered_path]
@@ -0,0 +1,245 @@
+"""Unit tests for download_comments script."""
+
+import asyncio
+import json
+import os
+import threading
+from pathlib import Path
+
+import orjson
+import pytest
+import zstandard
+
+import scripts.download_comments as dc
+from scripts.clean_raw_comments import open_raw_lines
+from scripts.download_comments import (
+    append_progress_event,
+    download_subreddit,
+    load_progress,
+    save_progress,
+)
+from utils.constants import PROGRESS_FILENAME
+
+
+class _FakeClient:
+    """Serves canned comments from fetch_comments, honouring after/before."""
+
+    def __init__(self, comments: list[dict]):
+        self.comments = comments
+
+    async def fetch_comments(self, subreddit: str, after: int, before: int):
+        for comment in self.comments:
+            if after <= comment["created_utc"] < before:
+                yield comment
+
+
+class _StalledClient(_FakeClient):
+    """Serves its comments, then hangs as if waiting on the next page."""
+
+    async def fetch_comments(self, subreddit: str, after: int, before: int):
+        async for comment in super().fetch_comments(subreddit, after, before):
+            yield comment
+        await asyncio.Event().wait()
+
+
+def _checkpoint(subreddit: str, last_timestamp: int, count: int, offset: int) -> dict:
+    """Build a checkpoint progress event."""
+    return {
+        "event": "checkpoint",
+        "subreddit": subreddit,
+        "last_timestamp": last_timestamp,
+        "count": count,
+        "offset": offset,
+    }
+
+
+_COMMENTS = [{"id": str(ts), "created_utc": ts} for ts in range(1, 7)]
+
+
+def _download(
+    output_path: Path,
+    resume_from: int | None = None,
+    resume_offset: int | None = None,
+) -> list[tuple[int, int, int]]:
+    """Download _COMMENTS and return the checkpoints it reported."""
+    checkpoints: list[tuple[int, int, int]] = []
+    asyncio.run(
+        download_subreddit(
+            client=_FakeClient(_COMMENTS),
+            subreddit="nba",
+            output_path=output_path,
+            start_timestamp=0,
+            end_timestamp=100,
+            resume_from=resume_from,
+            resume_offset=resume_offset,
+            progress_callback=lambda *checkpoint: checkpoints.append(checkpoint),
+        )
+    )
+    return checkpoints
+
+
+def _read_ids(output_path: Path) -> list[str]:
+    """Decompress every frame and return the comment ids in file order."""
+    with open_raw_lines(output_path) as f:
+        return [orjson.loads(line)["id"] for line in f]
+
+
+class TestDownloadSubreddit:
+    """Tests for download_subreddit output and checkpoints."""
+
+    def test_lone_surrogate_comment_written(self, tmp_path: Path):
+        """A comment orjson cannot encode should be written escaped."""
+        output_path = tmp_path / "r_nba_comments.jsonl.zst"
+        comment = {"id": "1", "created_utc": 1, "body": "hi \ud83d"}
+
+        asyncio.run(
+            download_subreddit(_FakeClient([comment]), "nba", output_path, 0, 100)
+        )
+
+        with open_raw_lines(output_path) as f:
+            assert [json.loads(line) for line in f] == [comment]
+
+    def test_checkpoints_carry_file_offset(self, tmp_path: Path, monkeypatch):
+        """Each checkpoint should report the file size after its batch."""
+        monkeypatch.setattr(dc, "WRITE_BATCH_SIZE", 2)
+        output_path = tmp_path / "r_nba_comments.jsonl.zst"
+
+        checkpoints = _download(output_path)
+
+        assert [(ts, count) for ts, count, _ in checkpoints] == [(2, 2), (4, 4), (6, 6)]
+        assert checkpoints[-1][2] == output_path.stat().st_size
+        assert _read_ids(output_path) == [c["id"] for c in _COMMENTS]
+
+    def test_resume_truncates_torn_frame(self, tmp_path: Path, monkeypatch):
+        """A frame cut off by a crash should be dropped, not corrupt the resume."""
+        monkeypatch.setattr(dc, "WRITE_BATCH_SIZE", 2)
+        output_path = tmp_path / "r_nba_comments.jsonl.zst"
+        checkpoints = _download(output_path)
+
+        # Crash halfway through the second frame, after the first checkpoint
+        last_timestamp, _, offset = checkpoints[0]
+        torn_size = (offset + checkpoints[1][2]) // 2
+        os.truncate(output_path, torn_size)
+
+        _download(output_path, resume_from=last_timestamp, resume_offset=offset)
+
+        assert _read_ids(output_path) == [c["id"] for c in _COMMENTS]
+
+    def test_cancel_waits_for_in_flight_write(self, tmp_path: Path, monkeypatch):
+        """Cancelling mid-write should finish the frame before closing the fd."""
+        monkeypatch.setattr(dc, "WRITE_BATCH_SIZE", 2)
+        output_path = tmp_path / "r_nba_comments.jsonl.zst"
+        checkpoints = []
+        writing = threading.Event()
+        release = threading.Event()
+        compressor_class = zstandard.ZstdCompressor
+
+        class BlockingCompressor:
+            def __init__(self, level: int):
+                self.compressor = compressor_class(level=level)
+
+            def compress(self, data: bytes) -> bytes:
+                writing.set()
+                release.wait(5)
+                return self.compressor.compress(data)
+
+        monkeypatch.setattr(dc.zstandard, "ZstdCompressor", BlockingCompressor)
+
+        async def run() -> None:
+            task = asyncio.create_task(
+                download_subreddit(
+                    client=_StalledClient(_COMMENTS[:2]),
+                    subreddit="nba",
+                    output_path=output_path,
+                    start_timestamp=0,
+                    end_timestamp=100,
+                    progress_callback=lambda *c: checkpoints.append(c),
+                )
+            )
+            await asyncio.to_thread(writing.wait, 5)
+            task.cancel()
+            asyncio.get_running_loop().call_later(0.05, release.set)
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(run())
+
+        # The frame is whole on disk but was never checkpointed
+        assert _read_ids(output_path) == ["1", "2"]
+        assert checkpoints == []
+
+
+class TestProgressLog:
+    """Tests for the progress snapshot plus append-only event log."""
+
+    def test_replays_checkpoint_and_complete_events(self, tmp_path: Path):
+        """Logged events should be applied on top of the snapshot in order."""
+        progress_path = tmp_path / PROGRESS_FILENAME
+        save_progress(progress_path, {"completed": ["lakers"], "in_progress": {}})
+        for event in [
+            _checkpoint("nba", 100, 1000, 4096),
+            _checkpoint("celtics", 50, 1000, 2048),
+            _checkpoint("nba", 200, 2000, 8192),
+            {"event": "complete", "subreddit": "celtics"},
+        ]:
+            append_progress_event(progress_path, event)
+
+        progress = load_progress(progress_path)
+
+        assert progress == {
+            "completed": ["lakers", "celtics"],
+            "in_progress": {
+                "nba": {"last_timestamp": 200, "count": 2000, "offset": 8192}
+            },
+        }
+
+    def test_ignores_torn_last_line(self, tmp_path: Path):
+        """A partial event from a crash mid-append should be skipped."""
+        progress_path = tmp_path / PROGRESS_FILENAME
+        append_progress_event(progress_path, _checkpoint("nba", 100, 1000, 4096))
+        with open(tmp_path / ".progress.log", "ab") as f:
+            f.write(b'{"event": "checkpoint", "subreddit": "nba", "last_ti')
+
+        progress = load_progress(progress_path)
+
+        assert progress["in_progress"] == {
+            "nba": {"last_timestamp": 100, "count": 1000, "offset": 4096}
+        }
+
+    def test_checkpoint_without_offset_replays(self, tmp_path: Path):
+        """Checkpoints logged before offsets were recorded should still load."""
+        progress_path = tmp_path / PROGRESS_FILENAME
+        append_progress_event(
+            progress_path,
+            {
+                "event": "checkpoint",
+                "subreddit": "nba",
+                "last_timestamp": 1,
+                "count": 5,
+            },
+        )
+
+        progress = load_progress(progress_path)
+
+        assert progress["in_progress"] == {"nba": {"last_timestamp": 1, "count": 5}}
+
+    def test_save_progress_compacts_log(self, tmp_path: Path):
+        """A snapshot should fold in every event and remove the log."""
+        progress_path = tmp_path / PROGRESS_FILENAME
+        append_progress_event(progress_path, _checkpoint("nba", 100, 1000, 4096))
+        append_progress_event(progress_path, {"event": "complete", "subreddit": "nba"})
+        progress = load_progress(progress_path)
+
+        save_progress(progress_path, progress)
+
+        assert not (tmp_path / ".progress.log").exists()
+        assert load_progress(progress_path) == {
+            "completed": ["nba"],
+            "in_progress": {},
+        }
+
+    def test_missing_files_start_fresh(self, tmp_path: Path):
+        """With no snapshot and no log, progress should be empty."""
+        progress = load_progress(tmp_path / PROGRESS_FILENAME)
+
+        assert progress == {"completed": [], "in_progress": {}}
@@ -0,0 +1,106 @@
+"""Unit tests for download_posts script."""
+
+import asyncio
+import json
+import os
+import threading
+from pathlib import Path
+
+import orjson
+import pytest
+
+import scripts.download_posts as dp
+from scripts.download_posts import download_posts, split_time_range
+from utils.constants import POST_FIELDS
+
+
+class _FakeClient:
+    """Serves canned posts from fetch_posts, honouring after/before."""
+
+    def __init__(self, posts: list[dict], stall: bool = False):
+        self.posts = posts
+        self.stall = stall
+
+    async def fetch_posts(self, subreddit: str, after: int, before: int):
+        for post in self.posts:
+            if after <= post["created_utc"] < before:
+                yield post
+        # Hang as if waiting on the next page
+        if self.stall:
+            await asyncio.Event().wait()
+
+
+_POSTS = [
+    {"id": str(ts), "created_utc": ts, "title": f"post {ts}", "extra": "dropped"}
+    for ts in range(0, 100, 10)
+]
+
+
+class TestSplitTimeRange:
+    """Tests for split_time_range function."""
+
+    def test_windows_tile_range(self):
+        """Windows should be adjacent, cover the range and clip the last one."""
+        assert split_time_range(0, 25, 10) == [(0, 10), (10, 20), (20, 25)]
+
+
+class TestDownloadPosts:
+    """Tests for download_posts output."""
+
+    def test_writes_every_post_trimmed(self, tmp_path: Path):
+        """Every post should be written once with only POST_FIELDS."""
+        output_path = tmp_path / "r_nba_posts.jsonl"
+
+        count = asyncio.run(
+            download_posts(_FakeClient(_POSTS), "nba", output_path, 0, 100)
+        )
+
+        posts = [orjson.loads(line) for line in output_path.read_bytes().splitlines()]
+        assert count == len(_POSTS)
+        assert sorted(p["id"] for p in posts) == sorted(p["id"] for p in _POSTS)
+        assert all(list(p) == list(POST_FIELDS) for p in posts)
+
+    def test_lone_surrogate_post_written(self, tmp_path: Path):
+        """A post orjson cannot encode should be written escaped."""
+        output_path = tmp_path / "r_nba_posts.jsonl"
+        post = {"id": "1", "created_utc": 1, "title": "hi \ud83d"}
+
+        asyncio.run(download_posts(_FakeClient([post]), "nba", output_path, 0, 100))
+
+        assert json.loads(output_path.read_text())["title"] == "hi \ud83d"
+
+    def test_cancel_waits_for_in_flight_write(self, tmp_path: Path, monkeypatch):
+        """Cancelling mid-write should finish the batch before closing the fd."""
+        output_path = tmp_path / "r_nba_posts.jsonl"
+        writing = threading.Event()
+        release = threading.Event()
+
+        class BlockingOs:
+            """os with a write() that waits until the test releases it."""
+
+            def __getattr__(self, name: str):
+                return getattr(os, name)
+
+            def write(self, fd: int, data) -> int:
+                writing.set()
+                release.wait(5)
+                return os.write(fd, data)
+
+        monkeypatch.setattr(dp, "os", BlockingOs())
+        monkeypatch.setattr(dp, "POST_BATCH_SIZE", 1)
+
+        async def run() -> None:
+            task = asyncio.create_task(
+                download_posts(
+                    _FakeClient(_POSTS[:1], stall=True), "nba", output_path, 0, 100
+                )
+            )
+            await asyncio.to_thread(writing.wait, 5)
+            task.cancel()
+            asyncio.get_running_loop().call_later(0.05, release.set)
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(run())
+
+        assert orjson.loads(output_path.read_bytes())["id"] == "0"
@@ -1,9 +1,16 @@
 """Unit tests for extract_filter module."""
 
+import json
+
+import orjson
+import zstandard
+
 from scripts.extract_filter import (
     is_target_subreddit,
+    may_be_target_subreddit,
     parse_json_line,
     log_stats_summary,
+    process_file,
 )
 from pipeline.processors import CommentPipeline, has_valid_body, extract_fields
 
@@ -37,6 +44,31 @@ class TestIsTargetSubreddit:
         assert is_target_subreddit(comment) is None
 
 
+class TestMayBeTargetSubreddit:
+    """Tests for the raw-bytes subreddit prefilter."""
+
+    def test_target_subreddit_line_passes(self):
+        """Lines from a target subreddit must never be prefiltered out."""
+        assert may_be_target_subreddit(b'{"subreddit":"nba","body":"hi"}')
+
+    def test_spacing_and_case_still_pass(self):
+        """Prefilter should tolerate JSON whitespace and subreddit casing."""
+        assert may_be_target_subreddit(b'{"subreddit": "Lakers", "body": "hi"}')
+
+    def test_other_subreddit_line_rejected(self):
+        """Lines without any target subreddit name should be rejected."""
+        assert not may_be_target_subreddit(b'{"subreddit":"soccer","body":"hi"}')
+
+    def test_target_name_outside_subreddit_field_rejected(self):
+        """Only the subreddit field counts, not a target name in the body."""
+        line = b'{"subreddit":"soccer","body":"\\"nba\\" is better"}'
+        assert not may_be_target_subreddit(line)
+
+    def test_missing_subreddit_field_passes(self):
+        """Lines without a readable subreddit field are left to the parser."""
+        assert may_be_target_subreddit(b'{"body":"hi"}')
+
+
 class TestParseJsonLine:
     """Tests for JSON parsing."""
 
@@ -67,6 +99,24 @@ class TestParseJsonLine:
 
         assert result is None
 
+    def test_bytes_line_parsed(self):
+        """Raw bytes lines should parse without decoding first."""
+        result = parse_json_line(b'{"id": "test", "body": "hello"}')
+
+        assert result == {"id": "test", "body": "hello"}
+
+    def test_invalid_utf8_bytes_replaced(self):
+        """Invalid UTF-8 should be replaced rather than rejecting the line."""
+        result = parse_json_line(b'{"id": "test", "body": "caf\xe9"}')
+
+        assert result == {"id": "test", "body": "caf\ufffd"}
+
+    def test_lone_surrogate_parsed(self):
+        """A lone surrogate escape orjson rejects should still parse."""
+        result = parse_json_line(b'{"id": "test", "body": "LeBron \\ud83d"}')
+
+        assert result == {"id": "test", "body": "LeBron \ud83d"}
+
 
 class TestLogStatsSummary:
     """Tests for log_stats_summary function."""
@@ -170,3 +220,67 @@ class TestPipelineIntegration:
         assert pipeline.stats["accepted"] == 2
         assert pipeline.stats["rejected_is_target_subreddit"] == 1
         assert pipeline.stats["rejected_has_valid_body"] == 1
+
+
+class TestProcessFile:
+    """Tests that the fused process_file loop matches the pipeline steps."""
+
+    def test_matches_comment_pipeline(
+        self,
+        tmp_path,
+        mixed_comments_batch,
+        uppercase_subreddit_comment,
+        deleted_body_comment,
+        empty_body_comment,
+    ):
+        """Output and stats should equal CommentPipeline's over the same input."""
+        comments = [
+            *mixed_comments_batch,
+            uppercase_subreddit_comment,
+            deleted_body_comment,
+            empty_body_comment,
+            {"id": "nosub", "body": "no subreddit field"},
+        ]
+        raw = b"".join(
+            orjson.dumps(c, option=orjson.OPT_APPEND_NEWLINE) for c in comments
+        )
+        input_path = tmp_path / "RC_test.zst"
+        input_path.write_bytes(zstandard.ZstdCompressor().compress(raw))
+        output_path = tmp_path / "out.jsonl"
+
+        pipeline = CommentPipeline()
+        pipeline.add_step(is_target_subreddit)
+        pipeline.add_step(has_valid_body)
+        pipeline.add_step(extract_fields)
+        expected = [
+            result for result in map(pipeline.process, comments) if result is not None
+        ]
+
+        stats = process_file(input_path, output_path, show_progress=False)
+
+        lines = output_path.read_bytes().splitlines()
+        assert [orjson.loads(line) for line in lines] == expected
+        assert stats["accepted"] == pipeline.stats["accepted"]
+        assert stats["total"] == pipeline.stats["total"]
+        assert (
+            stats["rejected_is_target_subreddit"]
+            == pipeline.stats["rejected_is_target_subreddit"]
+        )
+        assert (
+            stats["rejected_has_valid_body"]
+            == pipeline.stats["rejected_has_valid_body"]
+        )
+
+    def test_lone_surrogate_comment_kept(self, tmp_path, valid_nba_comment):
+        """A comment with a lone surrogate should be written, not dropped."""
+        raw = orjson.dumps(valid_nba_comment).replace(b"washed", b"washed \\ud83d")
+        input_path = tmp_path / "RC_test.zst"
+        input_path.write_bytes(zstandard.ZstdCompressor().compress(raw + b"\n"))
+        output_path = tmp_path / "out.jsonl"
+
+        stats = process_file(input_path, output_path, show_progress=False)
+
+        assert stats["accepted"] == 1
+        assert stats["rejected_malformed"] == 0
+        written = json.loads(output_path.read_bytes())
+        assert written["body"].startswith("LeBron is washed \ud83d")
@@ -0,0 +1,146 @@
+"""Tests for utils.file_io module."""
+
+import io
+import os
+from pathlib import Path
+
+import pytest
+
+from utils import file_io
+from utils.file_io import (
+    READ_CHUNK_SIZE,
+    count_lines,
+    iter_lines,
+    open_sequential,
+    read_line_blocks,
+)
+
+
+class TestOpenSequential:
+    """Tests for open_sequential function."""
+
+    def test_reads_file_as_bytes(self, tmp_path: Path):
+        """Verify the file is opened in binary mode with its full contents."""
+        path = tmp_path / "data.jsonl"
+        path.write_bytes(b'{"id": 1}\n{"id": 2}\n')
+
+        with open_sequential(path) as f:
+            assert f.read() == b'{"id": 1}\n{"id": 2}\n'
+
+    def test_reads_empty_file(self, tmp_path: Path):
+        """Verify an empty file opens and reads as empty bytes."""
+        path = tmp_path / "empty.jsonl"
+        path.write_bytes(b"")
+
+        with open_sequential(path) as f:
+            assert f.read() == b""
+
+    def test_closes_file_when_fadvise_fails(self, tmp_path: Path, monkeypatch):
+        """Verify the handle is closed if the readahead hint raises."""
+        path = tmp_path / "data.jsonl"
+        path.write_bytes(b"")
+        # Held here so the handle cannot be closed by garbage collection
+        opened = []
+
+        def spy_open(*args, **kwargs):
+            f = open(*args, **kwargs)  # noqa: SIM115 - closed by the code under test
+            opened.append(f)
+            return f
+
+        def failing_fadvise(*args) -> None:
+            raise OSError("fadvise failed")
+
+        monkeypatch.setattr(file_io, "open", spy_open, raising=False)
+        monkeypatch.setattr(file_io, "HAS_FADVISE", True)
+        monkeypatch.setattr(os, "posix_fadvise", failing_fadvise, raising=False)
+        monkeypatch.setattr(os, "POSIX_FADV_SEQUENTIAL", 2, raising=False)
+
+        with pytest.raises(OSError, match="fadvise failed"):
+            open_sequential(path)
+
+        assert opened[0].closed
+
+
+class TestCountLines:
+    """Tests for count_lines function."""
+
+    def test_counts_newline_terminated_lines(self, tmp_path: Path):
+        """Verify each newline-terminated line is counted once."""
+        path = tmp_path / "data.jsonl"
+        path.write_bytes(b"a\nb\nc\n")
+
+        assert count_lines(path) == 3
+
+    def test_counts_last_line_without_newline(self, tmp_path: Path):
+        """Verify a final line with no trailing newline is still counted."""
+        path = tmp_path / "data.jsonl"
+        path.write_bytes(b"a\nb\nc")
+
+        assert count_lines(path) == 3
+
+    def test_empty_file(self, tmp_path: Path):
+        """Verify an empty file has no lines."""
+        path = tmp_path / "empty.jsonl"
+        path.write_bytes(b"")
+
+        assert count_lines(path) == 0
+
+    def test_lines_across_chunks(self, tmp_path: Path):
+        """Verify counting is unaffected by lines spanning chunk boundaries."""
+        line = b"x" * (READ_CHUNK_SIZE // 3) + b"\n"
+        path = tmp_path / "big.jsonl"
+        path.write_bytes(line * 7 + b"tail")
+
+        assert count_lines(path) == 8
+
+
+class TestReadLineBlocks:
+    """Tests for read_line_blocks function."""
+
+    def test_carries_partial_line_into_next_block(self):
+        """Verify a line split across blocks is yielded whole, once."""
+        f = io.BytesIO(b"alpha\nbravo\ncharlie\n")
+
+        blocks = list(read_line_blocks(f, chunk_size=4))
+
+        assert [line for _, lines in blocks for line in lines] == [
+            b"alpha",
+            b"bravo",
+            b"charlie",
+        ]
+        assert sum(size for size, _ in blocks) == 20
+
+    def test_yields_last_line_without_newline(self):
+        """Verify a final line with no trailing newline is yielded last."""
+        f = io.BytesIO(b"alpha\nbravo")
+
+        blocks = list(read_line_blocks(f, chunk_size=4))
+
+        assert [line for _, lines in blocks for line in lines] == [b"alpha", b"bravo"]
+        assert blocks[-1] == (0, [b"bravo"])
+
+    def test_keeps_blank_lines(self):
+        """Verify blank lines are yielded as empty bytes, not dropped."""
+        f = io.BytesIO(b"a\n\nb\n")
+
+        lines = [line for _, lines in read_line_blocks(f) for line in lines]
+
+        assert lines == [b"a", b"", b"b"]
+
+    def test_empty_file(self):
+        """Verify an empty file yields no blocks."""
+        assert list(read_line_blocks(io.BytesIO(b""))) == []
+
+
+class TestIterLines:
+    """Tests for iter_lines function."""
+
+    def test_reports_each_block(self):
+        """Verify on_block receives bytes read and line count per block."""
+        f = io.BytesIO(b"a\nb\nc")
+        calls = []
+
+        lines = list(iter_lines(f, lambda size, count: calls.append((size, count))))
+
+        assert lines == [b"a", b"b", b"c"]
+        assert calls == [(5, 2), (0, 1)]
@@ -0,0 +1,188 @@
+"""Unit tests for filter_player_mentions script."""
+
+import io
+import json
+from concurrent.futures import ThreadPoolExecutor
+from itertools import pairwise
+from pathlib import Path
+
+import orjson
+import pytest
+
+import scripts.filter_player_mentions as fpm
+from pipeline.processors import filter_player_mentions
+from scripts.filter_player_mentions import (
+    filter_lines,
+    find_chunk_boundaries,
+    process_file,
+    process_file_parallel,
+)
+
+
+def _write_comments(path: Path, bodies: list[str], trailing_newline: bool) -> None:
+    """Write one JSONL comment per body, plus a blank and a malformed line."""
+    lines = [
+        orjson.dumps({"id": str(i), "body": body}) for i, body in enumerate(bodies)
+    ]
+    lines.insert(len(lines) // 2, b"")
+    lines.insert(len(lines) // 2, b'{"id": "broken", "body":')
+    data = b"\n".join(lines)
+    path.write_bytes(data + b"\n" if trailing_newline else data)
+
+
+_BODIES = [
+    "LeBron is washed",
+    "nothing to see here",
+    "Steph and Jokic tonight",
+    "the refs again",
+    "AD is hurt again",
+    "advertisement spam",
+    "Curry from the logo",
+]
+
+
+# Raw input lines covering the splice and the re-serialize paths
+_SPLICE_LINES = [
+    b'{"id": "1", "body": "LeBron is washed"}',
+    b'{"id":"2","body":"Steph and Jokic tonight","score":3}',
+    b'  {"id": "3", "body": "Joki\\u0107 MVP, \\"LeBron\\" \\\\ \\n done"}  ',
+    '{"id": "4", "body": "Dončić and Jokić 🃏 with LeBron"}'.encode(),
+    b'{"id": "5", "body": "Curry again", "mentioned_players": ["stale"]}',
+    b'{"id": "6", "body": "nothing to see here"}',
+]
+
+
+class TestFilterLines:
+    """Tests for filter_lines output."""
+
+    def test_output_matches_filter_player_mentions(self):
+        """Each output line should be valid JSON equal to the StepFn's result."""
+        f_out = io.BytesIO()
+
+        stats = filter_lines(_SPLICE_LINES, f_out)
+
+        expected = [
+            result
+            for result in map(filter_player_mentions, map(orjson.loads, _SPLICE_LINES))
+            if result is not None
+        ]
+        output = f_out.getvalue()
+        assert output.endswith(b"\n")
+        assert [orjson.loads(line) for line in output.splitlines()] == expected
+        assert stats == {"total": 6, "accepted": 5, "rejected": 1, "malformed": 0}
+
+    def test_existing_field_is_replaced(self):
+        """A line already carrying mentioned_players should not get it twice."""
+        f_out = io.BytesIO()
+
+        filter_lines([_SPLICE_LINES[4]], f_out)
+
+        line = f_out.getvalue()
+        assert line.count(b"mentioned_players") == 1
+        assert orjson.loads(line)["mentioned_players"] == ["Stephen Curry"]
+
+    def test_escaped_and_non_ascii_body_passes_through(self):
+        """Escapes and non-ASCII text in the body should survive the splice."""
+        f_out = io.BytesIO()
+
+        filter_lines(_SPLICE_LINES[2:4], f_out)
+
+        first, second = map(orjson.loads, f_out.getvalue().splitlines())
+        assert first["body"] == 'Jokić MVP, "LeBron" \\ \n done'
+        assert second["body"] == "Dončić and Jokić 🃏 with LeBron"
+
+    def test_lone_surrogate_line_accepted(self):
+        """Lone surrogates orjson rejects should be parsed, not counted malformed."""
+        f_out = io.BytesIO()
+        lines = [
+            b'{"id": "1", "body": "LeBron \\ud83d"}',
+            b'{"id": "2", "body": "Curry \\ud83d", "mentioned_players": []}',
+        ]
+
+        stats = filter_lines(lines, f_out)
+
+        first, second = map(json.loads, f_out.getvalue().splitlines())
+        assert stats["accepted"] == 2
+        assert stats["malformed"] == 0
+        assert first["body"] == "LeBron \ud83d"
+        assert second["mentioned_players"] == ["Stephen Curry"]
+
+
+class TestFindChunkBoundaries:
+    """Tests for find_chunk_boundaries function."""
+
+    def test_ranges_cover_file_on_line_starts(self, tmp_path: Path):
+        """Ranges should tile the file, each starting at a line start."""
+        path = tmp_path / "in.jsonl"
+        _write_comments(path, _BODIES, trailing_newline=True)
+        data = path.read_bytes()
+
+        chunks = find_chunk_boundaries(path, 3)
+
+        assert chunks[0][0] == 0
+        assert chunks[-1][1] == len(data)
+        for (_, end), (start, _) in pairwise(chunks):
+            assert end == start
+            assert data[start - 1 : start] == b"\n"
+
+    def test_more_chunks_than_lines(self, tmp_path: Path):
+        """Surplus chunks should be dropped, never yielding empty ranges."""
+        path = tmp_path / "in.jsonl"
+        path.write_bytes(b'{"id": "1"}\n{"id": "2"}\n')
+
+        chunks = find_chunk_boundaries(path, 16)
+
+        assert len(chunks) <= 2
+        assert all(start < end for start, end in chunks)
+
+    def test_empty_file(self, tmp_path: Path):
+        """An empty file should have no ranges."""
+        path = tmp_path / "empty.jsonl"
+        path.write_bytes(b"")
+
+        assert find_chunk_boundaries(path, 4) == []
+
+
+class TestProcessFileParallel:
+    """Tests that the parallel filter matches the serial one."""
+
+    @pytest.mark.parametrize("trailing_newline", [True, False])
+    @pytest.mark.parametrize("workers", [1, 3, 32])
+    def test_matches_serial_output(
+        self, tmp_path: Path, workers: int, trailing_newline: bool
+    ):
+        """Output bytes and stats should equal process_file's."""
+        input_path = tmp_path / "in.jsonl"
+        _write_comments(input_path, _BODIES, trailing_newline)
+
+        serial_stats, _ = process_file(input_path, tmp_path / "serial.jsonl")
+        parallel_stats, _ = process_file_parallel(
+            input_path, tmp_path / "parallel.jsonl", workers
+        )
+
+        assert (tmp_path / "parallel.jsonl").read_bytes() == (
+            tmp_path / "serial.jsonl"
+        ).read_bytes()
+        assert parallel_stats == serial_stats
+        assert list(tmp_path.glob("*.part*")) == []
+
+    def test_worker_failure_removes_part_files(self, tmp_path: Path, monkeypatch):
+        """A failing range should not leave part files behind."""
+        input_path = tmp_path / "in.jsonl"
+        _write_comments(input_path, _BODIES, trailing_newline=True)
+        process_chunk = fpm.process_chunk
+
+        def failing_chunk(input_path, part_path, start, end):
+            stats = process_chunk(input_path, part_path, start, end)
+            if start > 0:
+                raise RuntimeError("worker failed")
+            return stats
+
+        # Threads, so the patched function is what the workers run
+        monkeypatch.setattr(fpm, "ProcessPoolExecutor", ThreadPoolExecutor)
+        monkeypatch.setattr(fpm, "process_chunk", failing_chunk)
+
+        with pytest.raises(RuntimeError):
+            process_file_parallel(input_path, tmp_path / "out.jsonl", 3)
+
+        assert list(tmp_path.glob("*.part*")) == []
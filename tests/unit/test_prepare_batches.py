@@ -0,0 +1,35 @@
+"""Unit tests for prepare_batches script."""
+
+import json
+from pathlib import Path
+
+from pipeline.batch import format_batch_request
+from scripts.prepare_batches import process_file
+
+
+class TestProcessFile:
+    """Tests for process_file function."""
+
+    def test_skips_malformed_lines(
+        self, tmp_path: Path, malformed_jsonl_file: Path, jsonl_iter
+    ):
+        """Corrupt lines should be counted and skipped, not abort the run."""
+        output_dir = tmp_path / "requests"
+
+        stats, _ = process_file(malformed_jsonl_file, output_dir)
+
+        assert stats == {"total": 3, "batches": 1, "malformed": 2}
+        requests = list(jsonl_iter(output_dir / "batch_001.jsonl"))
+        assert [r["custom_id"] for r in requests] == ["good1", "good2", "good3"]
+
+    def test_lone_surrogate_comment_kept(self, tmp_path: Path):
+        """A lone surrogate orjson rejects should still become a request."""
+        input_path = tmp_path / "mentions.jsonl"
+        input_path.write_bytes(b'{"id": "s1", "body": "LeBron \\ud83d"}\n')
+        output_dir = tmp_path / "requests"
+
+        stats, _ = process_file(input_path, output_dir)
+
+        assert stats == {"total": 1, "batches": 1, "malformed": 0}
+        request = json.loads((output_dir / "batch_001.jsonl").read_bytes())
+        assert request == format_batch_request({"id": "s1", "body": "LeBron \ud83d"})
@@ -0,0 +1,137 @@
+"""Unit tests for submit_batches script."""
+
+import threading
+from pathlib import Path
+
+import pytest
+
+import scripts.submit_batches as sb
+from pipeline.batch import StateJournal, init_state, load_state
+from scripts.submit_batches import submit_batches
+
+
+def _write_batch_files(requests_dir: Path, count: int) -> list[Path]:
+    """Write count valid one-request batch files and return their paths."""
+    requests_dir.mkdir()
+    paths = []
+    for num in range(1, count + 1):
+        path = requests_dir / f"batch_{num:03d}.jsonl"
+        path.write_text('{"custom_id": "c1", "params": {}}\n')
+        paths.append(path)
+    return paths
+
+
+def _result(batch_file: Path) -> dict:
+    """Build a submit_batch result for a batch file."""
+    return {
+        "batch_id": f"msgbatch_{batch_file.stem}",
+        "processing_status": "in_progress",
+        "ended_at": None,
+        "results_url": None,
+        "request_counts": {"processing": 1},
+    }
+
+
+def _recorded_files(state: dict) -> list[str]:
+    """Return the request filenames of the batches in state, sorted."""
+    return sorted(b["request_file"] for b in state["batches"])
+
+
+class TestSubmitBatches:
+    """Tests for submit_batches state journaling."""
+
+    def test_records_every_submission(self, tmp_path: Path, monkeypatch):
+        """Each submitted batch should end up in the state snapshot."""
+        batch_files = _write_batch_files(tmp_path / "requests", 3)
+        state_path = tmp_path / "state.json"
+        monkeypatch.setattr(sb, "submit_batch", _result)
+
+        submit_batches(batch_files, init_state(), state_path)
+
+        state = load_state(state_path)
+        assert _recorded_files(state) == [f.name for f in batch_files]
+        assert sorted(b["batch_num"] for b in state["batches"]) == [1, 2, 3]
+        assert not state_path.with_suffix(".log").exists()
+
+    def test_journal_replays_without_snapshot(self, tmp_path: Path, monkeypatch):
+        """The state log alone should rebuild the state after a crash."""
+        batch_files = _write_batch_files(tmp_path / "requests", 3)
+        state_path = tmp_path / "state.json"
+        state = init_state()
+        monkeypatch.setattr(sb, "submit_batch", _result)
+        monkeypatch.setattr(StateJournal, "snapshot", lambda self: None)
+
+        submit_batches(batch_files, state, state_path)
+
+        assert not state_path.exists()
+        assert load_state(state_path)["batches"] == state["batches"]
+
+    def test_skips_submitted_batches(self, tmp_path: Path, monkeypatch):
+        """Batches already in state should not be submitted again."""
+        batch_files = _write_batch_files(tmp_path / "requests", 2)
+        state_path = tmp_path / "state.json"
+        submitted = []
+        monkeypatch.setattr(
+            sb, "submit_batch", lambda f: submitted.append(f.name) or _result(f)
+        )
+        submit_batches(batch_files[:1], init_state(), state_path)
+
+        submit_batches(batch_files, load_state(state_path), state_path)
+
+        assert submitted == ["batch_001.jsonl", "batch_002.jsonl"]
+        assert _recorded_files(load_state(state_path)) == [
+            "batch_001.jsonl",
+            "batch_002.jsonl",
+        ]
+
+    def test_failure_records_in_flight_batches(self, tmp_path: Path, monkeypatch):
+        """A failed submission should not lose batches created alongside it."""
+        batch_files = _write_batch_files(tmp_path / "requests", 2)
+        state_path = tmp_path / "state.json"
+        both_started = threading.Barrier(2, timeout=5)
+
+        def fake_submit(batch_file: Path) -> dict:
+            both_started.wait()
+            if batch_file.name == "batch_001.jsonl":
+                raise RuntimeError("API error")
+            return _result(batch_file)
+
+        monkeypatch.setattr(sb, "submit_batch", fake_submit)
+
+        with pytest.raises(RuntimeError, match="API error"):
+            submit_batches(batch_files, init_state(), state_path, concurrency=2)
+
+        assert _recorded_files(load_state(state_path)) == ["batch_002.jsonl"]
+
+    def test_interrupt_records_in_flight_batches(self, tmp_path: Path, monkeypatch):
+        """Ctrl-C should record running submissions and cancel queued ones."""
+        batch_files = _write_batch_files(tmp_path / "requests", 3)
+        state_path = tmp_path / "state.json"
+        # Two workers plus the main thread
+        started = threading.Barrier(3, timeout=5)
+        release = threading.Event()
+        submitted = []
+
+        def fake_submit(batch_file: Path) -> dict:
+            submitted.append(batch_file.name)
+            started.wait()
+            release.wait(5)
+            return _result(batch_file)
+
+        def interrupted_as_completed(futures):
+            # Both workers are busy and the third file is still queued
+            started.wait()
+            threading.Timer(0.05, release.set).start()
+            raise KeyboardInterrupt
+            yield
+
+        monkeypatch.setattr(sb, "submit_batch", fake_submit)
+        monkeypatch.setattr(sb, "as_completed", interrupted_as_completed)
+
+        with pytest.raises(SystemExit):
+            submit_batches(batch_files, init_state(), state_path, concurrency=2)
+
+        state = load_state(state_path)
+        assert sorted(submitted) == ["batch_001.jsonl", "batch_002.jsonl"]
+        assert _recorded_files(state) == ["batch_001.jsonl", "batch_002.jsonl"]
+        assert not state_path.with_suffix(".log").exists()
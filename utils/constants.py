@@ -55,9 +55,9 @@ TEAM_SUBREDDITS = [
     "nbaspurs",
 ]
 
-# Combined list for iteration (nba first, then teams alphabetically isn't
-# necessary but we put the big one first so we see progress early)
-TARGET_SUBREDDITS = [PRIMARY_SUBREDDIT] + TEAM_SUBREDDITS
+# Combined set for filtering, lowercased once at import so a case-insensitive
+# check is a single hashed lookup: subreddit.lower() in TARGET_SUBREDDITS
+TARGET_SUBREDDITS = frozenset(s.lower() for s in [PRIMARY_SUBREDDIT, *TEAM_SUBREDDITS])
 
 
 # =============================================================================
@@ -79,6 +79,21 @@ REQUIRED_FIELDS = [
     "link_id",
 ]
 
+# Fields kept from each downloaded post (r/nba post context for comments)
+POST_FIELDS = [
+    "id",
+    "title",
+    "selftext",
+    "author",
+    "author_flair_text",
+    "link_flair_text",
+    "subreddit",
+    "created_utc",
+    "score",
+    "num_comments",
+    "permalink",
+]
+
 # Body values that indicate deleted/removed content (skip these)
 INVALID_BODY_VALUES = frozenset(
     [
@@ -111,6 +126,43 @@ ARCTIC_SHIFT_REQUEST_DELAY = 0.5
 # Rate limit buffer - sleep when remaining requests drop below this
 ARCTIC_SHIFT_RATE_LIMIT_BUFFER = 10
 
+# User-Agent sent with every Arctic Shift request
+ARCTIC_SHIFT_USER_AGENT = "nba-hate-tracker/1.0"
+
+# Compressed response encodings both clients can decode without extra packages
+# (JSON pages shrink ~5-10x on the wire)
+ARCTIC_SHIFT_ACCEPT_ENCODING = "gzip, deflate"
+
+# Sync client connection pool: distinct hosts cached / connections per host
+ARCTIC_SHIFT_POOL_CONNECTIONS = 4
+ARCTIC_SHIFT_POOL_MAXSIZE = 16
+
+# Transport-level retries for transient failures (429 and 5xx)
+ARCTIC_SHIFT_MAX_RETRIES = 5
+ARCTIC_SHIFT_RETRY_BACKOFF = 0.5
+ARCTIC_SHIFT_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Upper bound of random jitter added to each backoff, and the backoff ceiling (s)
+ARCTIC_SHIFT_RETRY_JITTER = 1.0
+ARCTIC_SHIFT_RETRY_MAX_BACKOFF = 60
+
+# Max open connections in the async client's pool
+ARCTIC_SHIFT_CONNECTION_LIMIT = 8
+
+# Seconds an idle pooled connection is kept alive for reuse
+ARCTIC_SHIFT_KEEPALIVE_TIMEOUT = 60
+
+# AIMD request concurrency: additive increase per window of successes,
+# multiplicative decrease on a 429/5xx response
+ARCTIC_SHIFT_AIMD_INCREASE = 0.5
+ARCTIC_SHIFT_AIMD_DECREASE = 0.5
+
+# Subreddits downloaded concurrently (keep low - Arctic Shift is a free service)
+ARCTIC_SHIFT_MAX_CONCURRENT_SUBREDDITS = 5
+
+# Post time windows paginated concurrently by download_posts (keep low too)
+ARCTIC_SHIFT_MAX_CONCURRENT_POST_WINDOWS = 5
+
 
 
 # =============================================================================
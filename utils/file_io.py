@@ -0,0 +1,112 @@
+"""File helpers for streaming large inputs front to back."""
+
+import os
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import BinaryIO
+
+# Read buffer for sequentially streamed files (default is ~8 KiB)
+SEQUENTIAL_BUFFER_SIZE = 1024 * 1024
+
+# Bytes read per binary chunk when counting or splitting lines
+READ_CHUNK_SIZE = 1024 * 1024
+
+# posix_fadvise is POSIX-only; elsewhere files just use default readahead
+HAS_FADVISE = hasattr(os, "posix_fadvise")
+
+
+def open_sequential(path: Path) -> BinaryIO:
+    """
+    Open a file for a single front-to-back binary read.
+
+    Uses a 1 MiB read buffer so read() syscalls are rare, and on POSIX
+    advises the kernel the file will be read sequentially, which widens
+    its readahead window for cold-cache reads of large files.
+
+    Args:
+        path: Path to the file to read.
+
+    Returns:
+        Buffered binary file handle (use as a context manager).
+    """
+    # Returned open for the caller's with block, so no context manager here
+    f = open(path, "rb", buffering=SEQUENTIAL_BUFFER_SIZE)  # noqa: SIM115
+    if HAS_FADVISE:
+        try:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            f.close()
+            raise
+    return f
+
+
+def count_lines(path: Path) -> int:
+    """
+    Count the lines in a file.
+
+    Newlines are counted in READ_CHUNK_SIZE binary chunks with bytes.count,
+    which runs in C, rather than by iterating Python line objects.
+
+    Args:
+        path: Path to the file to count.
+
+    Returns:
+        Number of lines, including a last line with no trailing newline.
+    """
+    count = 0
+    last_byte = b"\n"
+    with open_sequential(path) as f:
+        for chunk in iter(lambda: f.read(READ_CHUNK_SIZE), b""):
+            count += chunk.count(b"\n")
+            last_byte = chunk[-1:]
+    # A last line without a trailing newline still counts
+    if last_byte != b"\n":
+        count += 1
+    return count
+
+
+def read_line_blocks(
+    f: BinaryIO, chunk_size: int = READ_CHUNK_SIZE
+) -> Iterator[tuple[int, list[bytes]]]:
+    """
+    Read a binary file in chunk_size blocks, split into lines.
+
+    Each block is split on newlines in C, with the partial last line carried
+    into the next block, so callers can do per-block bookkeeping (such as
+    progress updates) instead of per-line.
+
+    Args:
+        f: File opened in binary mode.
+        chunk_size: Bytes read per block.
+
+    Yields:
+        Tuples of (bytes read for this block, complete lines without their
+        trailing newline). A final line with no newline is yielded last.
+    """
+    tail = b""
+    for chunk in iter(lambda: f.read(chunk_size), b""):
+        lines = (tail + chunk).split(b"\n")
+        tail = lines.pop()
+        yield len(chunk), lines
+    if tail:
+        yield 0, [tail]
+
+
+def iter_lines(
+    f: BinaryIO, on_block: Callable[[int, int], object] | None = None
+) -> Iterator[bytes]:
+    """
+    Yield the lines of a binary file, read via read_line_blocks.
+
+    Args:
+        f: File opened in binary mode.
+        on_block: Called once per block with (bytes read, lines in block),
+            e.g. to advance a progress bar.
+
+    Yields:
+        Lines without their trailing newline.
+    """
+    for size, lines in read_line_blocks(f):
+        if on_block is not None:
+            on_block(size, len(lines))
+        yield from lines